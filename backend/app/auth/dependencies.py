@@ -65,6 +65,7 @@ HTTP STATUS CODES:
 """
 
 from typing import Optional, Dict, Any
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
@@ -83,6 +84,51 @@ from ..firebase import user_repo
 security = HTTPBearer(auto_error=False)
 
 
+# ==============================================================================
+# USER LOOKUP CACHE
+# ==============================================================================
+# Every authenticated request needs the user document, and a page load fires
+# several API calls with the same token. Keeping recently loaded users for a
+# few seconds saves one Firestore read per request.
+#
+# - Within one request FastAPI already runs each dependency once
+#   (get_admin_user reuses get_current_user's result), so this cache only
+#   needs to cover repeat requests.
+# - Keyed by user ID (from the verified token), not by the token itself, so
+#   token expiry is still checked on every request.
+# - Routes that change a user document call invalidate_cached_user() so the
+#   change (deactivation, profile edits) is seen by the next request. Other
+#   worker processes keep their copy for at most USER_CACHE_TTL seconds.
+USER_CACHE_TTL = 30  # seconds
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL)
+
+
+async def _load_user(user_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a user document, from the cache when possible.
+
+    Returns a shallow copy so a route modifying its current_user dict can't
+    change what later requests see.
+    """
+    user = _user_cache.get(user_id)
+    if user is None:
+        user = await user_repo.get_by_id(user_id)
+        if user is None:
+            return None
+        _user_cache[user_id] = user
+    return dict(user)
+
+
+def invalidate_cached_user(user_id: str) -> None:
+    """
+    Drop a user from the lookup cache.
+
+    Call after writing to a user document so the next authenticated
+    request reads the updated data.
+    """
+    _user_cache.pop(user_id, None)
+
+
 # ==============================================================================
 # REQUIRED AUTHENTICATION DEPENDENCY
 # ==============================================================================
@@ -152,9 +198,9 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Fetch user from database
+    # Fetch user (cached for a few seconds, see USER LOOKUP CACHE)
     # This ensures the user still exists (might have been deleted after token was issued)
-    user = await user_repo.get_by_id(user_id)
+    user = await _load_user(user_id)
 
     if not user:
         raise HTTPException(
@@ -225,8 +271,8 @@ async def get_current_user_optional(
     if not user_id:
         return None
 
-    # Fetch user from database
-    user = await user_repo.get_by_id(user_id)
+    # Fetch user (cached for a few seconds, see USER LOOKUP CACHE)
+    user = await _load_user(user_id)
     return user  # Can be None if user was deleted
 
 
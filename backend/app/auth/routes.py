@@ -67,7 +67,7 @@ SECURITY NOTES:
 5. Admin users can skip OTP for convenience
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Response
 from typing import Dict, Any
 import logging
 
@@ -85,6 +85,7 @@ from ..models import (
     OTPRequest, OTPVerify, OTPResponse, OTPVerifyResponse
 )
 from ..firebase import user_repo
+from ..cache import invalidate_admin_views
 
 # Setup logger for debugging
 logger = logging.getLogger(__name__)
@@ -101,7 +102,7 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 # REGISTRATION ENDPOINT
 # ==============================================================================
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserCreate) -> Dict[str, Any]:
+async def register(user_data: UserCreate) -> Response:
     """
     Register a new user account.
 
@@ -152,27 +153,32 @@ async def register(user_data: UserCreate) -> Dict[str, Any]:
         "phone": user_data.phone,
         "is_active": True,   # Account is enabled by default
         "is_admin": False,   # Regular user by default
+        "default_address_id": None,  # Set when the first address is saved
+        "order_count": 0,    # Order counters, incremented by create_order
+        "total_spent": 0.0,
     }
 
     # Save to Firestore (user_repo handles created_at/updated_at)
     user_id = await user_repo.create(user_doc)
+    invalidate_admin_views("admin:users")
 
     # Create JWT access token with user ID
     # Token is valid for 24 hours (configured in settings)
     access_token = create_access_token(data={"sub": user_id})
 
     # Return token and user info (password_hash is NOT included)
-    return {
-        "access_token": access_token,
-        "token_type": "bearer",
-        "user": {
+    token = TokenResponse(
+        access_token=access_token,
+        token_type="bearer",
+        user={
             "id": user_id,
             "email": user_doc["email"],
             "first_name": user_doc["first_name"],
             "last_name": user_doc["last_name"],
             "phone": user_doc["phone"],
-        }
-    }
+        },
+    )
+    return Response(token.to_json(), media_type="application/json", status_code=status.HTTP_201_CREATED)
 
 
 # ==============================================================================
@@ -263,7 +269,7 @@ async def pre_login(credentials: UserLogin) -> Dict[str, Any]:
 # DIRECT LOGIN ENDPOINT (Password Only - Admin)
 # ==============================================================================
 @router.post("/login", response_model=TokenResponse)
-async def login(credentials: UserLogin) -> Dict[str, Any]:
+async def login(credentials: UserLogin) -> Response:
     """
     Authenticate user and return access token (password only).
 
@@ -309,18 +315,19 @@ async def login(credentials: UserLogin) -> Dict[str, Any]:
     # Create access token
     access_token = create_access_token(data={"sub": user["id"]})
 
-    return {
-        "access_token": access_token,
-        "token_type": "bearer",
-        "user": {
+    token = TokenResponse(
+        access_token=access_token,
+        token_type="bearer",
+        user={
             "id": user["id"],
             "email": user["email"],
             "first_name": user.get("first_name", ""),
             "last_name": user.get("last_name", ""),
             "phone": user.get("phone", ""),
             "is_admin": user.get("is_admin", False),
-        }
-    }
+        },
+    )
+    return Response(token.to_json(), media_type="application/json")
 
 
 # ==============================================================================
@@ -329,7 +336,7 @@ async def login(credentials: UserLogin) -> Dict[str, Any]:
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
     current_user: Dict[str, Any] = Depends(get_current_user)
-) -> Dict[str, Any]:
+) -> Response:
     """
     Get current authenticated user's profile.
 
@@ -347,15 +354,17 @@ async def get_current_user_info(
         - is_active: Account status
         - created_at: Account creation date
     """
-    return {
-        "id": current_user["id"],
-        "email": current_user["email"],
-        "first_name": current_user.get("first_name", ""),
-        "last_name": current_user.get("last_name", ""),
-        "phone": current_user.get("phone", ""),
-        "is_active": current_user.get("is_active", True),
-        "created_at": current_user.get("created_at", ""),
-    }
+    # current_user was loaded from our own users collection - no need to validate
+    user = UserResponse.model_construct(
+        id=current_user["id"],
+        email=current_user["email"],
+        first_name=current_user.get("first_name", ""),
+        last_name=current_user.get("last_name", ""),
+        phone=current_user.get("phone", ""),
+        is_active=current_user.get("is_active", True),
+        created_at=current_user.get("created_at", ""),
+    )
+    return Response(user.to_json(), media_type="application/json")
 
 
 # ==============================================================================
@@ -390,7 +399,7 @@ async def logout(
 @router.post("/refresh", response_model=TokenResponse)
 async def refresh_token(
     current_user: Dict[str, Any] = Depends(get_current_user)
-) -> Dict[str, Any]:
+) -> Response:
     """
     Refresh access token.
 
@@ -412,17 +421,18 @@ async def refresh_token(
     # Create new token with fresh expiration
     access_token = create_access_token(data={"sub": current_user["id"]})
 
-    return {
-        "access_token": access_token,
-        "token_type": "bearer",
-        "user": {
+    token = TokenResponse(
+        access_token=access_token,
+        token_type="bearer",
+        user={
             "id": current_user["id"],
             "email": current_user["email"],
             "first_name": current_user.get("first_name", ""),
             "last_name": current_user.get("last_name", ""),
             "phone": current_user.get("phone", ""),
-        }
-    }
+        },
+    )
+    return Response(token.to_json(), media_type="application/json")
 
 
 # ==============================================================================
@@ -601,7 +611,7 @@ class OTPLoginRequest(BaseModel):
 # LOGIN WITH OTP ENDPOINT
 # ==============================================================================
 @router.post("/login-otp", response_model=TokenResponse)
-async def login_with_otp(request: OTPLoginRequest) -> Dict[str, Any]:
+async def login_with_otp(request: OTPLoginRequest) -> Response:
     """
     Login user using OTP (passwordless login).
 
@@ -660,15 +670,16 @@ async def login_with_otp(request: OTPLoginRequest) -> Dict[str, Any]:
     # Create access token
     access_token = create_access_token(data={"sub": user["id"]})
 
-    return {
-        "access_token": access_token,
-        "token_type": "bearer",
-        "user": {
+    token = TokenResponse(
+        access_token=access_token,
+        token_type="bearer",
+        user={
             "id": user["id"],
             "email": user["email"],
             "first_name": user.get("first_name", ""),
             "last_name": user.get("last_name", ""),
             "phone": user.get("phone", ""),
             "is_admin": user.get("is_admin", False),
-        }
-    }
+        },
+    )
+    return Response(token.to_json(), media_type="application/json")
@@ -0,0 +1,317 @@
+"""
+==============================================================================
+Response Cache (cache.py)
+==============================================================================
+
+PURPOSE:
+--------
+This module provides a small in-process cache for rendered API responses.
+It is used by admin list endpoints whose results change slowly but are
+expensive to build (hundreds of Firestore reads per page view).
+
+HOW IT WORKS (cache-aside):
+---------------------------
+1. The endpoint builds a key from its name and query parameters
+2. On a hit, the stored JSON bytes are returned as-is
+3. On a miss, the response is computed, stored for `ttl` seconds and returned
+4. Write endpoints call invalidate() so admins see their own changes
+
+Concurrent misses on the same key wait for a single computation instead of
+each running the Firestore queries ("single-flight").
+
+STALE-WHILE-REVALIDATE:
+-----------------------
+A cache created with stale_ttl > 0 keeps entries for ttl + stale_ttl
+seconds. An entry older than ttl is still returned immediately, and one
+background task recomputes it, so only the very first request for a key
+waits for Firestore:
+
+    age < ttl              -> fresh, returned as-is
+    ttl <= age < ttl+stale -> stale, returned + refreshed in the background
+    older                  -> gone, computed inline (a normal miss)
+
+invalidate() drops entries outright (they are not served stale), and a
+refresh that was already running when invalidate() was called discards
+its result.
+
+KEYS:
+-----
+Keys are tuples whose first element names the endpoint, e.g.
+
+    ("admin:orders", page, per_page, status, search)
+
+invalidate("admin:orders") drops every cached page of that endpoint;
+discard(key) drops a single entry (e.g. one user's cart summary).
+
+CONDITIONAL REQUESTS (ETag):
+----------------------------
+Responses that are polled often carry an ETag header. A client that sends
+it back in If-None-Match gets an empty 304 Not Modified while nothing has
+changed - no body to encode, send or parse:
+
+    etag = make_etag(cart["id"], cart["updated_at"])
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+etag_json_response() does this for pre-encoded JSON bodies, deriving the
+ETag from the bytes themselves.
+
+NOTE:
+-----
+The cache lives in the worker process. With several workers each keeps
+its own copy, so an entry can be served by another worker for up to
+`ttl + stale_ttl` seconds after an invalidation - keep both short.
+"""
+
+import asyncio
+import hashlib
+import itertools
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Tuple
+
+from cachetools import TTLCache
+from fastapi import Request, Response
+
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[Hashable, ...]
+Compute = Callable[[], Awaitable[Any]]
+
+
+class ResponseCache:
+    """
+    TTL cache of computed responses with per-key single-flight and
+    optional stale-while-revalidate.
+
+    Usage:
+        cache = ResponseCache(ttl=15, stale_ttl=60)
+        body = await cache.get_or_compute(("admin:orders", page), build_page)
+        cache.invalidate("admin:orders")
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float = 0, maxsize: int = 256):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        # Values are (fresh_until, value); the TTLCache evicts them once
+        # they are too old to be served even stale
+        self._entries: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl + stale_ttl)
+        self._locks: Dict[CacheKey, asyncio.Lock] = {}
+        # Running background refreshes (also keeps the tasks referenced)
+        self._refreshing: Dict[CacheKey, asyncio.Task] = {}
+        # One [still_valid] flag per running computation, by key. Dropping a
+        # key clears the flags of its computations only, so a result that
+        # started before a write isn't stored, while other keys' are.
+        self._computing: Dict[CacheKey, List[List[bool]]] = {}
+
+    async def get_or_compute(self, key: CacheKey, compute: Compute) -> Any:
+        """
+        Return the cached value for key, computing it on a miss.
+
+        A stale entry is returned as-is while a background task refreshes it.
+
+        Args:
+            key: Tuple key; the first element names the endpoint
+            compute: Zero-argument coroutine function producing the value
+
+        Returns:
+            The cached or freshly computed value
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            fresh_until, value = entry
+            if time.monotonic() >= fresh_until and key not in self._refreshing:
+                self._refreshing[key] = asyncio.create_task(
+                    self._background_refresh(key, compute)
+                )
+            return value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                # Another request may have filled the entry while we waited
+                entry = self._entries.get(key)
+                if entry is not None:
+                    return entry[1]
+                return await self._compute_and_store(key, compute)
+        finally:
+            if not lock.locked() and self._locks.get(key) is lock:
+                del self._locks[key]
+
+    async def _compute_and_store(self, key: CacheKey, compute: Compute) -> Any:
+        """Run compute() and cache the result unless invalidated meanwhile."""
+        valid = [True]
+        running = self._computing.setdefault(key, [])
+        running.append(valid)
+        try:
+            value = await compute()
+        finally:
+            running.remove(valid)
+            if not running:
+                del self._computing[key]
+        if valid[0]:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+        return value
+
+    def _cancel_computing(self, keys: Iterable[CacheKey]) -> None:
+        """Stop running computations of keys from storing their results."""
+        for key in list(keys):
+            for valid in self._computing.get(key, ()):
+                valid[0] = False
+
+    async def _background_refresh(self, key: CacheKey, compute: Compute) -> None:
+        """Recompute a stale entry; on failure the stale value stays cached."""
+        try:
+            await self._compute_and_store(key, compute)
+        except Exception:
+            logger.exception("Background refresh of %s failed", key[0])
+        finally:
+            self._refreshing.pop(key, None)
+
+    def invalidate(self, prefix: Hashable) -> None:
+        """Drop every entry whose key starts with prefix."""
+        self._cancel_computing(k for k in self._computing if k[0] == prefix)
+        for key in [k for k in self._entries if k[0] == prefix]:
+            self._entries.pop(key, None)
+
+    def discard(self, key: CacheKey) -> None:
+        """Drop a single entry."""
+        self._cancel_computing([key])
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._cancel_computing(self._computing)
+        self._entries.clear()
+
+
+# ==============================================================================
+# CONDITIONAL REQUESTS
+# ==============================================================================
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a strong ETag from the values a response depends on.
+
+    Args:
+        *parts: Values (or raw bytes) identifying the response version
+
+    Returns:
+        Quoted ETag, e.g. '"3f2a9c0d1e4b5a69"'
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode())
+        digest.update(b"|")
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match covers etag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [tag.strip() for tag in header.split(",")]
+    # Weak comparison (W/ prefix ignored), as RFC 9110 asks for If-None-Match
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response for a client that already has this version."""
+    return Response(
+        status_code=304,
+        headers={"ETag": etag, "Cache-Control": "private, no-cache"},
+    )
+
+
+def etag_json_response(request: Request, body: bytes) -> Response:
+    """
+    Send pre-encoded JSON with an ETag, or 304 if the client has it.
+
+    Args:
+        request: Incoming request (read for If-None-Match)
+        body: JSON bytes
+
+    Returns:
+        200 JSON response with ETag, or empty 304
+    """
+    etag = make_etag(body)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return Response(
+        body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "private, no-cache"},
+    )
+
+
+# ==============================================================================
+# SHARED CACHES
+# ==============================================================================
+
+# Admin order/user/product list pages. A little staleness is fine for the
+# dashboard, and admin writes invalidate the affected endpoint immediately.
+# Pages up to ADMIN_LIST_STALE_TTL seconds past their TTL are served while
+# a background task rebuilds them.
+ADMIN_LIST_CACHE_TTL = 15  # seconds
+ADMIN_LIST_STALE_TTL = 60  # seconds
+admin_list_cache = ResponseCache(ttl=ADMIN_LIST_CACHE_TTL, stale_ttl=ADMIN_LIST_STALE_TTL)
+
+# Admin dashboard stats (GET /admin/stats). The dashboard polls it and
+# several admins may have it open, so one result is reused for
+# STATS_CACHE_TTL seconds.
+STATS_CACHE_TTL = 20  # seconds
+admin_stats_cache: TTLCache = TTLCache(maxsize=1, ttl=STATS_CACHE_TTL)
+
+
+def invalidate_admin_views(*prefixes: str) -> None:
+    """
+    Drop the admin dashboard stats and the given admin list endpoints.
+
+    Args:
+        prefixes: admin_list_cache prefixes whose pages changed
+            ("admin:orders", "admin:users", "admin:products")
+    """
+    admin_stats_cache.clear()
+    for prefix in prefixes:
+        admin_list_cache.invalidate(prefix)
+
+# Cart badge summaries, keyed by (user_id,). Every open tab polls
+# GET /cart/summary; cart writes in this process discard the user's entry
+# (invalidate_cart_summary), other workers see the change within the TTL.
+CART_SUMMARY_CACHE_TTL = 15  # seconds
+cart_summary_cache = ResponseCache(ttl=CART_SUMMARY_CACHE_TTL, maxsize=10_000)
+
+
+def invalidate_cart_summary(user_id: str) -> None:
+    """Drop a user's cached cart summary after their cart changed."""
+    cart_summary_cache.discard((user_id,))
+
+
+# Order history pages, keyed by order_list_key(). Placing or cancelling an
+# order and admin status changes move the user to a new version
+# (invalidate_order_list), so their old pages are never read again and
+# simply expire - no scan over the cache. Other workers catch up within
+# the TTL.
+ORDER_LIST_CACHE_TTL = 30  # seconds
+order_list_cache = ResponseCache(ttl=ORDER_LIST_CACHE_TTL, maxsize=10_000)
+
+# user_id -> current version. Version numbers are never reused, so a user
+# whose version was evicted or expired just gets a fresh one (a cache
+# miss), never an old page.
+_order_list_versions: TTLCache = TTLCache(maxsize=10_000, ttl=ORDER_LIST_CACHE_TTL)
+_order_list_version_counter = itertools.count()
+
+
+def order_list_key(user_id: str, *params: Hashable) -> CacheKey:
+    """Cache key for one of a user's order history pages."""
+    version = _order_list_versions.get(user_id)
+    if version is None:
+        version = _order_list_versions[user_id] = next(_order_list_version_counter)
+    return (user_id, version, *params)
+
+
+def invalidate_order_list(user_id: str) -> None:
+    """Drop every cached order history page of a user."""
+    _order_list_versions[user_id] = next(_order_list_version_counter)
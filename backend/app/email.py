@@ -41,6 +41,17 @@ SMTP FLOW:
     4. Send email message
     5. Close connection
 
+SENDING FROM REQUESTS:
+----------------------
+The SMTP handshake takes hundreds of milliseconds, so API routes don't
+send inline. They queue the email as a FastAPI background task, which
+runs after the response has been sent, with a few retries:
+
+    background_tasks.add_task(
+        send_with_retry, email_service.send_order_confirmation,
+        to_email=email, order=order, user_name=name,
+    )
+
 HTML EMAIL DESIGN:
 ------------------
 Emails use inline CSS because:
@@ -56,9 +67,10 @@ We include plain text version as fallback for:
 
 import smtplib
 import logging
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 from datetime import datetime
 
 from .config import get_settings
@@ -616,6 +628,45 @@ Need help? Contact us at support@shopease.com
         """
 
 
+# ==============================================================================
+# BACKGROUND DELIVERY
+# ==============================================================================
+# A failed send is tried again EMAIL_MAX_ATTEMPTS times in total, waiting
+# EMAIL_RETRY_DELAY seconds and doubling the wait after every failure.
+EMAIL_MAX_ATTEMPTS = 3
+EMAIL_RETRY_DELAY = 2  # seconds
+
+
+def send_with_retry(send: Callable[..., bool], **kwargs: Any) -> bool:
+    """
+    Call an EmailService send method until it succeeds or attempts run out.
+
+    Meant for background tasks: it blocks while waiting between attempts
+    (FastAPI runs sync background tasks in its thread pool) and never
+    raises, since nobody is left to handle the error.
+
+    Args:
+        send: e.g. email_service.send_order_confirmation
+        **kwargs: Arguments for send
+
+    Returns:
+        True if the email was sent
+    """
+    delay = EMAIL_RETRY_DELAY
+    for attempt in range(1, EMAIL_MAX_ATTEMPTS + 1):
+        try:
+            if send(**kwargs):
+                return True
+        except Exception as e:
+            logger.error(f"Email attempt {attempt} raised: {e}")
+        if attempt < EMAIL_MAX_ATTEMPTS:
+            time.sleep(delay)
+            delay *= 2
+
+    logger.error(f"Giving up on email to {kwargs.get('to_email')} after {EMAIL_MAX_ATTEMPTS} attempts")
+    return False
+
+
 # ==============================================================================
 # SINGLETON INSTANCE
 # ==============================================================================
@@ -104,14 +104,22 @@ This provides:
 - Single place to add logging, caching, etc.
 """
 
+import asyncio
+import base64
+import functools
+import math
+from concurrent.futures import ThreadPoolExecutor
+
 import firebase_admin
+from cachetools import TTLCache
 from firebase_admin import credentials, firestore
 from google.cloud.firestore_v1 import FieldFilter
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Callable, TypeVar
 from datetime import datetime
 import logging
 
 from .config import get_settings
+from .models.order import OrderStatus
 
 logger = logging.getLogger(__name__)
 
@@ -121,9 +129,53 @@ logger = logging.getLogger(__name__)
 # We use a global variable to store the Firestore client instance.
 # This ensures we reuse the same connection across all requests,
 # avoiding the overhead of creating new connections.
+#
+# Every repository goes through get_db(), so the whole app shares this one
+# client and its single gRPC channel. The client library already sets
+# grpc.keepalive_time_ms=30000 on that channel, which keeps it open
+# between requests; warm_up_firestore() opens it at startup.
 _db: Optional[firestore.Client] = None
 
 
+# ==============================================================================
+# BLOCKING CALLS
+# ==============================================================================
+# The Firestore client is synchronous: get(), stream() and commit() block
+# until the RPC returns. Called straight from the async repository methods,
+# each round-trip would stall the event loop - and every other request
+# being served - for its whole duration, and asyncio.gather() over several
+# repository calls would still run them one after another.
+#
+# Repository methods therefore hand every RPC to run_blocking(), which runs
+# it on a dedicated thread pool and awaits the result. The client (and its
+# gRPC channel) is thread-safe, so the threads share it.
+FIRESTORE_MAX_THREADS = 64
+_firestore_executor = ThreadPoolExecutor(
+    max_workers=FIRESTORE_MAX_THREADS,
+    thread_name_prefix="firestore",
+)
+
+T = TypeVar("T")
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking Firestore call on the Firestore thread pool.
+
+    Example:
+        doc = await run_blocking(doc_ref.get)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _firestore_executor, functools.partial(func, *args, **kwargs)
+    )
+
+
+async def stream_docs(query) -> List[Any]:
+    """Run a query on the Firestore thread pool and return all its snapshots."""
+    return await run_blocking(lambda: list(query.stream()))
+
+
 # ==============================================================================
 # FIREBASE INITIALIZATION
 # ==============================================================================
@@ -193,6 +245,23 @@ def get_db() -> firestore.Client:
     return _db
 
 
+def warm_up_firestore() -> None:
+    """
+    Open the Firestore gRPC channel before the first request arrives.
+
+    The channel (TLS + HTTP/2 handshake, OAuth token fetch) is created
+    lazily on the first RPC. Issuing one tiny query at startup moves that
+    cost out of the first user request. Costs one document read.
+
+    Failures are logged, not raised - the first real request simply
+    retries the connection.
+    """
+    try:
+        get_db().collection(Collections.PRODUCTS).limit(1).get()
+    except Exception as e:
+        logger.warning(f"Firestore warm-up failed: {e}")
+
+
 # ==============================================================================
 # COLLECTION NAMES
 # ==============================================================================
@@ -224,9 +293,9 @@ class FirestoreRepository:
     any Firestore collection. Specialized repositories inherit from this
     and add domain-specific methods.
 
-    The async methods don't actually use async I/O (Firestore Python SDK
-    is synchronous), but we mark them async for consistency with FastAPI
-    and potential future migration to async Firestore client.
+    The Firestore Python SDK client is synchronous, so the async methods
+    run each RPC on a thread pool (run_blocking) instead of blocking the
+    event loop while it waits for Firestore.
 
     Usage:
         repo = FirestoreRepository("my_collection")
@@ -281,12 +350,12 @@ class FirestoreRepository:
 
         if doc_id:
             # Use specific document ID (useful for user IDs from auth, etc.)
-            self.collection.document(doc_id).set(data)
+            await run_blocking(self.collection.document(doc_id).set, data)
             return doc_id
         else:
             # Let Firestore generate a unique ID
             # add() returns (timestamp, document_reference)
-            doc_ref = self.collection.add(data)
+            doc_ref = await run_blocking(self.collection.add, data)
             return doc_ref[1].id
 
     async def get_by_id(self, doc_id: str) -> Optional[Dict[str, Any]]:
@@ -305,13 +374,45 @@ class FirestoreRepository:
             if user:
                 print(user["email"])
         """
-        doc = self.collection.document(doc_id).get()
+        doc = await run_blocking(self.collection.document(doc_id).get)
         if doc.exists:
             data = doc.to_dict()
             data["id"] = doc.id  # Include document ID in the data
             return data
         return None
 
+    async def get_many(self, doc_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several documents by ID in one round-trip.
+
+        Uses the client's batched get_all() instead of one get() per ID, so
+        loading N related documents (the users behind a page of orders, the
+        products in a cart) costs one request rather than N.
+
+        Args:
+            doc_ids: Document IDs to fetch (duplicates are fetched once)
+
+        Returns:
+            Dictionary mapping document ID to document data (with 'id'
+            added). IDs that don't exist are simply absent.
+
+        Example:
+            users = await user_repo.get_many(["abc123", "def456"])
+            email = users["abc123"]["email"] if "abc123" in users else None
+        """
+        unique_ids = list(dict.fromkeys(doc_id for doc_id in doc_ids if doc_id))
+        if not unique_ids:
+            return {}
+
+        refs = [self.collection.document(doc_id) for doc_id in unique_ids]
+        results = {}
+        for doc in await run_blocking(lambda: list(get_db().get_all(refs))):
+            if doc.exists:
+                data = doc.to_dict()
+                data["id"] = doc.id
+                results[doc.id] = data
+        return results
+
     async def get_all(self, limit: int = 100) -> List[Dict[str, Any]]:
         """
         Get all documents in the collection.
@@ -323,7 +424,7 @@ class FirestoreRepository:
         Returns:
             List of document dictionaries with 'id' field added
         """
-        docs = self.collection.limit(limit).stream()
+        docs = await stream_docs(self.collection.limit(limit))
         results = []
         for doc in docs:
             data = doc.to_dict()
@@ -358,9 +459,9 @@ class FirestoreRepository:
             # Get products under $50
             cheap_products = await product_repo.query("price", "<", 50)
         """
-        docs = self.collection.where(
+        docs = await stream_docs(self.collection.where(
             filter=FieldFilter(field, operator, value)
-        ).limit(limit).stream()
+        ).limit(limit))
 
         results = []
         for doc in docs:
@@ -388,10 +489,51 @@ class FirestoreRepository:
         """
         data["updated_at"] = datetime.utcnow().isoformat()
         doc_ref = self.collection.document(doc_id)
-        if doc_ref.get().exists:
-            doc_ref.update(data)
-            return True
-        return False
+
+        def _update() -> bool:
+            if doc_ref.get().exists:
+                doc_ref.update(data)
+                return True
+            return False
+
+        return await run_blocking(_update)
+
+    async def batch_update(self, updates: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        Update several documents in one round-trip using a WriteBatch.
+
+        Each (doc_id, data) pair is applied like update(), including the
+        updated_at timestamp, but all writes are sent together and applied
+        atomically. Unlike update() there is no existence pre-check: the
+        batch fails if any document is missing, so only pass IDs you have
+        just read.
+
+        Firestore allows at most 500 writes per batch; larger inputs are
+        committed in chunks of 500.
+
+        Used by the address endpoints to clear all of a user's previous
+        default addresses in one write.
+
+        Args:
+            updates: List of (document ID, fields to update) pairs
+
+        Example:
+            await address_repo.batch_update([
+                ("addr1", {"is_default": False}),
+                ("addr2", {"is_default": False}),
+            ])
+        """
+        if not updates:
+            return
+
+        db = get_db()
+        now = datetime.utcnow().isoformat()
+        for start in range(0, len(updates), 500):
+            batch = db.batch()
+            for doc_id, data in updates[start:start + 500]:
+                data["updated_at"] = now
+                batch.update(self.collection.document(doc_id), data)
+            await run_blocking(batch.commit)
 
     async def delete(self, doc_id: str) -> bool:
         """
@@ -404,10 +546,14 @@ class FirestoreRepository:
             True if document was deleted, False if it didn't exist
         """
         doc_ref = self.collection.document(doc_id)
-        if doc_ref.get().exists:
-            doc_ref.delete()
-            return True
-        return False
+
+        def _delete() -> bool:
+            if doc_ref.get().exists:
+                doc_ref.delete()
+                return True
+            return False
+
+        return await run_blocking(_delete)
 
     async def exists(self, doc_id: str) -> bool:
         """
@@ -419,7 +565,173 @@ class FirestoreRepository:
         Returns:
             True if document exists, False otherwise
         """
-        return self.collection.document(doc_id).get().exists
+        doc = await run_blocking(self.collection.document(doc_id).get)
+        return doc.exists
+
+    async def count(
+        self,
+        field: Optional[str] = None,
+        operator: str = "==",
+        value: Any = None
+    ) -> int:
+        """
+        Count documents with a server-side aggregation query.
+
+        Firestore computes the count itself and returns a single number, so
+        counting N documents no longer means downloading all N of them.
+
+        Args:
+            field: Optional field to filter on (counts the whole collection
+                   when omitted)
+            operator: Comparison operator for the filter
+            value: Value to compare against
+
+        Returns:
+            Number of matching documents
+
+        Example:
+            active_users = await user_repo.count("is_active", "==", True)
+        """
+        query = self.collection
+        if field is not None:
+            query = query.where(filter=FieldFilter(field, operator, value))
+        result = await run_blocking(query.count().get)
+        return int(result[0][0].value)
+
+    async def sum(
+        self,
+        field_to_sum: str,
+        filters: Tuple[Tuple[str, str, Any], ...] = ()
+    ) -> float:
+        """
+        Sum a numeric field with a server-side aggregation query.
+
+        Like count(), Firestore adds the values up itself and returns one
+        number instead of every matching document.
+
+        Args:
+            field_to_sum: Numeric field to add up
+            filters: (field, operator, value) filters, all of which must match
+
+        Returns:
+            Sum over the matching documents (0.0 if none match)
+
+        Example:
+            revenue = await order_repo.sum("total", (("status", "==", "delivered"),))
+        """
+        query = self.collection
+        for field, operator, value in filters:
+            query = query.where(filter=FieldFilter(field, operator, value))
+        result = await run_blocking(query.sum(field_to_sum).get)
+        return float(result[0][0].value or 0)
+
+    async def get_page(
+        self,
+        field: Optional[str] = None,
+        operator: str = "==",
+        value: Any = None,
+        order_by: str = "created_at",
+        limit: int = 20,
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get one page of documents, newest first, filtered and sorted by Firestore.
+
+        Only the requested page is downloaded. Two ways to say which page:
+        - cursor: encode_cursor() of the last document of the previous page
+          (keyset pagination - Firestore seeks straight past that
+          (order_by value, document ID) pair, so deep pages cost the same
+          as the first one)
+        - offset: number of documents to skip (page-number pagination;
+          skipped documents are not downloaded but are still billed as reads)
+
+        Documents are ordered by order_by, then by document ID, so documents
+        with equal order_by values still have a stable position.
+
+        Filtering on one field while ordering by another needs a composite
+        index (see firestore.indexes.json).
+
+        Firestore leaves out documents that lack order_by or the filter
+        field, so those fields must be on every document - API writes always
+        set them; scripts/backfill_listing_fields.py adds them to older
+        documents.
+
+        Args:
+            field: Optional field to filter on
+            operator: Comparison operator for the filter
+            value: Value to compare against
+            order_by: Field to sort by (descending)
+            limit: Page size
+            offset: Documents to skip (ignored when cursor is given)
+            cursor: Cursor to resume after
+
+        Returns:
+            List of document dictionaries with 'id' field added
+
+        Raises:
+            ValueError: cursor is malformed
+        """
+        query = self.collection
+        if field is not None:
+            query = query.where(filter=FieldFilter(field, operator, value))
+        query = query.order_by(order_by, direction=firestore.Query.DESCENDING)
+        query = query.order_by("__name__", direction=firestore.Query.DESCENDING)
+
+        if cursor:
+            # Seek by values - no read of the cursor document needed
+            last_value, last_id = decode_cursor(cursor)
+            query = query.start_after({order_by: last_value, "__name__": last_id})
+        elif offset:
+            query = query.offset(offset)
+
+        results = []
+        for doc in await stream_docs(query.limit(limit)):
+            data = doc.to_dict()
+            data["id"] = doc.id
+            results.append(data)
+        return results
+
+
+# ==============================================================================
+# PAGINATION CURSORS
+# ==============================================================================
+# A cursor is the (sort value, document ID) of the last document on a page,
+# packed into an opaque URL-safe string for clients to send back.
+
+def encode_cursor(doc: Dict[str, Any], order_by: str = "created_at") -> str:
+    """
+    Build the cursor that resumes a get_page() listing after doc.
+
+    Args:
+        doc: Last document of the page (with 'id')
+        order_by: Field the listing is sorted by
+
+    Returns:
+        Opaque cursor string
+    """
+    raw = f"{doc.get(order_by, '')}|{doc['id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    Unpack a cursor made by encode_cursor().
+
+    Returns:
+        (sort value, document ID)
+
+    Raises:
+        ValueError: cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+    except ValueError:
+        raise ValueError("Invalid cursor")
+    last_value, sep, last_id = raw.partition("|")
+    if not sep or not last_id:
+        raise ValueError("Invalid cursor")
+    return last_value, last_id
 
 
 # ==============================================================================
@@ -428,6 +740,17 @@ class FirestoreRepository:
 # These repositories extend FirestoreRepository with domain-specific methods.
 # They encapsulate the business logic for each entity type.
 
+# Admin user list status filters -> (field, value) Firestore filter.
+# A user without is_active counts as active everywhere else but is not
+# matched by is_active == True; scripts/backfill_listing_fields.py sets it.
+# Missing is_admin correctly means "not an admin".
+USER_STATUS_FILTERS = {
+    "active": ("is_active", True),
+    "inactive": ("is_active", False),
+    "admin": ("is_admin", True),
+}
+
+
 class UserRepository(FirestoreRepository):
     """
     Repository for user operations.
@@ -455,27 +778,102 @@ class UserRepository(FirestoreRepository):
         results = await self.query("email", "==", email.lower(), limit=1)
         return results[0] if results else None
 
+    async def increment_order_stats(self, user: Dict[str, Any], order_total: float) -> None:
+        """
+        Add one order to a user's order_count / total_spent counters.
+
+        The admin user list reads these counters instead of loading every
+        user's orders. Call it after the order has been saved.
+
+        A user document that already has the counters gets Firestore's
+        server-side Increment transform - no read, and concurrent orders
+        can't overwrite each other's update. A user from before the
+        counters existed must not start counting from this order, so in
+        that case a transaction seeds both counters from all of the user's
+        saved orders (the new one included).
+
+        Args:
+            user: User who placed the order (the cached copy is fine; a
+                stale one without counters only costs the transaction)
+            order_total: Order total in INR
+        """
+        user_ref = self.collection.document(user["id"])
+        if "order_count" in user and "total_spent" in user:
+            await run_blocking(user_ref.update, {
+                "order_count": firestore.Increment(1),
+                "total_spent": firestore.Increment(order_total),
+            })
+            return
+
+        db = get_db()
+        orders_query = db.collection(Collections.ORDERS).where(
+            filter=FieldFilter("user_id", "==", user["id"])
+        ).select(["total"])
+
+        @firestore.transactional
+        def _seed(transaction) -> None:
+            snapshot = user_ref.get(transaction=transaction)
+            if not snapshot.exists:
+                return
+            data = snapshot.to_dict()
+            if "order_count" in data and "total_spent" in data:
+                transaction.update(user_ref, {
+                    "order_count": data["order_count"] + 1,
+                    "total_spent": data["total_spent"] + order_total,
+                })
+                return
+            totals = [
+                float(doc.to_dict().get("total", 0))
+                for doc in orders_query.stream(transaction=transaction)
+            ]
+            transaction.update(user_ref, {
+                "order_count": len(totals),
+                "total_spent": math.fsum(totals),
+            })
+
+        await run_blocking(_seed, db.transaction())
+
     # ==========================================================================
     # ADMIN METHODS
     # ==========================================================================
 
-    async def get_all_users(self, limit: int = 500) -> List[Dict[str, Any]]:
+    async def get_all_users(
+        self,
+        status: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
         """
-        Get all users for admin dashboard.
+        Get one page of users for the admin dashboard.
 
-        Returns all users sorted by creation date (newest first).
-        Used by admin to manage user accounts.
+        Users are sorted by creation date (newest first). Filtering,
+        sorting and pagination all happen in Firestore.
 
         Args:
-            limit: Maximum users to return
+            status: Optional filter - "active", "inactive" or "admin"
+            cursor: Cursor from the previous page (see encode_cursor)
+            limit: Page size
+            offset: Users to skip when no cursor is given
 
         Returns:
-            List of all user documents
+            List of user documents for the page
         """
-        users = await self.get_all(limit=limit)
-        # Sort by created_at descending
-        users.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-        return users
+        field, value = USER_STATUS_FILTERS.get(status, (None, None))
+        return await self.get_page(
+            field, "==", value,
+            limit=limit, offset=offset, cursor=cursor
+        )
+
+    async def count_users(self, status: Optional[str] = None) -> int:
+        """
+        Count users matching an admin status filter (see get_all_users).
+
+        Returns:
+            Number of matching users
+        """
+        field, value = USER_STATUS_FILTERS.get(status, (None, None))
+        return await self.count(field, "==", value)
 
     async def get_user_count(self) -> int:
         """
@@ -486,8 +884,7 @@ class UserRepository(FirestoreRepository):
         Returns:
             Total number of users
         """
-        docs = list(self.collection.stream())
-        return len(docs)
+        return await self.count()
 
     async def get_active_user_count(self) -> int:
         """
@@ -498,8 +895,7 @@ class UserRepository(FirestoreRepository):
         Returns:
             Number of active users
         """
-        users = await self.query("is_active", "==", True, limit=10000)
-        return len(users)
+        return await self.count("is_active", "==", True)
 
     async def search_users(self, search: str, limit: int = 50) -> List[Dict[str, Any]]:
         """
@@ -533,6 +929,29 @@ class UserRepository(FirestoreRepository):
         return results
 
 
+# Product documents read for display (product page, cart enrichment and
+# add-to-cart stock checks) are reused for PRODUCT_CACHE_TTL seconds.
+# ProductRepository.update()/delete() drop the cached copy, so price, stock
+# and visibility changes made by this process show up immediately. The TTL
+# is kept short because other workers' stock changes are only seen once it
+# expires; checkout always reads stock uncached.
+PRODUCT_CACHE_TTL = 30  # seconds
+_product_cache: TTLCache = TTLCache(maxsize=5000, ttl=PRODUCT_CACHE_TTL)
+_product_locks: Dict[str, asyncio.Lock] = {}
+
+
+class InsufficientStock(Exception):
+    """
+    Raised by ProductRepository.adjust_stock(require_stock=True) when a
+    product has less stock than the requested decrement. Nothing is written.
+    """
+
+    def __init__(self, product_id: str, available: int):
+        super().__init__(f"Only {available} of product {product_id} in stock")
+        self.product_id = product_id
+        self.available = available
+
+
 class ProductRepository(FirestoreRepository):
     """
     Repository for product operations.
@@ -541,11 +960,159 @@ class ProductRepository(FirestoreRepository):
     - Category filtering
     - Search functionality
     - Featured products
+    - Cached reads for display (get_by_id_cached, get_many_cached)
     """
 
     def __init__(self):
         super().__init__(Collections.PRODUCTS)
 
+    # ==========================================================================
+    # CACHED READS
+    # ==========================================================================
+    # For display only - anything that must see exact stock (checkout,
+    # stock updates) uses the uncached get_by_id().
+
+    async def get_by_id_cached(self, product_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a product, served from the in-process cache when possible.
+
+        Concurrent misses for the same product wait on a per-product lock,
+        so only one of them reads Firestore.
+
+        Args:
+            product_id: Product document ID
+
+        Returns:
+            Product dictionary, or None if not found
+        """
+        if product_id in _product_cache:
+            return _product_cache[product_id]
+
+        lock = _product_locks.setdefault(product_id, asyncio.Lock())
+        try:
+            async with lock:
+                if product_id not in _product_cache:
+                    _product_cache[product_id] = await self.get_by_id(product_id)
+                return _product_cache.get(product_id)
+        finally:
+            if not lock.locked() and _product_locks.get(product_id) is lock:
+                del _product_locks[product_id]
+
+    async def get_many_cached(self, product_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several products, reading only the uncached ones from Firestore.
+
+        Args:
+            product_ids: Product document IDs
+
+        Returns:
+            Dictionary mapping product ID to product data (missing IDs
+            are left out)
+        """
+        products = {}
+        missing = []
+        for product_id in dict.fromkeys(product_ids):
+            if product_id in _product_cache:
+                product = _product_cache[product_id]
+                if product is not None:
+                    products[product_id] = product
+            else:
+                missing.append(product_id)
+
+        if missing:
+            fetched = await self.get_many(missing)
+            for product_id in missing:
+                # Missing products are cached as None too
+                _product_cache[product_id] = fetched.get(product_id)
+            products.update(fetched)
+
+        return products
+
+    async def update(self, doc_id: str, data: Dict[str, Any]) -> bool:
+        """Update a product and drop its cached copy."""
+        result = await super().update(doc_id, data)
+        _product_cache.pop(doc_id, None)
+        return result
+
+    async def delete(self, doc_id: str) -> bool:
+        """Delete a product and drop its cached copy."""
+        result = await super().delete(doc_id)
+        _product_cache.pop(doc_id, None)
+        return result
+
+    # ==========================================================================
+    # STOCK
+    # ==========================================================================
+
+    async def adjust_stock(
+        self,
+        changes: Dict[str, int],
+        require_stock: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Add to (or subtract from) the stock of several products atomically.
+
+        All products are read and written inside one Firestore transaction.
+        Two concurrent orders can no longer both read the same stock level
+        and overwrite each other's decrement - Firestore retries the
+        transaction that loses. Stock can't go below 0.
+
+        Args:
+            changes: product_id -> stock delta (negative to reduce)
+            require_stock: Reserve instead of clamping - if any product
+                (or a missing one) can't cover its decrement, raise
+                InsufficientStock and write nothing
+
+        Returns:
+            product_id -> new stock level, for the products that exist
+
+        Raises:
+            InsufficientStock: Only with require_stock=True
+
+        Example:
+            await product_repo.adjust_stock({"abc123": -2, "def456": -1})
+        """
+        if not changes:
+            return {}
+
+        db = get_db()
+        refs = [self.collection.document(product_id) for product_id in changes]
+
+        @firestore.transactional
+        def _adjust(transaction) -> Dict[str, int]:
+            # All reads must happen before the first write in a transaction
+            snapshots = list(db.get_all(refs, transaction=transaction))
+
+            current = {
+                snapshot.id: snapshot.to_dict().get("stock_quantity", 0)
+                for snapshot in snapshots
+                if snapshot.exists
+            }
+            if require_stock:
+                # Check everything before the first write, so a failed
+                # reservation leaves every product untouched
+                for product_id, delta in changes.items():
+                    available = current.get(product_id, 0)
+                    if available + delta < 0:
+                        raise InsufficientStock(product_id, available)
+
+            now = datetime.utcnow().isoformat()
+            new_stock = {}
+            for snapshot in snapshots:
+                if not snapshot.exists:
+                    continue
+                new_stock[snapshot.id] = max(0, current[snapshot.id] + changes[snapshot.id])
+                transaction.update(snapshot.reference, {
+                    "stock_quantity": new_stock[snapshot.id],
+                    "updated_at": now,
+                })
+            return new_stock
+
+        result = await run_blocking(_adjust, db.transaction())
+        for product_id in changes:
+            _product_cache.pop(product_id, None)
+        return result
+
     async def get_by_category(self, category: str, limit: int = 50) -> List[Dict[str, Any]]:
         """
         Get products by category.
@@ -582,11 +1149,11 @@ class ProductRepository(FirestoreRepository):
         """
         # Simple prefix search on name_lower field
         # Products must have a name_lower field (lowercase version of name)
-        docs = self.collection.where(
+        docs = await stream_docs(self.collection.where(
             filter=FieldFilter("name_lower", ">=", query.lower())
         ).where(
             filter=FieldFilter("name_lower", "<=", query.lower() + "\uf8ff")
-        ).limit(limit).stream()
+        ).limit(limit))
 
         results = []
         for doc in docs:
@@ -638,8 +1205,7 @@ class ProductRepository(FirestoreRepository):
         Returns:
             Total number of products
         """
-        docs = list(self.collection.stream())
-        return len(docs)
+        return await self.count()
 
     async def get_active_product_count(self) -> int:
         """
@@ -650,8 +1216,7 @@ class ProductRepository(FirestoreRepository):
         Returns:
             Number of active products
         """
-        products = await self.query("is_active", "==", True, limit=10000)
-        return len(products)
+        return await self.count("is_active", "==", True)
 
     async def search_products_admin(
         self,
@@ -717,6 +1282,56 @@ class CartRepository(FirestoreRepository):
         results = await self.query("user_id", "==", user_id, limit=1)
         return results[0] if results else None
 
+    async def update_items_atomic(
+        self,
+        cart_id: str,
+        mutate: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+        summarize: Callable[[List[Dict[str, Any]]], Dict[str, Any]],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read-modify-write a cart's items in a single transaction.
+
+        Two requests changing the same cart at once (e.g. "add to cart"
+        clicked in two tabs) can otherwise both read the old item list and
+        the second write silently drops the first change.
+
+        mutate() receives a copy of the stored items and returns the new
+        list; raising from it aborts the transaction without writing.
+        summarize() returns extra fields stored with the new items (the
+        cart's item_count / subtotal). Firestore re-runs both when the cart
+        changed concurrently, so they must not have side effects.
+
+        Args:
+            cart_id: Cart document ID
+            mutate: Builds the new item list from the current one
+            summarize: Fields to store alongside the new items
+
+        Returns:
+            The updated cart document, or None if the cart doesn't exist
+        """
+        cart_ref = self.collection.document(cart_id)
+
+        @firestore.transactional
+        def _update(transaction) -> Optional[Dict[str, Any]]:
+            snapshot = cart_ref.get(transaction=transaction)
+            if not snapshot.exists:
+                return None
+            cart = snapshot.to_dict()
+
+            items = mutate([dict(item) for item in cart.get("items", [])])
+            update_data = {
+                "items": items,
+                **summarize(items),
+                "updated_at": datetime.utcnow().isoformat(),
+            }
+            transaction.update(cart_ref, update_data)
+
+            cart.update(update_data)
+            cart["id"] = cart_id
+            return cart
+
+        return await run_blocking(_update, get_db().transaction())
+
     async def clear_cart(self, user_id: str) -> bool:
         """
         Clear all items from user's cart.
@@ -731,7 +1346,12 @@ class CartRepository(FirestoreRepository):
         """
         cart = await self.get_user_cart(user_id)
         if cart:
-            await self.update(cart["id"], {"items": [], "updated_at": datetime.utcnow().isoformat()})
+            await self.update(cart["id"], {
+                "items": [],
+                "item_count": 0,
+                "subtotal": 0.0,
+                "updated_at": datetime.utcnow().isoformat(),
+            })
             return True
         return False
 
@@ -750,11 +1370,11 @@ class OrderRepository(FirestoreRepository):
 
     async def get_user_orders(self, user_id: str, limit: int = 50) -> List[Dict[str, Any]]:
         """
-        Get all orders for a user, sorted by date (newest first).
+        Get a user's orders, sorted by date (newest first).
 
-        Note: We sort in Python instead of using Firestore's orderBy because
-        combining where() with orderBy() requires a composite index.
-        For small to medium order counts per user, Python sorting is fine.
+        Firestore filters and sorts, backed by the (user_id, created_at)
+        composite index, so with more than `limit` orders the newest ones
+        are returned.
 
         Args:
             user_id: User's ID
@@ -763,19 +1383,39 @@ class OrderRepository(FirestoreRepository):
         Returns:
             List of orders sorted by created_at descending
         """
-        docs = self.collection.where(
-            filter=FieldFilter("user_id", "==", user_id)
-        ).limit(limit).stream()
+        return await self.get_user_orders_page(user_id, limit=limit)
 
-        results = []
-        for doc in docs:
-            data = doc.to_dict()
-            data["id"] = doc.id
-            results.append(data)
+    async def get_user_orders_page(
+        self,
+        user_id: str,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get one page of a user's order history, newest first.
 
-        # Sort by created_at descending (newest first)
-        results.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-        return results
+        Filtering, sorting and paging happen in Firestore (see get_page),
+        so only the requested page is downloaded however many orders the
+        user has. Needs the (user_id, created_at) composite index.
+
+        Args:
+            user_id: User's ID
+            limit: Page size
+            offset: Orders to skip when no cursor is given
+            cursor: Cursor from the previous page (see encode_cursor)
+
+        Returns:
+            List of orders for the page
+        """
+        return await self.get_page(
+            "user_id", "==", user_id,
+            limit=limit, offset=offset, cursor=cursor
+        )
+
+    async def count_user_orders(self, user_id: str) -> int:
+        """Count a user's orders with a server-side aggregation query."""
+        return await self.count("user_id", "==", user_id)
 
     # ==========================================================================
     # ADMIN METHODS
@@ -784,108 +1424,92 @@ class OrderRepository(FirestoreRepository):
     async def get_all_orders(
         self,
         status: Optional[str] = None,
-        limit: int = 500
+        cursor: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0
     ) -> List[Dict[str, Any]]:
         """
-        Get all orders for admin dashboard.
+        Get one page of orders for the admin dashboard.
 
-        Optionally filter by order status. Returns orders sorted
-        by creation date (newest first).
+        Optionally filter by order status. Filtering, sorting (newest
+        first) and pagination all happen in Firestore.
 
         Args:
             status: Optional status filter (e.g., "pending", "shipped")
-            limit: Maximum orders to return
+            cursor: Cursor from the previous page (see encode_cursor)
+            limit: Page size
+            offset: Orders to skip when no cursor is given
 
         Returns:
-            List of all orders
+            List of orders for the page
         """
         if status:
-            orders = await self.query("status", "==", status, limit=limit)
-        else:
-            orders = await self.get_all(limit=limit)
-
-        # Sort by created_at descending
-        orders.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-        return orders
-
-    async def get_order_count(self) -> int:
-        """
-        Get total count of all orders.
-
-        Used for admin dashboard statistics.
-
-        Returns:
-            Total number of orders
-        """
-        docs = list(self.collection.stream())
-        return len(docs)
-
-    async def get_order_count_by_status(self) -> Dict[str, int]:
-        """
-        Get order count grouped by status.
+            return await self.get_page(
+                "status", "==", status,
+                limit=limit, offset=offset, cursor=cursor
+            )
+        return await self.get_page(limit=limit, offset=offset, cursor=cursor)
 
-        Used for admin dashboard to show order distribution.
-
-        Returns:
-            Dictionary mapping status to count, e.g.:
-            {"pending": 5, "shipped": 10, "delivered": 20}
+    async def get_order_count(self, status: Optional[str] = None) -> int:
         """
-        all_orders = await self.get_all(limit=10000)
+        Get total count of all orders, or of orders with one status.
 
-        status_counts = {}
-        for order in all_orders:
-            status = order.get("status", "unknown")
-            status_counts[status] = status_counts.get(status, 0) + 1
-
-        return status_counts
-
-    async def get_total_revenue(self) -> float:
-        """
-        Calculate total revenue from completed orders.
+        Used for admin dashboard statistics and order list totals.
 
-        Only counts orders with status "delivered" or payment_status "paid".
-        Used for admin dashboard revenue statistic.
+        Args:
+            status: Optional status filter
 
         Returns:
-            Total revenue in INR
+            Number of matching orders
         """
-        all_orders = await self.get_all(limit=10000)
-
-        total = 0.0
-        for order in all_orders:
-            # Count revenue from delivered orders or paid orders
-            status = order.get("status", "")
-            payment_status = order.get("payment_status", "")
-
-            if status == "delivered" or payment_status == "paid":
-                total += float(order.get("total", 0))
-
-        return total
+        if status:
+            return await self.count("status", "==", status)
+        return await self.count()
 
-    async def get_recent_orders_count(self, days: int = 7) -> int:
+    async def get_order_stats(self, days: int = 7) -> Dict[str, Any]:
         """
-        Get count of orders placed in the last N days.
+        Compute the order-based dashboard figures with aggregation queries.
 
-        Used for admin dashboard to show recent activity.
+        No order documents are downloaded: every figure is a server-side
+        count() or sum(), billed at one read per 1000 index entries and
+        exact however many orders exist. The queries run concurrently.
+        - orders_by_status: count() per OrderStatus (statuses without
+          orders are left out)
+        - recent_orders: count() of orders created in the last `days` days
+        - total_revenue: total of orders that are delivered or paid, as
+          sum(delivered) + sum(paid) - sum(delivered AND paid)
 
         Args:
-            days: Number of days to look back (default 7)
+            days: Number of days counted as "recent" (default 7)
 
         Returns:
-            Number of orders in the specified period
+            Dictionary with total_revenue, orders_by_status and
+            recent_orders
         """
         from datetime import timedelta
 
-        all_orders = await self.get_all(limit=10000)
         cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
-
-        count = 0
-        for order in all_orders:
-            created_at = order.get("created_at", "")
-            if created_at >= cutoff:
-                count += 1
-
-        return count
+        statuses = [order_status.value for order_status in OrderStatus]
+        delivered = ("status", "==", OrderStatus.DELIVERED.value)
+        paid = ("payment_status", "==", "paid")
+
+        *status_counts, recent, delivered_total, paid_total, both_total = await asyncio.gather(
+            *(self.count("status", "==", order_status) for order_status in statuses),
+            self.count("created_at", ">=", cutoff),
+            self.sum("total", (delivered,)),
+            self.sum("total", (paid,)),
+            self.sum("total", (delivered, paid)),
+        )
+
+        return {
+            "total_revenue": delivered_total + paid_total - both_total,
+            "orders_by_status": {
+                order_status: count
+                for order_status, count in zip(statuses, status_counts)
+                if count
+            },
+            "recent_orders": recent,
+        }
 
     async def search_orders(
         self,
@@ -948,23 +1572,48 @@ class AddressRepository(FirestoreRepository):
         """
         return await self.query("user_id", "==", user_id)
 
-    async def get_default_address(self, user_id: str) -> Optional[Dict[str, Any]]:
+    async def user_has_any_address(self, user_id: str) -> bool:
         """
-        Get user's default address for checkout.
+        Check whether a user has saved at least one address.
 
-        Uses compound query (user_id AND is_default).
+        Fetches at most one document (limit 1), so the cost doesn't grow
+        with the number of addresses the user has.
 
         Args:
             user_id: User's ID
 
         Returns:
-            Default address or None if no default is set
+            True if the user has any address, False otherwise
         """
-        docs = self.collection.where(
+        docs = await run_blocking(self.collection.where(
+            filter=FieldFilter("user_id", "==", user_id)
+        ).limit(1).get)
+        return len(docs) > 0
+
+    def _defaults_query(self, user_id: str):
+        """
+        Query for a user's default address(es): user_id AND is_default,
+        backed by the (user_id, is_default) index in firestore.indexes.json.
+        """
+        return self.collection.where(
             filter=FieldFilter("user_id", "==", user_id)
         ).where(
             filter=FieldFilter("is_default", "==", True)
-        ).limit(1).stream()
+        )
+
+    async def get_default_address(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get user's default address for checkout.
+
+        Uses the compound defaults query limited to one document.
+
+        Args:
+            user_id: User's ID
+
+        Returns:
+            Default address or None if no default is set
+        """
+        docs = await stream_docs(self._defaults_query(user_id).limit(1))
 
         for doc in docs:
             data = doc.to_dict()
@@ -972,6 +1621,79 @@ class AddressRepository(FirestoreRepository):
             return data
         return None
 
+    async def get_default_addresses(self, user_id: str) -> List[Dict[str, Any]]:
+        """
+        Get every address of a user that is marked default.
+
+        Normally there is at most one, but data written before defaults
+        were kept consistent can have several. The address write endpoints
+        use this to clear all of them, not just the first.
+
+        Args:
+            user_id: User's ID
+
+        Returns:
+            List of default addresses (usually 0 or 1)
+        """
+        results = []
+        for doc in await stream_docs(self._defaults_query(user_id)):
+            data = doc.to_dict()
+            data["id"] = doc.id
+            results.append(data)
+        return results
+
+    async def set_default_atomic(
+        self,
+        user_id: str,
+        address_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Make an address the user's only default, in a single transaction.
+
+        Inside one Firestore transaction this:
+        1. Reads the target address and checks it belongs to user_id
+        2. Reads the user's current default(s) (user_id AND is_default)
+        3. Clears is_default on every other default and sets it on the target
+        4. Points the user document's default_address_id at the target
+
+        Two concurrent calls can no longer both succeed and leave two
+        defaults behind - Firestore retries the transaction that loses.
+
+        Args:
+            user_id: Owner's user ID
+            address_id: Address to make default
+
+        Returns:
+            The updated address, or None if it doesn't exist or belongs
+            to another user
+        """
+        target_ref = self.collection.document(address_id)
+        user_ref = get_db().collection(Collections.USERS).document(user_id)
+        defaults_query = self._defaults_query(user_id)
+
+        @firestore.transactional
+        def _set_default(transaction) -> Optional[Dict[str, Any]]:
+            # All reads must happen before the first write in a transaction
+            snapshot = target_ref.get(transaction=transaction)
+            if not snapshot.exists:
+                return None
+            data = snapshot.to_dict()
+            if data.get("user_id") != user_id:
+                return None
+            current_defaults = list(defaults_query.stream(transaction=transaction))
+
+            now = datetime.utcnow().isoformat()
+            for doc in current_defaults:
+                if doc.id != address_id:
+                    transaction.update(doc.reference, {"is_default": False, "updated_at": now})
+            transaction.update(target_ref, {"is_default": True, "updated_at": now})
+            transaction.update(user_ref, {"default_address_id": address_id, "updated_at": now})
+
+            data.update(id=address_id, is_default=True, updated_at=now)
+            return data
+
+        return await run_blocking(_set_default, get_db().transaction())
+
 
 # ==============================================================================
 # REPOSITORY SINGLETONS
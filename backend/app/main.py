@@ -49,14 +49,14 @@ ARCHITECTURE OVERVIEW:
 
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 import logging
 import os
 
 from .config import get_settings
-from .firebase import init_firebase
+from .firebase import init_firebase, warm_up_firestore
 
 # ==============================================================================
 # ROUTER IMPORTS
@@ -103,6 +103,7 @@ async def lifespan(app: FastAPI):
 
     Startup tasks:
     - Initialize Firebase connection (required for all database operations)
+    - Warm up the Firestore channel so the first request doesn't pay for it
     - Log configuration mode (DEBUG or PRODUCTION)
 
     Shutdown tasks:
@@ -123,6 +124,8 @@ async def lifespan(app: FastAPI):
     try:
         init_firebase()
         logger.info("Firebase initialized successfully")
+        # Open the gRPC channel now rather than on the first request
+        warm_up_firestore()
     except Exception as e:
         logger.error(f"Failed to initialize Firebase: {e}")
         # In DEBUG mode, continue without Firebase (for testing)
@@ -171,6 +174,10 @@ app = FastAPI(
 
     # Attach lifespan handler for startup/shutdown
     lifespan=lifespan,
+
+    # Encode responses with orjson (C implementation, several times faster
+    # than the stdlib json module FastAPI uses by default)
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -215,7 +222,7 @@ async def global_exception_handler(request: Request, exc: Exception):
     In DEBUG mode, you might want to show more details.
     """
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "An internal server error occurred"}
     )
@@ -318,6 +325,11 @@ async def root():
 #   python -m app.main
 #
 # In production, use: uvicorn app.main:app --host 0.0.0.0 --port 8000
+#
+# uvicorn[standard] installs uvloop and httptools. With loop/http left on
+# "auto" (the default for the CLI and gunicorn's UvicornWorker too) every
+# server process runs on uvloop's event loop - a faster drop-in for asyncio
+# - and falls back to plain asyncio where uvloop isn't available (Windows).
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -325,4 +337,6 @@ if __name__ == "__main__":
         host=settings.HOST,        # Bind address (0.0.0.0 for all interfaces)
         port=settings.PORT,        # Port number (default 8000)
         reload=settings.DEBUG,     # Auto-reload on code changes (development only)
+        loop="auto",               # uvloop when installed (Linux/macOS), else asyncio
+        http="auto",               # httptools parser when installed, else h11
     )
@@ -32,8 +32,8 @@ MODEL CATEGORIES:
    - TokenResponse: Authentication token
    - OTP models: For email verification
 
-2. **Product Models** (product.py)
-   - ProductCreate/Update: Admin CRUD operations
+2. **Product Models** (product.py, product_admin.py)
+   - ProductCreate/Update: Admin CRUD operations (product_admin.py)
    - ProductResponse: Product details for display
    - CategoryResponse: Product categories
 
@@ -91,11 +91,13 @@ from .user import (
 # =============================================================================
 # Models for product catalog and categories
 from .product import (
-    ProductCreate,       # Create product (admin)
-    ProductUpdate,       # Update product (admin)
     ProductResponse,     # Product details for display
     CategoryResponse,    # Category information
 )
+from .product_admin import (
+    ProductCreate,       # Create product (admin)
+    ProductUpdate,       # Update product (admin)
+)
 
 # =============================================================================
 # CART MODELS
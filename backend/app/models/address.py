@@ -64,6 +64,21 @@ from pydantic import BaseModel, Field, field_validator
 from typing import Optional
 import re
 
+from .base import RESPONSE_MODEL_CONFIG, FastJSONModel
+
+
+# ==============================================================================
+# PRECOMPILED PATTERNS
+# ==============================================================================
+# Compiled once at import so validators don't go through re's pattern cache
+# (hash + dict lookup) on every call. Same phone handling as models/user.py.
+_PHONE_FMT = re.compile(r"^\+?\d{10,15}$")
+_PINCODE_FMT = re.compile(r"^\d{5,10}$")
+
+# Separators removed from phone numbers. str.translate() deletes them in a
+# single C loop, without going through the regex engine.
+_PHONE_SEPARATORS = str.maketrans("", "", " \t\n\r\f\v-")
+
 
 # ==============================================================================
 # ADDRESS CREATE MODEL
@@ -181,8 +196,8 @@ class AddressCreate(BaseModel):
         Raises:
             ValueError: If format is invalid
         """
-        cleaned = re.sub(r"[\s\-]", "", v)
-        if not re.match(r"^\+?[\d]{10,15}$", cleaned):
+        cleaned = v.translate(_PHONE_SEPARATORS)
+        if not _PHONE_FMT.match(cleaned):
             raise ValueError("Invalid phone number format")
         return cleaned
 
@@ -205,7 +220,7 @@ class AddressCreate(BaseModel):
             ValueError: If format is invalid
         """
         cleaned = v.strip()
-        if not re.match(r"^[\d]{5,10}$", cleaned):
+        if not _PINCODE_FMT.match(cleaned):
             raise ValueError("Invalid pincode format")
         return cleaned
 
@@ -270,8 +285,8 @@ class AddressUpdate(BaseModel):
         """Validate phone if provided (same logic as AddressCreate)."""
         if v is None:
             return v
-        cleaned = re.sub(r"[\s\-]", "", v)
-        if not re.match(r"^\+?[\d]{10,15}$", cleaned):
+        cleaned = v.translate(_PHONE_SEPARATORS)
+        if not _PHONE_FMT.match(cleaned):
             raise ValueError("Invalid phone number format")
         return cleaned
 
@@ -282,7 +297,7 @@ class AddressUpdate(BaseModel):
         if v is None:
             return v
         cleaned = v.strip()
-        if not re.match(r"^[\d]{5,10}$", cleaned):
+        if not _PINCODE_FMT.match(cleaned):
             raise ValueError("Invalid pincode format")
         return cleaned
 
@@ -290,7 +305,7 @@ class AddressUpdate(BaseModel):
 # ==============================================================================
 # ADDRESS RESPONSE MODEL
 # ==============================================================================
-class AddressResponse(BaseModel):
+class AddressResponse(FastJSONModel):
     """
     Model for address response.
 
@@ -316,6 +331,8 @@ class AddressResponse(BaseModel):
         }
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     # Identification
     id: str = Field(..., description="Address ID (Firestore document ID)")
     user_id: str = Field(..., description="Owner user ID")
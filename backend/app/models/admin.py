@@ -37,6 +37,7 @@ from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
+from .base import RESPONSE_MODEL_CONFIG, FastJSONModel
 from .order import OrderStatus, PaymentStatus, PaymentMethod
 
 
@@ -80,6 +81,9 @@ class AdminStatsResponse(BaseModel):
             "recent_orders": 12
         }
     """
+
+    model_config = RESPONSE_MODEL_CONFIG
+
     total_products: int = Field(..., description="Total number of products")
     active_products: int = Field(..., description="Active products count")
     total_orders: int = Field(..., description="Total number of orders")
@@ -111,6 +115,9 @@ class AdminOrderUser(BaseModel):
         last_name: Customer's last name
         phone: Customer's phone number (optional)
     """
+
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: str = Field(..., description="User ID")
     email: str = Field(..., description="Customer email")
     first_name: str = Field(..., description="Customer first name")
@@ -132,6 +139,9 @@ class AdminOrderItem(BaseModel):
         quantity: Number of units ordered
         subtotal: price * quantity (INR)
     """
+
+    model_config = RESPONSE_MODEL_CONFIG
+
     product_id: str = Field(..., description="Product ID")
     product_name: str = Field(..., description="Product name")
     product_image: Optional[str] = Field(None, description="Product image URL")
@@ -174,6 +184,9 @@ class AdminOrderResponse(BaseModel):
             "total": 2999.00
         }
     """
+
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: str = Field(..., description="Order ID")
     order_number: str = Field(..., description="Order number")
     user: Optional[AdminOrderUser] = Field(None, description="Customer info")
@@ -191,22 +204,27 @@ class AdminOrderResponse(BaseModel):
     updated_at: Optional[str] = Field(None, description="Last update time")
 
 
-class AdminOrderListResponse(BaseModel):
+class AdminOrderListResponse(FastJSONModel):
     """
     Paginated list of orders for admin view.
 
     Attributes:
         orders: List of order summaries
         total: Total number of orders matching query
-        page: Current page number
+        page: Current page number (None for pages fetched by cursor)
         per_page: Items per page
         has_more: Whether more pages exist
+        next_cursor: Cursor for the next page (None on the last page)
     """
+
+    model_config = RESPONSE_MODEL_CONFIG
+
     orders: List[AdminOrderResponse] = Field(default_factory=list)
     total: int = Field(0, description="Total order count")
-    page: int = Field(1, description="Current page")
+    page: Optional[int] = Field(1, description="Current page (null when paged by cursor)")
     per_page: int = Field(20, description="Items per page")
     has_more: bool = Field(False, description="More pages available")
+    next_cursor: Optional[str] = Field(None, description="Pass as cursor to get the next page")
 
 
 class OrderStatusUpdate(BaseModel):
@@ -273,6 +291,9 @@ class AdminUserResponse(BaseModel):
             "total_spent": 15000.00
         }
     """
+
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: str = Field(..., description="User ID")
     email: str = Field(..., description="User email")
     first_name: str = Field("", description="First name")
@@ -286,22 +307,27 @@ class AdminUserResponse(BaseModel):
     last_login: Optional[str] = Field(None, description="Last login time")
 
 
-class AdminUserListResponse(BaseModel):
+class AdminUserListResponse(FastJSONModel):
     """
     Paginated list of users for admin view.
 
     Attributes:
         users: List of user profiles
         total: Total number of users matching query
-        page: Current page number
+        page: Current page number (None for pages fetched by cursor)
         per_page: Items per page
         has_more: Whether more pages exist
+        next_cursor: Cursor for the next page (None on the last page)
     """
+
+    model_config = RESPONSE_MODEL_CONFIG
+
     users: List[AdminUserResponse] = Field(default_factory=list)
     total: int = Field(0, description="Total user count")
-    page: int = Field(1, description="Current page")
+    page: Optional[int] = Field(1, description="Current page (null when paged by cursor)")
     per_page: int = Field(20, description="Items per page")
     has_more: bool = Field(False, description="More pages available")
+    next_cursor: Optional[str] = Field(None, description="Pass as cursor to get the next page")
 
 
 class UserStatusUpdate(BaseModel):
@@ -338,6 +364,9 @@ class ProductToggleResponse(BaseModel):
         is_active: New active status
         message: Confirmation message
     """
+
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: str = Field(..., description="Product ID")
     is_active: bool = Field(..., description="New active status")
     message: str = Field(..., description="Status message")
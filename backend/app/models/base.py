@@ -0,0 +1,64 @@
+"""
+==============================================================================
+Shared Model Configuration (base.py)
+==============================================================================
+
+PURPOSE:
+--------
+Pydantic settings shared by the *Response models in this package.
+
+Response models only ever carry data the API produced itself (Firestore
+documents shaped by the route helpers), so they don't need the defensive
+behaviour request models need. Keeping the config in one place means every
+response model gets the same read-path treatment.
+
+USAGE:
+------
+    from .base import RESPONSE_MODEL_CONFIG
+
+    class OrderResponse(BaseModel):
+        model_config = RESPONSE_MODEL_CONFIG
+        ...
+
+FastJSONModel adds to_json() for response models that routes serialize
+directly instead of handing them back to FastAPI.
+"""
+
+from pydantic import BaseModel, ConfigDict
+
+
+# ==============================================================================
+# RESPONSE MODEL CONFIG
+# ==============================================================================
+# - validate_assignment=False: no re-validation when an attribute is set
+# - extra="ignore": unknown Firestore fields are silently dropped
+# - frozen=True: instances are immutable, so they are safe to cache and share
+# - populate_by_name=True: build instances by field name even if aliases exist
+# - str_strip_whitespace=False: stored strings are returned untouched
+RESPONSE_MODEL_CONFIG = ConfigDict(
+    validate_assignment=False,
+    extra="ignore",
+    frozen=True,
+    populate_by_name=True,
+    str_strip_whitespace=False,
+)
+
+
+# ==============================================================================
+# DIRECT-TO-JSON BASE MODEL
+# ==============================================================================
+class FastJSONModel(BaseModel):
+    """
+    Base for hot-path response models that routes serialize themselves.
+
+    Returning a dict (or model) from a route makes FastAPI validate it against
+    response_model, convert it back to plain Python objects, and only then
+    json.dumps() the result. to_json() instead lets pydantic-core write the
+    JSON bytes directly in one pass, so routes can do:
+
+        return Response(model.to_json(), media_type="application/json")
+    """
+
+    def to_json(self) -> bytes:
+        """Serialize this instance straight to UTF-8 JSON bytes."""
+        return self.__pydantic_serializer__.to_json(self)
@@ -52,6 +52,8 @@ When displaying cart:
 from pydantic import BaseModel, Field
 from typing import List, Optional
 
+from .base import RESPONSE_MODEL_CONFIG
+
 
 # ==============================================================================
 # CART ITEM ADD MODEL
@@ -132,6 +134,8 @@ class CartItemResponse(BaseModel):
         }
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     # Product identification
     product_id: str = Field(..., description="Product ID")
     product_name: str = Field(..., description="Product name for display")
@@ -189,6 +193,8 @@ class CartResponse(BaseModel):
     JSON floats for display purposes).
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     # Cart identification
     id: str = Field(..., description="Cart ID (Firestore document ID)")
     user_id: str = Field(..., description="Owner user ID")
@@ -241,6 +247,8 @@ class CartSummary(BaseModel):
         }
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     item_count: int = Field(
         0,
         description="Total number of items in cart"
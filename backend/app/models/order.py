@@ -49,9 +49,11 @@ Example: SE-20240115-0042
 """
 
 from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional
+from typing import Any, Dict, List, Literal, Optional
 from enum import Enum
 
+from .base import RESPONSE_MODEL_CONFIG, FastJSONModel
+
 
 # ==============================================================================
 # ENUMERATIONS
@@ -106,6 +108,11 @@ class PaymentStatus(str, Enum):
 # ==============================================================================
 # PAYMENT INFO MODEL
 # ==============================================================================
+# Card brands the checkout page can detect. A Literal turns validation into a
+# simple membership check and keeps arbitrary free text out of order documents.
+# "Unknown" is what checkout.html sends when the card prefix isn't recognised.
+CardBrand = Literal["Visa", "Mastercard", "RuPay", "Amex", "Diners", "Unknown"]
+
 class PaymentInfo(BaseModel):
     """
     Model for payment information.
@@ -142,9 +149,9 @@ class PaymentInfo(BaseModel):
         max_length=4,
         description="Last 4 digits of card (for reference only)"
     )
-    card_brand: Optional[str] = Field(
+    card_brand: Optional[CardBrand] = Field(
         None,
-        description="Card brand (Visa, Mastercard, RuPay, etc.)"
+        description="Card brand (Visa, Mastercard, RuPay, Amex, Diners or Unknown)"
     )
 
     # UPI details
@@ -206,6 +213,8 @@ class OrderItemResponse(BaseModel):
         }
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     product_id: str = Field(..., description="Product ID")
     product_name: str = Field(
         ...,
@@ -248,6 +257,8 @@ class ShippingAddress(BaseModel):
         }
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     full_name: str
     phone: str
     address_line1: str
@@ -328,6 +339,8 @@ class OrderResponse(BaseModel):
         }
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     # Order identification
     id: str = Field(..., description="Order ID (Firestore document ID)")
     order_number: str = Field(
@@ -388,7 +401,7 @@ class OrderResponse(BaseModel):
 # ==============================================================================
 # ORDER LIST RESPONSE (Paginated)
 # ==============================================================================
-class OrderListResponse(BaseModel):
+class OrderListResponse(FastJSONModel):
     """
     Model for paginated order list.
 
@@ -399,14 +412,62 @@ class OrderListResponse(BaseModel):
             "orders": [...],
             "total": 15,
             "page": 1,
-            "per_page": 10
+            "per_page": 10,
+            "has_more": true,
+            "next_cursor": "MjAyNC0wMS0wMVQxMDowMDowMHxvcmRlcjEyMw=="
         }
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     orders: List[OrderResponse] = Field(..., description="Orders on page")
     total: int = Field(..., description="Total orders for user")
     page: int = Field(1, description="Current page number")
     per_page: int = Field(10, description="Orders per page")
+    has_more: bool = Field(False, description="More pages available")
+    next_cursor: Optional[str] = Field(None, description="Pass as cursor to get the next page")
+
+    @classmethod
+    def from_firestore_page(
+        cls,
+        docs: List[Dict[str, Any]],
+        page: int,
+        per_page: int,
+        total: int,
+        has_more: bool = False,
+        next_cursor: Optional[str] = None,
+    ) -> "OrderListResponse":
+        """
+        Build a page of orders WITHOUT running validators.
+
+        Order documents are written exclusively by our own order endpoints,
+        so their shape is already trusted. model_construct() just assigns
+        attributes, which skips the per-field validation of every nested
+        item and address on the order-history hot path.
+
+        Args:
+            docs: Order dicts already shaped by format_order_response()
+            page: Current page number
+            per_page: Orders per page
+            total: Total orders for the user
+            has_more: Whether more pages exist
+            next_cursor: Cursor for the next page
+
+        Returns:
+            OrderListResponse built without validation
+        """
+        orders = [
+            OrderResponse.model_construct(
+                items=[OrderItemResponse.model_construct(**i) for i in d["items"]],
+                shipping_address=ShippingAddress.model_construct(**d["shipping_address"]),
+                **{k: v for k, v in d.items() if k not in ("items", "shipping_address")},
+            )
+            for d in docs
+        ]
+        return cls.model_construct(
+            orders=orders, total=total, page=page, per_page=per_page,
+            has_more=has_more, next_cursor=next_cursor,
+        )
 
 
 # ==============================================================================
@@ -431,6 +492,8 @@ class PaymentConfirmation(BaseModel):
         }
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     success: bool = Field(..., description="Whether payment succeeded")
     order_id: str = Field(..., description="Order ID")
     order_number: str = Field(..., description="Order number for display")
@@ -6,9 +6,12 @@ Product Models (product.py)
 PURPOSE:
 --------
 This module defines Pydantic models for product-related operations:
-- Product creation and updates (admin)
 - Product listings and details
 - Category management
+- Shared product field types
+
+The admin write models (ProductCreate, ProductUpdate) live in
+product_admin.py so the customer-facing read path never imports them.
 
 E-COMMERCE PRODUCT DATA:
 ------------------------
@@ -45,154 +48,61 @@ STOCK MANAGEMENT:
 - Frontend uses in_stock for quick UI decisions
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, computed_field
+from typing import Annotated, Dict, Optional, List, Union
+from typing_extensions import TypedDict
+
+from .base import FastJSONModel
 
 
 # ==============================================================================
-# PRODUCT CREATE MODEL (Admin)
+# CONSTRAINED STRING TYPES
 # ==============================================================================
-class ProductCreate(BaseModel):
-    """
-    Model for creating a new product (admin only).
-
-    Used by admin panel to add new products to the catalog.
-    Contains all product attributes that can be set at creation.
-
-    Example JSON:
-        {
-            "name": "iPhone 15 Pro",
-            "description": "Latest Apple smartphone with titanium design...",
-            "price": 129900,
-            "original_price": 149900,
-            "category": "Electronics",
-            "brand": "Apple",
-            "stock_quantity": 50,
-            "images": ["https://..."],
-            "is_featured": true
-        }
-    """
-
-    # Basic product information
-    name: str = Field(
-        ...,
-        min_length=1,
-        max_length=200,
-        description="Product name"
-    )
-    description: str = Field(
-        ...,
-        max_length=5000,
-        description="Product description (supports markdown/HTML)"
-    )
-
-    # Pricing
-    price: float = Field(
-        ...,
-        gt=0,  # Greater than 0 (no free or negative prices)
-        description="Current selling price in INR"
-    )
-    original_price: Optional[float] = Field(
-        None,
-        gt=0,
-        description="Original price before discount (for strikethrough display)"
-    )
-
-    # Classification
-    category: str = Field(
-        ...,
-        min_length=1,
-        max_length=100,
-        description="Product category (e.g., 'Electronics', 'Clothing')"
-    )
-    brand: Optional[str] = Field(
-        None,
-        max_length=100,
-        description="Brand name"
-    )
-
-    # Inventory
-    sku: Optional[str] = Field(
-        None,
-        max_length=50,
-        description="Stock Keeping Unit for inventory tracking"
-    )
-    stock_quantity: int = Field(
-        0,
-        ge=0,  # Greater than or equal to 0
-        description="Available stock count"
-    )
-
-    # Media
-    images: List[str] = Field(
-        default_factory=list,
-        description="List of product image URLs"
-    )
-    thumbnail: Optional[str] = Field(
-        None,
-        description="Thumbnail image URL for listings"
-    )
-
-    # Additional details
-    specifications: Optional[dict] = Field(
-        None,
-        description="Key-value pairs for product specs (RAM, storage, etc.)"
-    )
-
-    # Display flags
-    is_active: bool = Field(
-        True,
-        description="Whether product is visible in catalog"
-    )
-    is_featured: bool = Field(
-        False,
-        description="Whether product appears in featured section"
-    )
-
-    # Search and filtering
-    tags: List[str] = Field(
-        default_factory=list,
-        description="Tags for search and filtering"
-    )
+# Reusable string types for product fields, so each length limit is defined
+# in one place for both ProductCreate and ProductUpdate (product_admin.py).
+ProductName = Annotated[str, StringConstraints(min_length=1, max_length=200)]
+ProductDescription = Annotated[str, StringConstraints(max_length=5000)]
+CategoryName = Annotated[str, StringConstraints(min_length=1, max_length=100)]
+BrandName = Annotated[str, StringConstraints(max_length=100)]
+Sku = Annotated[str, StringConstraints(max_length=50)]
+
+# Specification values ("RAM": "8GB", "Warranty": "1 Year", ...). Typed keys
+# and scalar values give pydantic-core a tight typed loop instead of the
+# untyped `dict` validator. Seed data only uses strings; the scalar union
+# keeps numeric/boolean specs entered by admins valid.
+SpecValue = Union[str, int, float, bool]
+Specifications = Dict[str, SpecValue]
 
 
 # ==============================================================================
-# PRODUCT UPDATE MODEL (Admin)
+# DERIVED VALUES
 # ==============================================================================
-class ProductUpdate(BaseModel):
+def calculate_discount(price: float, original_price: Optional[float]) -> Optional[int]:
     """
-    Model for updating a product.
+    Calculate discount percentage from original and current price.
 
-    All fields are optional - only provided fields are updated.
-    This allows partial updates without resending all data.
+    Formula: ((original - current) / original) * 100, truncated to integer
 
-    Example JSON (updating just price and stock):
-        {
-            "price": 119900,
-            "stock_quantity": 45
-        }
-    """
+    Args:
+        price: Current selling price
+        original_price: Original price before discount
 
-    name: Optional[str] = Field(None, min_length=1, max_length=200)
-    description: Optional[str] = Field(None, max_length=5000)
-    price: Optional[float] = Field(None, gt=0)
-    original_price: Optional[float] = Field(None, gt=0)
-    category: Optional[str] = Field(None, min_length=1, max_length=100)
-    brand: Optional[str] = Field(None, max_length=100)
-    sku: Optional[str] = Field(None, max_length=50)
-    stock_quantity: Optional[int] = Field(None, ge=0)
-    images: Optional[List[str]] = None
-    thumbnail: Optional[str] = None
-    specifications: Optional[dict] = None
-    is_active: Optional[bool] = None
-    is_featured: Optional[bool] = None
-    tags: Optional[List[str]] = None
+    Returns:
+        Discount percentage (0-100) or None if no discount
+
+    Example:
+        calculate_discount(800, 1000) -> 20  (20% off)
+        calculate_discount(1000, 1000) -> None (no discount)
+    """
+    if original_price and original_price > price:
+        return int(((original_price - price) / original_price) * 100)
+    return None
 
 
 # ==============================================================================
 # PRODUCT RESPONSE MODEL
 # ==============================================================================
-class ProductResponse(BaseModel):
+class ProductResponse(FastJSONModel):
     """
     Model for product response.
 
@@ -212,6 +122,8 @@ class ProductResponse(BaseModel):
         }
     """
 
+    model_config = ConfigDict(from_attributes=True, ser_json_bytes="utf8")
+
     # Identification
     id: str = Field(..., description="Product ID (Firestore document ID)")
 
@@ -229,10 +141,6 @@ class ProductResponse(BaseModel):
         None,
         description="Original price (shown with strikethrough)"
     )
-    discount_percentage: Optional[int] = Field(
-        None,
-        description="Calculated discount percentage"
-    )
 
     # Classification
     category: str = Field(..., description="Product category")
@@ -241,7 +149,6 @@ class ProductResponse(BaseModel):
 
     # Inventory
     stock_quantity: int = Field(0, description="Available stock")
-    in_stock: bool = Field(True, description="Whether product is available")
 
     # Media
     images: List[str] = Field(
@@ -251,7 +158,7 @@ class ProductResponse(BaseModel):
     thumbnail: Optional[str] = Field(None, description="Thumbnail image")
 
     # Details
-    specifications: Optional[dict] = Field(None, description="Product specs")
+    specifications: Optional[Specifications] = Field(None, description="Product specs")
 
     # Display
     is_featured: bool = Field(False, description="Featured product flag")
@@ -267,10 +174,17 @@ class ProductResponse(BaseModel):
     # Timestamps
     created_at: Optional[str] = Field(None, description="Creation date")
 
-    class Config:
-        """Pydantic configuration."""
-        # Enable from_attributes for ORM-style instantiation
-        from_attributes = True
+    # Derived values - computed from the fields above when serializing,
+    # never stored or validated (still included in JSON output and the schema)
+    @computed_field(description="Calculated discount percentage")
+    @property
+    def discount_percentage(self) -> Optional[int]:
+        return calculate_discount(self.price, self.original_price)
+
+    @computed_field(description="Whether product is available")
+    @property
+    def in_stock(self) -> bool:
+        return self.stock_quantity > 0
 
 
 # ==============================================================================
@@ -292,8 +206,13 @@ class CategoryResponse(BaseModel):
             "image": "https://...",
             "product_count": 150
         }
+
+    Frozen (and therefore hashable): a category is a small, fixed value, so
+    one instance per slug can be shared wherever that category appears.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Category ID")
     name: str = Field(..., description="Display name")
     slug: str = Field(
@@ -317,7 +236,7 @@ class CategoryResponse(BaseModel):
 # ==============================================================================
 # PRODUCT LIST RESPONSE (Paginated)
 # ==============================================================================
-class ProductListResponse(BaseModel):
+class ProductListResponse(FastJSONModel):
     """
     Model for paginated product list.
 
@@ -334,6 +253,8 @@ class ProductListResponse(BaseModel):
         }
     """
 
+    model_config = ConfigDict(from_attributes=True, ser_json_bytes="utf8")
+
     products: List[ProductResponse] = Field(
         ...,
         description="List of products on current page"
@@ -348,3 +269,48 @@ class ProductListResponse(BaseModel):
         False,
         description="Whether more products are available"
     )
+
+
+# ==============================================================================
+# PRODUCT LIST ROWS (TypedDict - hot list path)
+# ==============================================================================
+# The paginated listing builds a page, serializes it and throws it away, so
+# it doesn't need model instances at all. These TypedDicts describe the same
+# JSON shape as ProductResponse / ProductListResponse; a TypeAdapter over them
+# serializes plain dicts directly. typing_extensions.TypedDict is required by
+# Pydantic on Python < 3.12.
+#
+# Keep in sync with ProductResponse (including its computed fields).
+class ProductResponseTD(TypedDict, total=False):
+    """Plain-dict form of ProductResponse used by GET /products."""
+
+    id: str
+    name: str
+    name_lower: Optional[str]
+    description: str
+    price: float
+    original_price: Optional[float]
+    category: str
+    brand: Optional[str]
+    sku: Optional[str]
+    stock_quantity: int
+    images: List[str]
+    thumbnail: Optional[str]
+    specifications: Optional[Specifications]
+    is_featured: bool
+    tags: List[str]
+    rating: Optional[float]
+    review_count: int
+    created_at: Optional[str]
+    discount_percentage: Optional[int]
+    in_stock: bool
+
+
+class ProductListResponseTD(TypedDict):
+    """Plain-dict form of ProductListResponse used by GET /products."""
+
+    products: List[ProductResponseTD]
+    total: int
+    page: int
+    per_page: int
+    has_more: bool
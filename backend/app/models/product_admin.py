@@ -0,0 +1,183 @@
+"""
+==============================================================================
+Admin Product Models (product_admin.py)
+==============================================================================
+
+PURPOSE:
+--------
+Write-side product models used only by the admin catalog endpoints:
+- ProductCreate: add a product (POST /products)
+- ProductUpdate: partial product update (PUT /products/{id})
+
+WHY A SEPARATE MODULE:
+----------------------
+Customers only ever read the catalog, and every read goes through the
+response models in product.py. Pydantic builds a model's validator when the
+class is created, so keeping the admin models here means code that imports
+product.py for the read path doesn't pay for models it never calls. The
+admin models also use defer_build=True, so even importing this module
+postpones their schema build until the first admin request.
+
+The shared field types (ProductName, Specifications, ...) still live in
+product.py so the read and write models can never drift apart.
+"""
+
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+from typing import Optional, List
+
+from .product import (
+    BrandName,
+    CategoryName,
+    ProductDescription,
+    ProductName,
+    Sku,
+    Specifications,
+)
+
+
+# ==============================================================================
+# PRODUCT CREATE MODEL (Admin)
+# ==============================================================================
+class ProductCreate(BaseModel):
+    """
+    Model for creating a new product (admin only).
+
+    Used by admin panel to add new products to the catalog.
+    Contains all product attributes that can be set at creation.
+
+    Example JSON:
+        {
+            "name": "iPhone 15 Pro",
+            "description": "Latest Apple smartphone with titanium design...",
+            "price": 129900,
+            "original_price": 149900,
+            "category": "Electronics",
+            "brand": "Apple",
+            "stock_quantity": 50,
+            "images": ["https://..."],
+            "is_featured": true
+        }
+    """
+
+    # Admin-only model: build the validator on first use instead of at import
+    model_config = ConfigDict(defer_build=True)
+
+    # Basic product information
+    name: ProductName = Field(..., description="Product name")
+    description: ProductDescription = Field(
+        ...,
+        description="Product description (supports markdown/HTML)"
+    )
+
+    # Pricing
+    price: float = Field(
+        ...,
+        gt=0,  # Greater than 0 (no free or negative prices)
+        description="Current selling price in INR"
+    )
+    original_price: Optional[float] = Field(
+        None,
+        gt=0,
+        description="Original price before discount (for strikethrough display)"
+    )
+
+    # Classification
+    category: CategoryName = Field(
+        ...,
+        description="Product category (e.g., 'Electronics', 'Clothing')"
+    )
+    brand: Optional[BrandName] = Field(None, description="Brand name")
+
+    # Inventory
+    sku: Optional[Sku] = Field(
+        None,
+        description="Stock Keeping Unit for inventory tracking"
+    )
+    stock_quantity: int = Field(
+        0,
+        ge=0,  # Greater than or equal to 0
+        description="Available stock count"
+    )
+
+    # Media
+    images: List[str] = Field(
+        default_factory=list,
+        description="List of product image URLs"
+    )
+    thumbnail: Optional[str] = Field(
+        None,
+        description="Thumbnail image URL for listings"
+    )
+
+    # Additional details
+    specifications: Optional[Specifications] = Field(
+        None,
+        description="Key-value pairs for product specs (RAM, storage, etc.)"
+    )
+
+    # Display flags
+    is_active: bool = Field(
+        True,
+        description="Whether product is visible in catalog"
+    )
+    is_featured: bool = Field(
+        False,
+        description="Whether product appears in featured section"
+    )
+
+    # Search and filtering
+    tags: List[str] = Field(
+        default_factory=list,
+        description="Tags for search and filtering"
+    )
+
+    # Denormalized search key, derived once on the write path and stored with
+    # the product (model_dump() includes computed fields). Reads use the
+    # stored value, so nothing is lowercased per response.
+    @computed_field
+    @property
+    def name_lower(self) -> str:
+        return self.name.lower()
+
+
+# ==============================================================================
+# PRODUCT UPDATE MODEL (Admin)
+# ==============================================================================
+class ProductUpdate(BaseModel):
+    """
+    Model for updating a product.
+
+    All fields are optional - only provided fields are updated.
+    This allows partial updates without resending all data.
+
+    Example JSON (updating just price and stock):
+        {
+            "price": 119900,
+            "stock_quantity": 45
+        }
+    """
+
+    # Admin-only model: build the validator on first use instead of at import
+    model_config = ConfigDict(defer_build=True)
+
+    name: Optional[ProductName] = None
+    description: Optional[ProductDescription] = None
+    price: Optional[float] = Field(None, gt=0)
+    original_price: Optional[float] = Field(None, gt=0)
+    category: Optional[CategoryName] = None
+    brand: Optional[BrandName] = None
+    sku: Optional[Sku] = None
+    stock_quantity: Optional[int] = Field(None, ge=0)
+    images: Optional[List[str]] = None
+    thumbnail: Optional[str] = None
+    specifications: Optional[Specifications] = None
+    is_active: Optional[bool] = None
+    is_featured: Optional[bool] = None
+    tags: Optional[List[str]] = None
+
+    # Regenerated alongside name so the stored search key never goes stale
+    @computed_field
+    @property
+    def name_lower(self) -> Optional[str]:
+        return self.name.lower() if self.name is not None else None
+
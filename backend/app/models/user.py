@@ -13,7 +13,8 @@ This module defines Pydantic models for user-related operations:
 PYDANTIC FEATURES USED:
 -----------------------
 1. **Field**: Define field metadata (description, min/max length, etc.)
-2. **EmailStr**: Validates email format automatically
+2. **EmailStr**: Validates email format automatically (signup only; login
+   and OTP models use the lighter regex-based Email type)
 3. **field_validator**: Custom validation logic for specific fields
 4. **Optional**: Fields that can be None
 
@@ -40,61 +41,91 @@ Accepts various formats, normalized to digits only:
 - 123-456-7890 (with dashes, removed during normalization)
 """
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, StringConstraints, field_validator
+from typing import Annotated, Any, Literal, Optional
 import re
+import string
+
+from .base import RESPONSE_MODEL_CONFIG, FastJSONModel
 
 
 # ==============================================================================
-# USER REGISTRATION MODEL
+# CONSTRAINED STRING TYPES
 # ==============================================================================
-class UserCreate(BaseModel):
-    """
-    Model for user registration.
+# Name and password limits shared by every user model below.
+PersonName = Annotated[str, StringConstraints(min_length=1, max_length=50)]
+Password = Annotated[str, StringConstraints(min_length=8, max_length=128)]
 
-    Used when creating a new user account. All required fields
-    must be provided, and passwords must meet security requirements.
+# Finite value sets: pydantic-core checks a Literal with a lookup table,
+# no Python validator call needed.
+OTPPurpose = Literal["register", "login"]
 
-    Example JSON:
-        {
-            "email": "user@example.com",
-            "password": "SecurePass123",
-            "first_name": "John",
-            "last_name": "Doe",
-            "phone": "9876543210"
-        }
-    """
+# Lightweight email syntax check for the hot login/OTP paths. Unlike EmailStr
+# (which runs the email-validator package on every request) this trades full
+# RFC checking for throughput; signup (UserCreate) keeps the strict EmailStr,
+# so every stored address has already passed the full check.
+Email = Annotated[
+    str,
+    StringConstraints(min_length=3, max_length=254, pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$"),
+]
 
-    # Email uses EmailStr for automatic format validation
-    # ... means field is required (no default value)
-    email: EmailStr = Field(..., description="User email address")
+# Exactly six ASCII digits, checked by pydantic-core's compiled regex
+OTPCode = Annotated[str, StringConstraints(min_length=6, max_length=6, pattern=r"^[0-9]{6}$")]
 
-    # Password has length constraints and custom validation
-    password: str = Field(
-        ...,
-        min_length=8,   # Minimum 8 characters
-        max_length=128, # Maximum to prevent DoS attacks
-        description="User password"
-    )
 
-    # Name fields with reasonable length limits
-    first_name: str = Field(
-        ...,
-        min_length=1,
-        max_length=50,
-        description="First name"
-    )
-    last_name: str = Field(
-        ...,
-        min_length=1,
-        max_length=50,
-        description="Last name"
-    )
+# ==============================================================================
+# PRECOMPILED PATTERNS
+# ==============================================================================
+# Compiled once at import so validators don't go through re's pattern cache
+# (hash + dict lookup) on every call.
+_PHONE_FMT = re.compile(r"^\+?\d{10,15}$")
+
+# Separators removed from phone numbers. str.translate() deletes them in a
+# single C loop, without going through the regex engine.
+_PHONE_SEPARATORS = str.maketrans("", "", " \t\n\r\f\v-")
+
+# Character classes for the password strength check
+_UPPERS = frozenset(string.ascii_uppercase)
+_LOWERS = frozenset(string.ascii_lowercase)
+_DIGITS = frozenset(string.digits)
+
+
+def _check_password_strength(v: str) -> str:
+    """
+    Ensure a password mixes uppercase, lowercase and digits.
+
+    The password is scanned once into a set of its characters (in C), and
+    each requirement is then a set-disjointness test instead of a separate
+    regex pass over the whole string.
+
+    Raises:
+        ValueError: With the first requirement the password fails
+    """
+    chars = set(v)
+    if chars.isdisjoint(_UPPERS):
+        raise ValueError("Password must contain at least one uppercase letter")
+    if chars.isdisjoint(_LOWERS):
+        raise ValueError("Password must contain at least one lowercase letter")
+    if chars.isdisjoint(_DIGITS):
+        raise ValueError("Password must contain at least one digit")
+    return v
 
-    # Phone is optional (users can add later)
-    phone: Optional[str] = Field(None, max_length=15, description="Phone number")
 
-    @field_validator("password")
+# ==============================================================================
+# SHARED VALIDATOR MIXINS
+# ==============================================================================
+# Several models validate the same kind of field. Defining each validator once
+# in a mixin means pydantic-core builds one validator function that every
+# model reuses, instead of one copy per model.
+#
+# Mixins subclass BaseModel because Pydantic only collects validators from
+# BaseModel bases. check_fields=False is needed because the mixins declare no
+# fields themselves (and each password model has only one of "password" /
+# "new_password").
+class _PasswordFieldMixin(BaseModel):
+    """Password strength validation for UserCreate and PasswordChange."""
+
+    @field_validator("password", "new_password", check_fields=False)
     @classmethod
     def validate_password(cls, v: str) -> str:
         """
@@ -117,17 +148,15 @@ class UserCreate(BaseModel):
         Raises:
             ValueError: If password doesn't meet requirements
         """
-        if not re.search(r"[A-Z]", v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", v):
-            raise ValueError("Password must contain at least one digit")
-        return v
-
-    @field_validator("phone")
+        return _check_password_strength(v)
+
+
+class _PhoneFieldMixin(BaseModel):
+    """Phone number normalization for UserCreate and UserUpdate."""
+
+    @field_validator("phone", mode="before", check_fields=False)
     @classmethod
-    def validate_phone(cls, v: Optional[str]) -> Optional[str]:
+    def validate_phone(cls, v: Any) -> Any:
         """
         Validate and normalize phone number.
 
@@ -138,8 +167,13 @@ class UserCreate(BaseModel):
 
         Normalizes to plain digits (with optional + prefix).
 
+        Runs in "before" mode, so the field's own constraints (max_length)
+        are checked by pydantic-core against the cleaned number rather than
+        the raw input with its spaces and dashes. Non-string input is passed
+        through for pydantic-core to reject.
+
         Args:
-            v: Phone number string (or None)
+            v: Raw phone input (or None)
 
         Returns:
             Cleaned phone number with only digits
@@ -147,16 +181,52 @@ class UserCreate(BaseModel):
         Raises:
             ValueError: If phone format is invalid
         """
-        if v is None:
+        if not isinstance(v, str):
             return v
         # Remove spaces and dashes for normalization
-        cleaned = re.sub(r"[\s\-]", "", v)
+        cleaned = v.translate(_PHONE_SEPARATORS)
         # Must be 10-15 digits, optionally starting with +
-        if not re.match(r"^\+?[\d]{10,15}$", cleaned):
+        if not _PHONE_FMT.match(cleaned):
             raise ValueError("Invalid phone number format")
         return cleaned
 
 
+# ==============================================================================
+# USER REGISTRATION MODEL
+# ==============================================================================
+class UserCreate(_PasswordFieldMixin, _PhoneFieldMixin):
+    """
+    Model for user registration.
+
+    Used when creating a new user account. All required fields
+    must be provided, and passwords must meet security requirements.
+
+    Example JSON:
+        {
+            "email": "user@example.com",
+            "password": "SecurePass123",
+            "first_name": "John",
+            "last_name": "Doe",
+            "phone": "9876543210"
+        }
+    """
+
+    # Email uses EmailStr for automatic format validation
+    # ... means field is required (no default value)
+    email: EmailStr = Field(..., description="User email address")
+
+    # Password has length constraints and custom validation
+    # 8-128 characters: the upper bound prevents DoS via huge bcrypt inputs
+    password: Password = Field(..., description="User password")
+
+    # Name fields with reasonable length limits
+    first_name: PersonName = Field(..., description="First name")
+    last_name: PersonName = Field(..., description="Last name")
+
+    # Phone is optional (users can add later)
+    phone: Optional[str] = Field(None, max_length=15, description="Phone number")
+
+
 # ==============================================================================
 # USER LOGIN MODEL
 # ==============================================================================
@@ -175,14 +245,14 @@ class UserLogin(BaseModel):
         }
     """
 
-    email: EmailStr = Field(..., description="User email address")
+    email: Email = Field(..., description="User email address")
     password: str = Field(..., description="User password")
 
 
 # ==============================================================================
 # USER RESPONSE MODEL
 # ==============================================================================
-class UserResponse(BaseModel):
+class UserResponse(FastJSONModel):
     """
     Model for user response data.
 
@@ -195,6 +265,12 @@ class UserResponse(BaseModel):
     - User listings (admin)
     """
 
+    model_config = ConfigDict(
+        **RESPONSE_MODEL_CONFIG,
+        from_attributes=True,
+        ser_json_bytes="utf8",
+    )
+
     id: str = Field(..., description="User ID")
     email: str = Field(..., description="User email")
     first_name: str = Field(..., description="First name")
@@ -208,7 +284,7 @@ class UserResponse(BaseModel):
 # ==============================================================================
 # USER UPDATE MODEL
 # ==============================================================================
-class UserUpdate(BaseModel):
+class UserUpdate(_PhoneFieldMixin):
     """
     Model for updating user profile.
 
@@ -221,26 +297,15 @@ class UserUpdate(BaseModel):
         }
     """
 
-    first_name: Optional[str] = Field(None, min_length=1, max_length=50)
-    last_name: Optional[str] = Field(None, min_length=1, max_length=50)
+    first_name: Optional[PersonName] = None
+    last_name: Optional[PersonName] = None
     phone: Optional[str] = Field(None, max_length=15)
 
-    @field_validator("phone")
-    @classmethod
-    def validate_phone(cls, v: Optional[str]) -> Optional[str]:
-        """Validate phone number format (same as UserCreate)."""
-        if v is None:
-            return v
-        cleaned = re.sub(r"[\s\-]", "", v)
-        if not re.match(r"^\+?[\d]{10,15}$", cleaned):
-            raise ValueError("Invalid phone number format")
-        return cleaned
-
 
 # ==============================================================================
 # PASSWORD CHANGE MODEL
 # ==============================================================================
-class PasswordChange(BaseModel):
+class PasswordChange(_PasswordFieldMixin):
     """
     Model for password change request.
 
@@ -254,31 +319,17 @@ class PasswordChange(BaseModel):
         }
     """
 
-    current_password: str = Field(..., description="Current password")
-    new_password: str = Field(
-        ...,
-        min_length=8,
-        max_length=128,
-        description="New password"
-    )
+    # Rarely used: build the validator on first use instead of at import
+    model_config = ConfigDict(defer_build=True)
 
-    @field_validator("new_password")
-    @classmethod
-    def validate_password(cls, v: str) -> str:
-        """Ensure new password meets security requirements."""
-        if not re.search(r"[A-Z]", v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+    current_password: str = Field(..., description="Current password")
+    new_password: Password = Field(..., description="New password")
 
 
 # ==============================================================================
 # AUTHENTICATION TOKEN RESPONSE
 # ==============================================================================
-class TokenResponse(BaseModel):
+class TokenResponse(FastJSONModel):
     """
     Model for authentication token response.
 
@@ -298,8 +349,14 @@ class TokenResponse(BaseModel):
         }
     """
 
+    model_config = ConfigDict(
+        **RESPONSE_MODEL_CONFIG,
+        from_attributes=True,
+        ser_json_bytes="utf8",
+    )
+
     access_token: str = Field(..., description="JWT access token")
-    token_type: str = Field("bearer", description="Token type (always 'bearer')")
+    token_type: Literal["bearer"] = Field("bearer", description="Token type (always 'bearer')")
     user: UserResponse = Field(..., description="User data")
 
 
@@ -322,16 +379,8 @@ class OTPRequest(BaseModel):
         }
     """
 
-    email: EmailStr = Field(..., description="Email address to send OTP")
-    purpose: str = Field(..., description="Purpose: 'register' or 'login'")
-
-    @field_validator("purpose")
-    @classmethod
-    def validate_purpose(cls, v: str) -> str:
-        """Ensure purpose is a valid value."""
-        if v not in ["register", "login"]:
-            raise ValueError("Purpose must be 'register' or 'login'")
-        return v
+    email: Email = Field(..., description="Email address to send OTP")
+    purpose: OTPPurpose = Field(..., description="Purpose: 'register' or 'login'")
 
 
 # ==============================================================================
@@ -352,22 +401,9 @@ class OTPVerify(BaseModel):
         }
     """
 
-    email: EmailStr = Field(..., description="Email address")
-    otp: str = Field(
-        ...,
-        min_length=6,
-        max_length=6,
-        description="6-digit OTP code"
-    )
-    purpose: str = Field(..., description="Purpose: 'register' or 'login'")
-
-    @field_validator("otp")
-    @classmethod
-    def validate_otp(cls, v: str) -> str:
-        """Ensure OTP is exactly 6 digits."""
-        if not v.isdigit() or len(v) != 6:
-            raise ValueError("OTP must be exactly 6 digits")
-        return v
+    email: Email = Field(..., description="Email address")
+    otp: OTPCode = Field(..., description="6-digit OTP code")
+    purpose: OTPPurpose = Field(..., description="Purpose: 'register' or 'login'")
 
 
 # ==============================================================================
@@ -388,6 +424,8 @@ class OTPResponse(BaseModel):
         }
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     message: str = Field(..., description="Status message")
     email: str = Field(..., description="Email address OTP was sent to")
     expires_in: int = Field(..., description="OTP expiry time in seconds")
@@ -409,6 +447,8 @@ class OTPVerifyResponse(BaseModel):
         }
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     verified: bool = Field(..., description="Whether OTP was verified")
     message: str = Field(..., description="Status message")
     verification_token: Optional[str] = Field(
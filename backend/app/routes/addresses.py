@@ -39,6 +39,8 @@ DEFAULT ADDRESS LOGIC:
 2. Setting new default -> unsets previous default
 3. Deleting default -> first remaining becomes default
 4. Only one default at a time
+5. The user document's default_address_id points at the default, so
+   GET /addresses/default is a single document read
 
 SECURITY:
 ---------
@@ -47,16 +49,70 @@ Users can only access their own addresses.
 Address ownership is verified on every operation.
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import Dict, Any, List
+from fastapi import APIRouter, HTTPException, status, Depends, Response
+from typing import Dict, Any, List, Optional
+from pydantic import TypeAdapter
 
-from ..auth.dependencies import get_current_user
+from ..auth.dependencies import get_current_user, invalidate_cached_user
 from ..models.address import AddressCreate, AddressUpdate, AddressResponse
-from ..firebase import address_repo
+from ..firebase import address_repo, user_repo
 
 # Create router with prefix and tag for OpenAPI docs
 router = APIRouter(prefix="/addresses", tags=["Addresses"])
 
+# Serializes a whole address list in one pydantic-core call.
+# Built once at import - constructing a TypeAdapter compiles a schema.
+_ADDRESSES_ADAPTER = TypeAdapter(List[AddressResponse])
+
+
+# ==============================================================================
+# HELPER FUNCTIONS
+# ==============================================================================
+
+def address_model(address: Dict[str, Any]) -> AddressResponse:
+    """
+    Wrap an address document in AddressResponse without re-validating it.
+
+    Address documents are only ever written through AddressCreate and
+    AddressUpdate, so what comes back from Firestore (or what a write
+    endpoint just stored) is already valid. model_construct() skips the
+    per-field validation FastAPI would otherwise run on every response;
+    fields the model doesn't declare (updated_at) are ignored.
+    """
+    return AddressResponse.model_construct(**address)
+
+
+def address_response(address: Dict[str, Any], status_code: int = status.HTTP_200_OK) -> Response:
+    """Serialize one address document straight to a JSON response."""
+    return Response(
+        address_model(address).to_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+async def unset_defaults(addresses: List[Dict[str, Any]]) -> None:
+    """
+    Clear is_default on the given addresses in one batched write.
+
+    All current defaults are cleared, not only the first - like
+    set_default_atomic(), this repairs users who ended up with several.
+    """
+    await address_repo.batch_update([
+        (address["id"], {"is_default": False}) for address in addresses
+    ])
+
+
+async def set_user_default_address(user_id: str, address_id: Optional[str]) -> None:
+    """
+    Point the user document's default_address_id at an address (or None).
+
+    The user document is cached by the auth dependency, so the cached copy
+    is dropped to make the next request see the new pointer.
+    """
+    await user_repo.update(user_id, {"default_address_id": address_id})
+    invalidate_cached_user(user_id)
+
 
 # ==============================================================================
 # ADDRESS ENDPOINTS - All require authentication
@@ -66,7 +122,7 @@ router = APIRouter(prefix="/addresses", tags=["Addresses"])
 @router.get("", response_model=List[AddressResponse])
 async def list_addresses(
     current_user: Dict[str, Any] = Depends(get_current_user)
-) -> List[Dict[str, Any]]:
+) -> Response:
     """
     Get all addresses for current user.
 
@@ -80,13 +136,16 @@ async def list_addresses(
         GET /addresses
     """
     addresses = await address_repo.get_user_addresses(current_user["id"])
-    return addresses
+    return Response(
+        _ADDRESSES_ADAPTER.dump_json([address_model(a) for a in addresses]),
+        media_type="application/json",
+    )
 
 
 @router.get("/default", response_model=AddressResponse)
 async def get_default_address(
     current_user: Dict[str, Any] = Depends(get_current_user)
-) -> Dict[str, Any]:
+) -> Response:
     """
     Get default address for current user.
 
@@ -102,7 +161,20 @@ async def get_default_address(
     Example:
         GET /addresses/default
     """
-    address = await address_repo.get_default_address(current_user["id"])
+    # Fast path: follow the pointer on the user document (one point read).
+    # It is ignored if it no longer names one of the user's defaults.
+    address = None
+    default_id = current_user.get("default_address_id")
+    if default_id:
+        address = await address_repo.get_by_id(default_id)
+        if address and (
+            address.get("user_id") != current_user["id"] or not address.get("is_default")
+        ):
+            address = None
+
+    # Fallback for accounts created before the pointer existed
+    if address is None:
+        address = await address_repo.get_default_address(current_user["id"])
 
     if not address:
         raise HTTPException(
@@ -110,14 +182,14 @@ async def get_default_address(
             detail="No default address set"
         )
 
-    return address
+    return address_response(address)
 
 
 @router.get("/{address_id}", response_model=AddressResponse)
 async def get_address(
     address_id: str,
     current_user: Dict[str, Any] = Depends(get_current_user)
-) -> Dict[str, Any]:
+) -> Response:
     """
     Get a specific address by ID.
 
@@ -142,14 +214,14 @@ async def get_address(
             detail="Address not found"
         )
 
-    return address
+    return address_response(address)
 
 
 @router.post("", response_model=AddressResponse, status_code=status.HTTP_201_CREATED)
 async def create_address(
     address_data: AddressCreate,
     current_user: Dict[str, Any] = Depends(get_current_user)
-) -> Dict[str, Any]:
+) -> Response:
     """
     Create a new shipping address.
 
@@ -176,27 +248,33 @@ async def create_address(
             "is_default": true
         }
     """
-    # If this is set as default, unset other defaults first
+    # Indexed lookup (user_id AND is_default) - reads only the current
+    # default(s) instead of listing every address the user has
+    current_defaults = await address_repo.get_default_addresses(current_user["id"])
+
+    # If this is set as default, unset the previous default(s) first
     if address_data.is_default:
-        existing_addresses = await address_repo.get_user_addresses(current_user["id"])
-        for addr in existing_addresses:
-            if addr.get("is_default"):
-                await address_repo.update(addr["id"], {"is_default": False})
+        await unset_defaults(current_defaults)
 
     # Prepare address document
     address_dict = address_data.model_dump()
     address_dict["user_id"] = current_user["id"]
 
-    # First address is automatically default
-    existing = await address_repo.get_user_addresses(current_user["id"])
-    if not existing:
-        address_dict["is_default"] = True
+    # First address is automatically default. A user with a default
+    # already has addresses; otherwise a limit(1) probe answers the
+    # question without reading the whole list.
+    if not current_defaults:
+        if not await address_repo.user_has_any_address(current_user["id"]):
+            address_dict["is_default"] = True
 
-    # Save to Firestore
+    # Save to Firestore. create() stamps created_at/updated_at onto
+    # address_dict, so it already holds the stored document - no re-read.
     address_id = await address_repo.create(address_dict)
-    address = await address_repo.get_by_id(address_id)
 
-    return address
+    if address_dict["is_default"]:
+        await set_user_default_address(current_user["id"], address_id)
+
+    return address_response({**address_dict, "id": address_id}, status.HTTP_201_CREATED)
 
 
 @router.put("/{address_id}", response_model=AddressResponse)
@@ -204,7 +282,7 @@ async def update_address(
     address_id: str,
     update_data: AddressUpdate,
     current_user: Dict[str, Any] = Depends(get_current_user)
-) -> Dict[str, Any]:
+) -> Response:
     """
     Update an existing address.
 
@@ -235,21 +313,27 @@ async def update_address(
             detail="Address not found"
         )
 
-    # If setting as default, unset other defaults first
+    # If setting as default, unset the previous default(s) first
+    # (indexed lookup of the defaults only)
     if update_data.is_default:
-        existing_addresses = await address_repo.get_user_addresses(current_user["id"])
-        for addr in existing_addresses:
-            if addr["id"] != address_id and addr.get("is_default"):
-                await address_repo.update(addr["id"], {"is_default": False})
+        current_defaults = await address_repo.get_default_addresses(current_user["id"])
+        await unset_defaults([a for a in current_defaults if a["id"] != address_id])
 
     # Build update dictionary with only non-None values
-    update_dict = {k: v for k, v in update_data.model_dump().items() if v is not None}
+    update_dict = update_data.model_dump(exclude_none=True)
 
     if update_dict:
         await address_repo.update(address_id, update_dict)
 
-    updated = await address_repo.get_by_id(address_id)
-    return updated
+    # Keep the user's default_address_id pointer in sync
+    if update_data.is_default:
+        await set_user_default_address(current_user["id"], address_id)
+    elif update_data.is_default is False and address.get("is_default"):
+        await set_user_default_address(current_user["id"], None)
+
+    # Merge the written fields (plus updated_at, set by update()) onto the
+    # document read for the ownership check instead of reading it again
+    return address_response({**address, **update_dict})
 
 
 @router.delete("/{address_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -290,15 +374,17 @@ async def delete_address(
     # If deleted address was default, promote another
     if address.get("is_default"):
         remaining = await address_repo.get_user_addresses(current_user["id"])
-        if remaining:
-            await address_repo.update(remaining[0]["id"], {"is_default": True})
+        new_default_id = remaining[0]["id"] if remaining else None
+        if new_default_id:
+            await address_repo.update(new_default_id, {"is_default": True})
+        await set_user_default_address(current_user["id"], new_default_id)
 
 
 @router.post("/{address_id}/set-default", response_model=AddressResponse)
 async def set_default_address(
     address_id: str,
     current_user: Dict[str, Any] = Depends(get_current_user)
-) -> Dict[str, Any]:
+) -> Response:
     """
     Set an address as default.
 
@@ -317,22 +403,16 @@ async def set_default_address(
     Example:
         POST /addresses/abc123/set-default
     """
-    # Verify ownership
-    address = await address_repo.get_by_id(address_id)
-    if not address or address.get("user_id") != current_user["id"]:
+    # Ownership check, clearing the old default and setting the new one
+    # all happen in one Firestore transaction
+    address = await address_repo.set_default_atomic(current_user["id"], address_id)
+    if not address:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Address not found"
         )
 
-    # Unset other defaults
-    existing_addresses = await address_repo.get_user_addresses(current_user["id"])
-    for addr in existing_addresses:
-        if addr["id"] != address_id and addr.get("is_default"):
-            await address_repo.update(addr["id"], {"is_default": False})
-
-    # Set this one as default
-    await address_repo.update(address_id, {"is_default": True})
+    # The transaction also moved the user's default_address_id pointer
+    invalidate_cached_user(current_user["id"])
 
-    updated = await address_repo.get_by_id(address_id)
-    return updated
+    return address_response(address)
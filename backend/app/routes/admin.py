@@ -42,38 +42,256 @@ Non-admins receive 403 Forbidden response.
 
 PAGINATION:
 -----------
-List endpoints use offset-based pagination:
+List endpoints accept:
 - page: Page number (1-indexed, default 1)
 - per_page: Items per page (default 20, max 100)
+- cursor: (orders, users) next_cursor from the previous page
+
+The order and user lists are filtered, sorted and paginated by Firestore,
+so only the requested page is downloaded. Following next_cursor is the
+cheapest way to walk forward; page numbers still work for jumping around.
+Searches match substrings and are still paginated in Python.
 
 Response includes:
-- total: Total items matching query
+- total: Total items matching query (server-side count, cached briefly)
 - page: Current page
 - per_page: Items per page
 - has_more: Whether more pages exist
+- next_cursor: (orders, users) pass as cursor to get the next page
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends, Query
-from typing import Dict, Any, List, Optional
+import asyncio
+import math
+
+import orjson
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from typing import Dict, Any, List, Optional, Tuple
 
-from ..auth.dependencies import get_admin_user
+from ..auth.dependencies import get_admin_user, invalidate_cached_user
+from ..cache import (
+    STATS_CACHE_TTL, admin_list_cache, admin_stats_cache, etag_json_response,
+    invalidate_admin_views, invalidate_order_list,
+)
 from ..models.admin import (
     AdminStatsResponse,
     AdminOrderResponse,
     AdminOrderListResponse,
-    AdminOrderUser,
-    AdminOrderItem,
     OrderStatusUpdate,
     AdminUserResponse,
     AdminUserListResponse,
     UserStatusUpdate,
     ProductToggleResponse,
 )
-from ..firebase import product_repo, order_repo, user_repo
+from ..firebase import product_repo, order_repo, user_repo, encode_cursor, decode_cursor
 
 # Create router with prefix and tag for OpenAPI docs
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
+# Dashboard stats are cached in admin_stats_cache (cache.py); the lock
+# makes concurrent misses wait for one computation instead of each
+# scanning Firestore.
+_stats_lock = asyncio.Lock()
+
+# Maximum concurrent per-row Firestore queries issued by one list request
+ADMIN_FANOUT_LIMIT = 20
+
+# Status filters for user search results, which are filtered in Python.
+# Unfiltered listings push the same filters into the Firestore query
+# (USER_STATUS_FILTERS in firebase.py).
+USER_STATUS_PREDICATES = {
+    "active": lambda user: user.get("is_active", True),
+    "inactive": lambda user: not user.get("is_active", True),
+    "admin": lambda user: user.get("is_admin", False),
+}
+
+
+# ==============================================================================
+# HELPER FUNCTIONS
+# ==============================================================================
+
+async def user_order_stats(user: Dict[str, Any]) -> Tuple[int, float]:
+    """
+    Get a user's order count and total spent.
+
+    create_order keeps order_count / total_spent counters on the user
+    document, so normally this needs no extra reads. A user's first order
+    after the counters were introduced seeds them from all of their orders.
+    Users who haven't ordered since (and weren't backfilled with
+    scripts/backfill_user_order_stats.py) fall back to summing their orders.
+
+    Args:
+        user: User document
+
+    Returns:
+        (order_count, total_spent)
+    """
+    if "order_count" in user and "total_spent" in user:
+        return int(user["order_count"]), float(user["total_spent"])
+
+    user_orders = await order_repo.get_user_orders(user.get("id", ""), limit=1000)
+    return len(user_orders), math.fsum(float(o.get("total", 0)) for o in user_orders)
+
+
+def check_cursor(cursor: Optional[str]) -> None:
+    """Reject a malformed pagination cursor with 400 before any query runs."""
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+
+
+def page_or_cursor(
+    page: int,
+    cursor: Optional[str],
+    search: Optional[str],
+) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Keep only the pagination parameter a list request actually uses.
+
+    Search results are paginated in Python by page number, so a cursor is
+    dropped. Firestore listings with a cursor ignore the page number, so
+    the page is dropped (None in the response). Either way, requests that
+    return the same rows share one cache entry.
+    """
+    if search:
+        return page, None
+    if cursor:
+        return None, cursor
+    return page, None
+
+
+def order_customer_snapshot(order: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Customer details stored on the order at checkout, shaped like a user.
+
+    create_order copies the customer's email, name and phone onto the
+    order, so admin views don't need to read the user document. Orders
+    placed before that return None and fall back to a user read.
+    """
+    if "user_email" not in order:
+        return None
+    return {
+        "id": order.get("user_id", ""),
+        "email": order.get("user_email", ""),
+        "first_name": order.get("user_first_name", ""),
+        "last_name": order.get("user_last_name", ""),
+        "phone": order.get("user_phone"),
+    }
+
+
+async def get_customer(order: Dict[str, Any], fresh: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Get an order's customer (None if unknown).
+
+    Uses the snapshot on the order unless fresh=True or the order has
+    none, in which case the user document is read.
+    """
+    if not fresh:
+        snapshot = order_customer_snapshot(order)
+        if snapshot:
+            return snapshot
+    user_id = order.get("user_id")
+    if not user_id:
+        return None
+    return await user_repo.get_by_id(user_id)
+
+
+def admin_order_row(
+    order: Dict[str, Any],
+    user_data: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Build the admin view of an order as a plain dict.
+
+    Rows are validated afterwards in one call (AdminOrderResponse for a
+    single order, AdminOrderListResponse for a whole page), so the nested
+    user and items are plain dicts too instead of one model per item.
+
+    Args:
+        order: Order document
+        user_data: The customer's user document (None if unknown/deleted)
+
+    Returns:
+        AdminOrderResponse-compatible dict
+    """
+    # Attach user info
+    user_info = None
+    if user_data:
+        user_info = {
+            "id": user_data.get("id", ""),
+            "email": user_data.get("email", ""),
+            "first_name": user_data.get("first_name", ""),
+            "last_name": user_data.get("last_name", ""),
+            "phone": user_data.get("phone"),
+        }
+
+    # Transform order items
+    items = [
+        {
+            "product_id": item.get("product_id", ""),
+            "product_name": item.get("product_name", item.get("name", "")),
+            "product_image": item.get("product_image", item.get("image", item.get("thumbnail"))),
+            "price": float(item.get("price", 0)),
+            "quantity": int(item.get("quantity", 0)),
+            "subtotal": float(item.get("subtotal", item.get("price", 0) * item.get("quantity", 0))),
+        }
+        for item in order.get("items", [])
+    ]
+
+    return {
+        "id": order.get("id", ""),
+        "order_number": order.get("order_number", ""),
+        "user": user_info,
+        "items": items,
+        "shipping_address": order.get("shipping_address"),
+        "status": order.get("status", "pending"),
+        "payment_method": order.get("payment_method"),
+        "payment_status": order.get("payment_status"),
+        "subtotal": float(order.get("subtotal", 0)),
+        "shipping_cost": float(order.get("shipping_cost", 0)),
+        "discount": float(order.get("discount", 0)),
+        "total": float(order.get("total", 0)),
+        "notes": order.get("notes"),
+        "created_at": order.get("created_at"),
+        "updated_at": order.get("updated_at"),
+    }
+
+
+def admin_user_row(
+    user: Dict[str, Any],
+    order_count: int,
+    total_spent: float,
+) -> Dict[str, Any]:
+    """
+    Build the admin view of a user as a plain dict (see admin_order_row).
+
+    Args:
+        user: User document
+        order_count: Orders placed by the user
+        total_spent: Sum of the user's order totals
+
+    Returns:
+        AdminUserResponse-compatible dict
+    """
+    return {
+        "id": user.get("id", ""),
+        "email": user.get("email", ""),
+        "first_name": user.get("first_name", ""),
+        "last_name": user.get("last_name", ""),
+        "phone": user.get("phone"),
+        "is_active": user.get("is_active", True),
+        "is_admin": user.get("is_admin", False),
+        "order_count": order_count,
+        "total_spent": total_spent,
+        "created_at": user.get("created_at"),
+        "last_login": user.get("last_login"),
+    }
+
 
 # ==============================================================================
 # DASHBOARD STATISTICS
@@ -81,13 +299,15 @@ router = APIRouter(prefix="/admin", tags=["Admin"])
 
 @router.get("/stats", response_model=AdminStatsResponse)
 async def get_admin_stats(
+    response: Response,
     admin: dict = Depends(get_admin_user)
 ) -> AdminStatsResponse:
     """
     Get dashboard statistics overview.
 
     Returns counts and totals for the admin dashboard home page.
-    All counts are calculated on-demand from Firestore.
+    Counts are calculated from Firestore and reused for STATS_CACHE_TTL
+    seconds; admin actions on this router that change them clear the cache.
 
     Requires admin authentication.
 
@@ -102,16 +322,39 @@ async def get_admin_stats(
         - orders_by_status: Count per status
         - recent_orders: Orders in last 7 days
     """
-    # Fetch all stats in parallel would be more efficient,
-    # but for simplicity we fetch sequentially
-    total_products = await product_repo.get_product_count()
-    active_products = await product_repo.get_active_product_count()
-    total_orders = await order_repo.get_order_count()
-    total_users = await user_repo.get_user_count()
-    active_users = await user_repo.get_active_user_count()
-    total_revenue = await order_repo.get_total_revenue()
-    orders_by_status = await order_repo.get_order_count_by_status()
-    recent_orders = await order_repo.get_recent_orders_count(days=7)
+    response.headers["Cache-Control"] = f"private, max-age={STATS_CACHE_TTL}"
+
+    stats = admin_stats_cache.get("stats")
+    if stats is None:
+        async with _stats_lock:
+            # Another request may have filled the cache while we waited
+            stats = admin_stats_cache.get("stats")
+            if stats is None:
+                stats = await _compute_admin_stats()
+                admin_stats_cache["stats"] = stats
+    return stats
+
+
+async def _compute_admin_stats() -> AdminStatsResponse:
+    """Run the Firestore lookups behind get_admin_stats()."""
+    # Counts come from Firestore aggregation queries (no documents are
+    # downloaded); the three order figures come from one pass over the
+    # orders. The lookups are independent, so issue them together.
+    (
+        total_products,
+        active_products,
+        total_orders,
+        total_users,
+        active_users,
+        order_stats,
+    ) = await asyncio.gather(
+        product_repo.get_product_count(),
+        product_repo.get_active_product_count(),
+        order_repo.get_order_count(),
+        user_repo.get_user_count(),
+        user_repo.get_active_user_count(),
+        order_repo.get_order_stats(days=7),
+    )
 
     return AdminStatsResponse(
         total_products=total_products,
@@ -119,9 +362,9 @@ async def get_admin_stats(
         total_orders=total_orders,
         total_users=total_users,
         active_users=active_users,
-        total_revenue=total_revenue,
-        orders_by_status=orders_by_status,
-        recent_orders=recent_orders,
+        total_revenue=order_stats["total_revenue"],
+        orders_by_status=order_stats["orders_by_status"],
+        recent_orders=order_stats["recent_orders"],
     )
 
 
@@ -131,12 +374,14 @@ async def get_admin_stats(
 
 @router.get("/orders", response_model=AdminOrderListResponse)
 async def get_admin_orders(
+    request: Request,
     admin: dict = Depends(get_admin_user),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
     status: Optional[str] = Query(None, description="Filter by order status"),
     search: Optional[str] = Query(None, description="Search by order number or email"),
-) -> AdminOrderListResponse:
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+) -> Response:
     """
     List all orders for admin dashboard.
 
@@ -148,91 +393,103 @@ async def get_admin_orders(
         per_page: Items per page (max 100)
         status: Optional filter by order status
         search: Optional search term (order number or email)
+        cursor: Resume after this order (takes precedence over page;
+            the response's page is then null)
 
     Returns:
         AdminOrderListResponse with paginated orders
+
+    Rendered pages are cached per query (see app/cache.py): fresh for
+    ADMIN_LIST_CACHE_TTL seconds, then served stale while a background task
+    rebuilds them. Order status changes clear them.
     """
-    # Get orders based on filters
+    check_cursor(cursor)
+    page, cursor = page_or_cursor(page, cursor, search)
+    body = await admin_list_cache.get_or_compute(
+        ("admin:orders", page, per_page, status, search, cursor),
+        lambda: _render_admin_orders(page, per_page, status, search, cursor),
+    )
+    return etag_json_response(request, body)
+
+
+async def _render_admin_orders(
+    page: Optional[int],
+    per_page: int,
+    status: Optional[str],
+    search: Optional[str],
+    cursor: Optional[str],
+) -> bytes:
+    """Build one page of get_admin_orders() as JSON bytes."""
+    next_cursor = None
     if search:
+        # Substring search can't be expressed as a Firestore query, so
+        # matches are collected and paginated in Python
         all_orders = await order_repo.search_orders(search, limit=500)
-    elif status:
-        all_orders = await order_repo.get_all_orders(status=status, limit=500)
+        total = len(all_orders)
+        start = (page - 1) * per_page
+        end = start + per_page
+        paginated_orders = all_orders[start:end]
+        has_more = end < total
     else:
-        all_orders = await order_repo.get_all_orders(limit=500)
-
-    # Calculate pagination
-    total = len(all_orders)
-    start = (page - 1) * per_page
-    end = start + per_page
-    paginated_orders = all_orders[start:end]
-    has_more = end < total
-
-    # Transform to response model
-    order_responses = []
-    for order in paginated_orders:
-        # Fetch user info for each order
-        user_info = None
-        user_id = order.get("user_id")
-        if user_id:
-            user_data = await user_repo.get_by_id(user_id)
-            if user_data:
-                user_info = AdminOrderUser(
-                    id=user_data.get("id", ""),
-                    email=user_data.get("email", ""),
-                    first_name=user_data.get("first_name", ""),
-                    last_name=user_data.get("last_name", ""),
-                    phone=user_data.get("phone"),
-                )
-
-        # Transform order items
-        items = []
-        for item in order.get("items", []):
-            items.append(AdminOrderItem(
-                product_id=item.get("product_id", ""),
-                product_name=item.get("product_name", item.get("name", "")),
-                product_image=item.get("product_image", item.get("image", item.get("thumbnail"))),
-                price=float(item.get("price", 0)),
-                quantity=int(item.get("quantity", 0)),
-                subtotal=float(item.get("subtotal", item.get("price", 0) * item.get("quantity", 0))),
-            ))
-
-        order_responses.append(AdminOrderResponse(
-            id=order.get("id", ""),
-            order_number=order.get("order_number", ""),
-            user=user_info,
-            items=items,
-            shipping_address=order.get("shipping_address"),
-            status=order.get("status", "pending"),
-            payment_method=order.get("payment_method"),
-            payment_status=order.get("payment_status"),
-            subtotal=float(order.get("subtotal", 0)),
-            shipping_cost=float(order.get("shipping_cost", 0)),
-            discount=float(order.get("discount", 0)),
-            total=float(order.get("total", 0)),
-            notes=order.get("notes"),
-            created_at=order.get("created_at"),
-            updated_at=order.get("updated_at"),
-        ))
-
-    return AdminOrderListResponse(
-        orders=order_responses,
-        total=total,
-        page=page,
-        per_page=per_page,
-        has_more=has_more,
-    )
+        # Firestore filters, sorts and pages; one extra row tells us
+        # whether another page exists
+        paginated_orders, total = await asyncio.gather(
+            order_repo.get_all_orders(
+                status=status,
+                cursor=cursor,
+                limit=per_page + 1,
+                offset=0 if cursor else (page - 1) * per_page,
+            ),
+            admin_list_cache.get_or_compute(
+                ("admin:orders", "total", status),
+                lambda: order_repo.get_order_count(status),
+            ),
+        )
+        has_more = len(paginated_orders) > per_page
+        paginated_orders = paginated_orders[:per_page]
+        if has_more:
+            next_cursor = encode_cursor(paginated_orders[-1])
+
+    # Customer details come from the snapshot on each order. Only orders
+    # placed before snapshots existed need their users, read in one batch.
+    customers = {order.get("id"): order_customer_snapshot(order) for order in paginated_orders}
+    users_map = await user_repo.get_many([
+        order.get("user_id") for order in paginated_orders if customers[order.get("id")] is None
+    ])
+
+    # Build plain rows; the whole page (orders, users, items) is then
+    # validated in a single pydantic-core call instead of one model per row
+    order_rows = [
+        admin_order_row(order, customers[order.get("id")] or users_map.get(order.get("user_id")))
+        for order in paginated_orders
+    ]
+
+    # Write the validated page straight to JSON instead of letting FastAPI
+    # validate and encode it a second time
+    page_data = AdminOrderListResponse.model_validate({
+        "orders": order_rows,
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "has_more": has_more,
+        "next_cursor": next_cursor,
+    })
+    return page_data.to_json()
 
 
 @router.get("/orders/{order_id}", response_model=AdminOrderResponse)
 async def get_admin_order(
     order_id: str,
     admin: dict = Depends(get_admin_user),
+    fresh: bool = Query(False, description="Read the customer's current details instead of the checkout snapshot"),
 ) -> AdminOrderResponse:
     """
     Get detailed order information including customer data.
 
     Args:
         order_id: Order document ID
+        fresh: Re-read the customer's user document (e.g. after they
+            changed their email) instead of using the order's snapshot
 
     Returns:
         AdminOrderResponse with full order and customer details
@@ -247,49 +504,10 @@ async def get_admin_order(
             detail="Order not found",
         )
 
-    # Fetch user info
-    user_info = None
-    user_id = order.get("user_id")
-    if user_id:
-        user_data = await user_repo.get_by_id(user_id)
-        if user_data:
-            user_info = AdminOrderUser(
-                id=user_data.get("id", ""),
-                email=user_data.get("email", ""),
-                first_name=user_data.get("first_name", ""),
-                last_name=user_data.get("last_name", ""),
-                phone=user_data.get("phone"),
-            )
+    # Customer info (snapshot from checkout, or the user document)
+    user_data = await get_customer(order, fresh=fresh)
 
-    # Transform order items
-    items = []
-    for item in order.get("items", []):
-        items.append(AdminOrderItem(
-            product_id=item.get("product_id", ""),
-            product_name=item.get("product_name", item.get("name", "")),
-            product_image=item.get("product_image", item.get("image", item.get("thumbnail"))),
-            price=float(item.get("price", 0)),
-            quantity=int(item.get("quantity", 0)),
-            subtotal=float(item.get("subtotal", item.get("price", 0) * item.get("quantity", 0))),
-        ))
-
-    return AdminOrderResponse(
-        id=order.get("id", ""),
-        order_number=order.get("order_number", ""),
-        user=user_info,
-        items=items,
-        shipping_address=order.get("shipping_address"),
-        status=order.get("status", "pending"),
-        payment_method=order.get("payment_method"),
-        payment_status=order.get("payment_status"),
-        subtotal=float(order.get("subtotal", 0)),
-        shipping_cost=float(order.get("shipping_cost", 0)),
-        discount=float(order.get("discount", 0)),
-        total=float(order.get("total", 0)),
-        notes=order.get("notes"),
-        created_at=order.get("created_at"),
-        updated_at=order.get("updated_at"),
-    )
+    return AdminOrderResponse.model_validate(admin_order_row(order, user_data))
 
 
 @router.put("/orders/{order_id}/status", response_model=AdminOrderResponse)
@@ -338,11 +556,19 @@ async def update_order_status(
         else:
             update_data["notes"] = f"[{update.status}] {update.notes}"
 
-    # Update order
-    await order_repo.update(order_id, update_data)
+    # Update order. The customer lookup for the response doesn't depend
+    # on the write, so both go out together.
+    _, user_data = await asyncio.gather(
+        order_repo.update(order_id, update_data),
+        get_customer(order),
+    )
+    invalidate_admin_views("admin:orders")
+    invalidate_order_list(order.get("user_id"))
 
-    # Return updated order
-    return await get_admin_order(order_id, admin)
+    # Return the updated order: the document read above plus the fields
+    # just written (update() added updated_at) - no second order read
+    order.update(update_data)
+    return AdminOrderResponse.model_validate(admin_order_row(order, user_data))
 
 
 # ==============================================================================
@@ -351,12 +577,14 @@ async def update_order_status(
 
 @router.get("/users", response_model=AdminUserListResponse)
 async def get_admin_users(
+    request: Request,
     admin: dict = Depends(get_admin_user),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
     search: Optional[str] = Query(None, description="Search by name or email"),
     status_filter: Optional[str] = Query(None, alias="status", description="Filter by status: active, inactive, admin"),
-) -> AdminUserListResponse:
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+) -> Response:
     """
     List all users for admin dashboard.
 
@@ -368,62 +596,99 @@ async def get_admin_users(
         per_page: Items per page (max 100)
         search: Optional search term (name or email)
         status_filter: Optional filter (active, inactive, admin)
+        cursor: Resume after this user (takes precedence over page;
+            the response's page is then null)
 
     Returns:
         AdminUserListResponse with paginated users
+
+    Rendered pages are cached like get_admin_orders(); user status changes
+    clear them.
     """
-    # Get users based on filters
+    check_cursor(cursor)
+    page, cursor = page_or_cursor(page, cursor, search)
+    body = await admin_list_cache.get_or_compute(
+        ("admin:users", page, per_page, search, status_filter, cursor),
+        lambda: _render_admin_users(page, per_page, search, status_filter, cursor),
+    )
+    return etag_json_response(request, body)
+
+
+async def _render_admin_users(
+    page: Optional[int],
+    per_page: int,
+    search: Optional[str],
+    status_filter: Optional[str],
+    cursor: Optional[str],
+) -> bytes:
+    """Build one page of get_admin_users() as JSON bytes."""
+    next_cursor = None
     if search:
+        # Substring search can't be expressed as a Firestore query, so
+        # matches are collected, filtered and paginated in Python
         all_users = await user_repo.search_users(search, limit=500)
-    else:
-        all_users = await user_repo.get_all_users(limit=500)
 
-    # Apply status filter
-    if status_filter:
-        if status_filter == "active":
-            all_users = [u for u in all_users if u.get("is_active", True)]
-        elif status_filter == "inactive":
-            all_users = [u for u in all_users if not u.get("is_active", True)]
-        elif status_filter == "admin":
-            all_users = [u for u in all_users if u.get("is_admin", False)]
-
-    # Calculate pagination
-    total = len(all_users)
-    start = (page - 1) * per_page
-    end = start + per_page
-    paginated_users = all_users[start:end]
-    has_more = end < total
+        # Apply status filter (unknown values leave the list unfiltered)
+        predicate = USER_STATUS_PREDICATES.get(status_filter)
+        if predicate:
+            all_users = list(filter(predicate, all_users))
 
-    # Transform to response model with order stats
-    user_responses = []
-    for user in paginated_users:
-        # Fetch order stats for user
-        user_orders = await order_repo.get_user_orders(user.get("id", ""), limit=1000)
-        order_count = len(user_orders)
-        total_spent = sum(float(o.get("total", 0)) for o in user_orders)
-
-        user_responses.append(AdminUserResponse(
-            id=user.get("id", ""),
-            email=user.get("email", ""),
-            first_name=user.get("first_name", ""),
-            last_name=user.get("last_name", ""),
-            phone=user.get("phone"),
-            is_active=user.get("is_active", True),
-            is_admin=user.get("is_admin", False),
-            order_count=order_count,
-            total_spent=total_spent,
-            created_at=user.get("created_at"),
-            last_login=user.get("last_login"),
-        ))
-
-    return AdminUserListResponse(
-        users=user_responses,
-        total=total,
-        page=page,
-        per_page=per_page,
-        has_more=has_more,
+        total = len(all_users)
+        start = (page - 1) * per_page
+        end = start + per_page
+        paginated_users = all_users[start:end]
+        has_more = end < total
+    else:
+        # Firestore filters, sorts and pages; one extra row tells us
+        # whether another page exists
+        paginated_users, total = await asyncio.gather(
+            user_repo.get_all_users(
+                status=status_filter,
+                cursor=cursor,
+                limit=per_page + 1,
+                offset=0 if cursor else (page - 1) * per_page,
+            ),
+            admin_list_cache.get_or_compute(
+                ("admin:users", "total", status_filter),
+                lambda: user_repo.count_users(status_filter),
+            ),
+        )
+        has_more = len(paginated_users) > per_page
+        paginated_users = paginated_users[:per_page]
+        if has_more:
+            next_cursor = encode_cursor(paginated_users[-1])
+
+    # Order stats normally come straight off the user documents. Users not
+    # yet backfilled need an orders query; run those concurrently, with the
+    # semaphore capping how many Firestore queries are in flight at once.
+    semaphore = asyncio.Semaphore(ADMIN_FANOUT_LIMIT)
+
+    async def fetch_stats(user: Dict[str, Any]) -> Tuple[int, float]:
+        async with semaphore:
+            return await user_order_stats(user)
+
+    stats_per_user = await asyncio.gather(
+        *(fetch_stats(user) for user in paginated_users)
     )
 
+    # Build plain rows with order stats; the page is validated in one call
+    user_rows = [
+        admin_user_row(user, order_count, total_spent)
+        for user, (order_count, total_spent) in zip(paginated_users, stats_per_user)
+    ]
+
+    # Write the validated page straight to JSON instead of letting FastAPI
+    # validate and encode it a second time
+    page_data = AdminUserListResponse.model_validate({
+        "users": user_rows,
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "has_more": has_more,
+        "next_cursor": next_cursor,
+    })
+    return page_data.to_json()
+
 
 @router.get("/users/{user_id}", response_model=AdminUserResponse)
 async def get_admin_user_detail(
@@ -449,24 +714,10 @@ async def get_admin_user_detail(
             detail="User not found",
         )
 
-    # Fetch order stats
-    user_orders = await order_repo.get_user_orders(user_id, limit=1000)
-    order_count = len(user_orders)
-    total_spent = sum(float(o.get("total", 0)) for o in user_orders)
-
-    return AdminUserResponse(
-        id=user.get("id", ""),
-        email=user.get("email", ""),
-        first_name=user.get("first_name", ""),
-        last_name=user.get("last_name", ""),
-        phone=user.get("phone"),
-        is_active=user.get("is_active", True),
-        is_admin=user.get("is_admin", False),
-        order_count=order_count,
-        total_spent=total_spent,
-        created_at=user.get("created_at"),
-        last_login=user.get("last_login"),
-    )
+    # Order stats (counters on the user document)
+    order_count, total_spent = await user_order_stats(user)
+
+    return AdminUserResponse.model_validate(admin_user_row(user, order_count, total_spent))
 
 
 @router.put("/users/{user_id}/status", response_model=AdminUserResponse)
@@ -519,11 +770,20 @@ async def update_user_status(
             detail="Cannot deactivate admin users",
         )
 
-    # Update user status
-    await user_repo.update(user_id, {"is_active": update.is_active})
+    # Update user status; the order stats for the response are independent
+    # of the write (and usually need no reads), so both go out together
+    update_data = {"is_active": update.is_active}
+    _, (order_count, total_spent) = await asyncio.gather(
+        user_repo.update(user_id, update_data),
+        user_order_stats(user),
+    )
+    invalidate_admin_views("admin:users")
+    # Deactivation must take effect on the user's next request
+    invalidate_cached_user(user_id)
 
-    # Return updated user
-    return await get_admin_user_detail(user_id, admin)
+    # Return the updated user from the document read above - no re-read
+    user.update(update_data)
+    return AdminUserResponse.model_validate(admin_user_row(user, order_count, total_spent))
 
 
 # ==============================================================================
@@ -532,12 +792,13 @@ async def update_user_status(
 
 @router.get("/products")
 async def get_admin_products(
+    request: Request,
     admin: dict = Depends(get_admin_user),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
     search: Optional[str] = Query(None, description="Search by product name"),
     category: Optional[str] = Query(None, description="Filter by category"),
-) -> Dict[str, Any]:
+) -> Response:
     """
     List all products including inactive ones.
 
@@ -557,6 +818,29 @@ async def get_admin_products(
         - page: Current page
         - per_page: Items per page
         - has_more: Whether more pages exist
+
+    Pages are cached like the order and user lists; product writes clear them.
+    """
+    body = await admin_list_cache.get_or_compute(
+        ("admin:products", page, per_page, search, category),
+        lambda: _render_admin_products(page, per_page, search, category),
+    )
+    return etag_json_response(request, body)
+
+
+async def _render_admin_products(
+    page: int,
+    per_page: int,
+    search: Optional[str],
+    category: Optional[str],
+) -> bytes:
+    """
+    Build one page of get_admin_products() as JSON bytes.
+
+    Product documents go to orjson as they are - FastAPI would otherwise
+    walk the whole page through jsonable_encoder before encoding it. Only
+    values orjson can't encode itself (e.g. Firestore timestamps, which
+    subclass datetime) are passed to jsonable_encoder.
     """
     # Get products based on filters
     if search:
@@ -579,13 +863,13 @@ async def get_admin_products(
     paginated_products = all_products[start:end]
     has_more = end < total
 
-    return {
+    return orjson.dumps({
         "products": paginated_products,
         "total": total,
         "page": page,
         "per_page": per_page,
         "has_more": has_more,
-    }
+    }, default=jsonable_encoder)
 
 
 @router.put("/products/{product_id}/toggle-active", response_model=ProductToggleResponse)
@@ -620,6 +904,7 @@ async def toggle_product_active(
     current_status = product.get("is_active", True)
     new_status = not current_status
     await product_repo.update(product_id, {"is_active": new_status})
+    invalidate_admin_views("admin:products")
 
     # Return response
     status_text = "activated" if new_status else "deactivated"
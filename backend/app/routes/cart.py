@@ -58,10 +58,19 @@ STOCK VALIDATION:
 - At checkout: Final stock validation before order
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import Dict, Any, List
+import math
+
+from fastapi import APIRouter, HTTPException, status, Depends, Request, Response
+from typing import Dict, Any, Callable, Iterable, List
 
 from ..auth.dependencies import get_current_user
+from ..cache import (
+    cart_summary_cache,
+    etag_matches,
+    invalidate_cart_summary,
+    make_etag,
+    not_modified,
+)
 from ..models.cart import CartItemAdd, CartItemUpdate, CartResponse, CartSummary
 from ..firebase import cart_repo, product_repo
 
@@ -105,16 +114,31 @@ async def get_or_create_cart(user_id: str) -> Dict[str, Any]:
         cart_data = {
             "user_id": user_id,
             "items": [],
+            "item_count": 0,
+            "subtotal": 0.0,
         }
+        # create() stamps created_at/updated_at onto cart_data, so it
+        # already holds the stored document - no re-read
         cart_id = await cart_repo.create(cart_data)
-        cart = await cart_repo.get_by_id(cart_id)
+        cart = {**cart_data, "id": cart_id}
 
     return cart
 
 
-async def calculate_cart_totals(items: List[Dict[str, Any]]) -> Dict[str, float]:
+def build_cart_view(
+    cart: Dict[str, Any],
+    items: List[Dict[str, Any]],
+    products: Dict[str, Dict[str, Any]],
+) -> Dict[str, Any]:
     """
-    Calculate cart totals from enriched items.
+    Build the cart response from its items and their products.
+
+    Cart items only store product_id and quantity; each one is enriched
+    with current product info (name, price, image, stock). Products that
+    are inactive or deleted are silently removed.
+
+    A single pass over the items builds the enriched list and accumulates
+    the item count and subtotal.
 
     Pricing breakdown:
     - subtotal: Sum of all item subtotals
@@ -125,93 +149,149 @@ async def calculate_cart_totals(items: List[Dict[str, Any]]) -> Dict[str, float]
     India uses inclusive pricing, so no separate tax line.
 
     Args:
-        items: List of enriched cart items with subtotal
+        cart: Cart document (id, user_id, updated_at are used)
+        items: List of {product_id, quantity}
+        products: Product documents by ID (from the short-lived product
+            cache - checkout re-reads products, so stock is always checked
+            against Firestore before an order is placed)
 
     Returns:
-        Dict with subtotal, shipping, and total
+        Complete CartResponse-compatible dict
     """
-    subtotal = sum(item.get("subtotal", 0) for item in items)
+    enriched = []
+    item_count = 0
+    subtotals = []
+
+    for item in items:
+        product = products.get(item["product_id"])
+
+        # Only include active products (inactive ones are silently removed)
+        if not product or not product.get("is_active", True):
+            continue
+
+        stock = product.get("stock_quantity", 0)
+        price = product.get("price", 0)
+        quantity = item.get("quantity", 1)
+        line_subtotal = round(price * quantity, 2)
+
+        enriched.append({
+            "product_id": item["product_id"],
+            "product_name": product.get("name", "Unknown Product"),
+            "product_image": product.get("thumbnail") or (product.get("images", [None])[0] if product.get("images") else None),
+            "price": price,  # Current price (may differ from when added)
+            "quantity": quantity,
+            "subtotal": line_subtotal,
+            "in_stock": stock > 0,
+            "stock_quantity": stock,  # For inventory warnings
+        })
+        item_count += quantity
+        subtotals.append(line_subtotal)
+
+    # fsum adds the floats exactly (one rounding at the end), so the
+    # subtotal doesn't drift with the number or order of items
+    subtotal = math.fsum(subtotals)
     # Free shipping above threshold
     shipping = 0.0 if subtotal >= FREE_SHIPPING_THRESHOLD else SHIPPING_COST
-    total = round(subtotal + shipping, 2)
 
     return {
+        "id": cart["id"],
+        "user_id": cart["user_id"],
+        "items": enriched,
+        "item_count": item_count,
         "subtotal": round(subtotal, 2),
         "shipping": shipping,
-        "total": total,
+        "total": round(subtotal + shipping, 2),
+        "updated_at": cart.get("updated_at"),
     }
 
 
-async def enrich_cart_items(cart_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def cart_etag(cart: Dict[str, Any], products: Dict[str, Dict[str, Any]]) -> str:
     """
-    Enrich cart items with current product data.
+    ETag for the full cart view.
 
-    Cart items only store product_id and quantity.
-    This function fetches current product info (name, price, image, stock)
-    to build the complete response.
+    The view changes when the cart document changes (every write stamps
+    updated_at) or when one of its products changes (price, stock,
+    visibility - product writes stamp updated_at too).
+    """
+    return make_etag(
+        cart["id"],
+        cart.get("updated_at"),
+        *(
+            (products.get(item["product_id"]) or {}).get("updated_at")
+            for item in cart.get("items", [])
+        ),
+    )
 
-    Products that are inactive or deleted are silently removed.
 
-    Args:
-        cart_items: List of {product_id, quantity}
+def summary_fields(cart_view: Dict[str, Any]) -> Dict[str, Any]:
+    """The item_count / subtotal stored on the cart document."""
+    return {
+        "item_count": cart_view["item_count"],
+        "subtotal": cart_view["subtotal"],
+    }
 
-    Returns:
-        List of enriched items with full product details
 
-    Note:
-        This makes N database calls (one per item).
-        For large carts, consider batch fetching.
+async def modify_cart_items(
+    cart: Dict[str, Any],
+    mutate: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+    extra_product_ids: Iterable[str] = (),
+) -> Dict[str, Any]:
     """
-    enriched = []
+    Change a cart's items atomically and return the updated cart response.
 
-    for item in cart_items:
-        product = await product_repo.get_by_id(item["product_id"])
+    The item list is read, changed by mutate() and written back in one
+    Firestore transaction (CartRepository.update_items_atomic), so
+    concurrent changes to the same cart are not lost.
 
-        # Only include active products (inactive ones are silently removed)
-        if product and product.get("is_active", True):
-            stock = product.get("stock_quantity", 0)
-            price = product.get("price", 0)
-            quantity = item.get("quantity", 1)
-
-            enriched.append({
-                "product_id": item["product_id"],
-                "product_name": product.get("name", "Unknown Product"),
-                "product_image": product.get("thumbnail") or (product.get("images", [None])[0] if product.get("images") else None),
-                "price": price,  # Current price (may differ from when added)
-                "quantity": quantity,
-                "subtotal": round(price * quantity, 2),
-                "in_stock": stock > 0,
-                "stock_quantity": stock,  # For inventory warnings
-            })
+    The item count and subtotal are written along with the items, so
+    GET /cart/summary can answer from the cart document alone. Their
+    products are loaded before the transaction starts.
 
-    return enriched
+    Args:
+        cart: Cart document (as read before the change)
+        mutate: Builds the new item list from the stored one; may raise
+            HTTPException to reject the change. May run more than once.
+        extra_product_ids: Products the new list may contain that the
+            cart didn't (e.g. the product being added)
 
+    Returns:
+        CartResponse-compatible dict for the updated cart
 
-def format_cart_response(cart: Dict[str, Any], enriched_items: List[Dict[str, Any]], totals: Dict[str, float]) -> Dict[str, Any]:
+    Raises:
+        404: Cart no longer exists
     """
-    Format cart data for API response.
-
-    Combines cart metadata, enriched items, and calculated totals
-    into a single response matching CartResponse schema.
+    product_ids = [item["product_id"] for item in cart.get("items", [])]
+    product_ids.extend(extra_product_ids)
+    products = await product_repo.get_many_cached(product_ids)
+    loaded = set(product_ids)
+
+    def summarize(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        # A concurrent request may have added a product not loaded above;
+        # the summary is then stored after the transaction instead
+        if any(item["product_id"] not in loaded for item in items):
+            return {}
+        return summary_fields(build_cart_view(cart, items, products))
+
+    updated = await cart_repo.update_items_atomic(cart["id"], mutate, summarize)
+    if updated is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Cart not found"
+        )
+    invalidate_cart_summary(cart["user_id"])
 
-    Args:
-        cart: Raw cart document
-        enriched_items: Items with product details
-        totals: Calculated subtotal, shipping, total
+    items = updated["items"]
+    missing = [item["product_id"] for item in items if item["product_id"] not in loaded]
+    if missing:
+        products = {**products, **await product_repo.get_many_cached(missing)}
 
-    Returns:
-        Complete CartResponse-compatible dict
-    """
-    return {
-        "id": cart["id"],
-        "user_id": cart["user_id"],
-        "items": enriched_items,
-        "item_count": sum(item["quantity"] for item in enriched_items),
-        "subtotal": totals["subtotal"],
-        "shipping": totals["shipping"],
-        "total": totals["total"],
-        "updated_at": cart.get("updated_at"),
-    }
+    cart_data = build_cart_view(updated, items, products)
+    if missing:
+        update_data = summary_fields(cart_data)
+        # update() stamps updated_at onto update_data
+        await cart_repo.update(cart["id"], update_data)
+        cart_data["updated_at"] = update_data["updated_at"]
+    return cart_data
 
 
 # ==============================================================================
@@ -220,8 +300,10 @@ def format_cart_response(cart: Dict[str, Any], enriched_items: List[Dict[str, An
 
 @router.get("", response_model=CartResponse)
 async def get_cart(
+    request: Request,
+    response: Response,
     current_user: Dict[str, Any] = Depends(get_current_user)
-) -> Dict[str, Any]:
+) -> Any:
     """
     Get current user's cart with full details.
 
@@ -245,12 +327,27 @@ async def get_cart(
             "shipping": 0,
             "total": 1500
         }
+
+    Caching:
+        The response carries an ETag. A client sending it back in
+        If-None-Match gets an empty 304 while neither the cart nor its
+        products have changed - the cart is not rebuilt or re-sent.
     """
     cart = await get_or_create_cart(current_user["id"])
-    enriched_items = await enrich_cart_items(cart.get("items", []))
-    totals = await calculate_cart_totals(enriched_items)
+    items = cart.get("items", [])
+    products = await product_repo.get_many_cached([item["product_id"] for item in items])
+
+    etag = cart_etag(cart, products)
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
-    return format_cart_response(cart, enriched_items, totals)
+    # Read-only: the stored summary (item_count / subtotal) is refreshed by
+    # the cart write endpoints, not here
+    cart_data = build_cart_view(cart, items, products)
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    return cart_data
 
 
 @router.get("/summary", response_model=CartSummary)
@@ -267,26 +364,39 @@ async def get_cart_summary(
         CartSummary with item_count and total
 
     Note:
-        This is slightly more expensive than a simple count
-        because we need to fetch product prices for the total.
-        Consider caching if this becomes a bottleneck.
+        Count and subtotal are stored on the cart document whenever the
+        cart changes (and refreshed by GET /cart), so this is a single
+        document read with no product lookups. The total can lag a
+        product price change until the cart is next viewed or modified.
+
+        Every open tab polls this, so the summary is also cached for
+        CART_SUMMARY_CACHE_TTL seconds (see app/cache.py) and dropped
+        whenever the cart changes. Simultaneous misses by one user share a
+        single lookup (which also keeps a brand-new user's tabs from each
+        creating a cart).
     """
-    cart = await get_or_create_cart(current_user["id"])
-    items = cart.get("items", [])
+    user_id = current_user["id"]
+    return await cart_summary_cache.get_or_compute(
+        (user_id,),
+        lambda: load_cart_summary(user_id),
+    )
 
-    # Sum quantities for item count
-    item_count = sum(item.get("quantity", 0) for item in items)
 
-    # Calculate total by fetching current prices
-    total = 0.0
-    for item in items:
-        product = await product_repo.get_by_id(item["product_id"])
-        if product:
-            total += product.get("price", 0) * item.get("quantity", 1)
+async def load_cart_summary(user_id: str) -> Dict[str, Any]:
+    """Read the cart summary behind get_cart_summary()."""
+    cart = await get_or_create_cart(user_id)
+
+    if "item_count" not in cart or "subtotal" not in cart:
+        # Cart last written before the stored summary existed: compute it
+        # without writing (GET stays read-only); the next cart write
+        # stores it
+        items = cart.get("items", [])
+        products = await product_repo.get_many_cached([item["product_id"] for item in items])
+        cart = {**cart, **summary_fields(build_cart_view(cart, items, products))}
 
     return {
-        "item_count": item_count,
-        "total": round(total, 2),
+        "item_count": cart["item_count"],
+        "total": cart["subtotal"],
     }
 
 
@@ -318,8 +428,9 @@ async def add_to_cart(
         POST /cart/items
         {"product_id": "abc123", "quantity": 1}
     """
-    # Verify product exists and is active
-    product = await product_repo.get_by_id(item_data.product_id)
+    # Verify product exists and is active. The cached copy is fine for this
+    # early check - checkout re-validates stock against Firestore.
+    product = await product_repo.get_by_id_cached(item_data.product_id)
     if not product or not product.get("is_active", True):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -336,39 +447,33 @@ async def add_to_cart(
 
     # Get or create cart
     cart = await get_or_create_cart(current_user["id"])
-    items = cart.get("items", [])
-
-    # Check if product already in cart
-    existing_index = next(
-        (i for i, item in enumerate(items) if item["product_id"] == item_data.product_id),
-        None
-    )
-
-    if existing_index is not None:
-        # Product already in cart - increase quantity
-        new_quantity = items[existing_index]["quantity"] + item_data.quantity
-        if new_quantity > stock:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Cannot add more. Only {stock} items available"
-            )
-        items[existing_index]["quantity"] = new_quantity
-    else:
-        # New product - add to cart
-        items.append({
-            "product_id": item_data.product_id,
-            "quantity": item_data.quantity,
-        })
 
-    # Save updated cart
-    await cart_repo.update(cart["id"], {"items": items})
+    def add_item(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Check if product already in cart
+        existing_index = next(
+            (i for i, item in enumerate(items) if item["product_id"] == item_data.product_id),
+            None
+        )
 
-    # Return updated cart with enriched data
-    cart = await cart_repo.get_by_id(cart["id"])
-    enriched_items = await enrich_cart_items(cart.get("items", []))
-    totals = await calculate_cart_totals(enriched_items)
+        if existing_index is not None:
+            # Product already in cart - increase quantity
+            new_quantity = items[existing_index]["quantity"] + item_data.quantity
+            if new_quantity > stock:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Cannot add more. Only {stock} items available"
+                )
+            items[existing_index]["quantity"] = new_quantity
+        else:
+            # New product - add to cart
+            items.append({
+                "product_id": item_data.product_id,
+                "quantity": item_data.quantity,
+            })
+        return items
 
-    return format_cart_response(cart, enriched_items, totals)
+    # Save updated cart (atomically) and return it with enriched data
+    return await modify_cart_items(cart, add_item, [item_data.product_id])
 
 
 @router.put("/items/{product_id}", response_model=CartResponse)
@@ -401,26 +506,10 @@ async def update_cart_item(
         {"quantity": 5}
     """
     cart = await get_or_create_cart(current_user["id"])
-    items = cart.get("items", [])
 
-    # Find item in cart
-    item_index = next(
-        (i for i, item in enumerate(items) if item["product_id"] == product_id),
-        None
-    )
-
-    if item_index is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Item not found in cart"
-        )
-
-    if item_data.quantity == 0:
-        # Quantity 0 = remove item from cart
-        items.pop(item_index)
-    else:
-        # Validate new quantity against stock
-        product = await product_repo.get_by_id(product_id)
+    if item_data.quantity > 0:
+        # Validate new quantity against stock (re-checked at checkout)
+        product = await product_repo.get_by_id_cached(product_id)
         if product:
             stock = product.get("stock_quantity", 0)
             if item_data.quantity > stock:
@@ -429,17 +518,28 @@ async def update_cart_item(
                     detail=f"Only {stock} items available in stock"
                 )
 
-        items[item_index]["quantity"] = item_data.quantity
+    def set_quantity(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Find item in cart
+        item_index = next(
+            (i for i, item in enumerate(items) if item["product_id"] == product_id),
+            None
+        )
 
-    # Save updated cart
-    await cart_repo.update(cart["id"], {"items": items})
+        if item_index is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Item not found in cart"
+            )
 
-    # Return updated cart with enriched data
-    cart = await cart_repo.get_by_id(cart["id"])
-    enriched_items = await enrich_cart_items(cart.get("items", []))
-    totals = await calculate_cart_totals(enriched_items)
+        if item_data.quantity == 0:
+            # Quantity 0 = remove item from cart
+            items.pop(item_index)
+        else:
+            items[item_index]["quantity"] = item_data.quantity
+        return items
 
-    return format_cart_response(cart, enriched_items, totals)
+    # Save updated cart (atomically) and return it with enriched data
+    return await modify_cart_items(cart, set_quantity)
 
 
 @router.delete("/items/{product_id}", response_model=CartResponse)
@@ -466,27 +566,30 @@ async def remove_from_cart(
         DELETE /cart/items/abc123
     """
     cart = await get_or_create_cart(current_user["id"])
-    items = cart.get("items", [])
 
-    # Filter out the item
-    new_items = [item for item in items if item["product_id"] != product_id]
-
-    # Check if anything was actually removed
-    if len(new_items) == len(items):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Item not found in cart"
+    def item_index(items: List[Dict[str, Any]]) -> int:
+        index = next(
+            (i for i, item in enumerate(items) if item["product_id"] == product_id),
+            None
         )
+        if index is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Item not found in cart"
+            )
+        return index
 
-    # Save updated cart
-    await cart_repo.update(cart["id"], {"items": new_items})
+    # Not in the cart we just read: reject without loading products or
+    # starting a transaction
+    item_index(cart.get("items", []))
 
-    # Return updated cart with enriched data
-    cart = await cart_repo.get_by_id(cart["id"])
-    enriched_items = await enrich_cart_items(cart.get("items", []))
-    totals = await calculate_cart_totals(enriched_items)
+    def remove_item(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Checked again - the cart may have changed since it was read
+        items.pop(item_index(items))
+        return items
 
-    return format_cart_response(cart, enriched_items, totals)
+    # Save updated cart (atomically) and return it with enriched data
+    return await modify_cart_items(cart, remove_item)
 
 
 @router.delete("", status_code=status.HTTP_204_NO_CONTENT)
@@ -507,3 +610,4 @@ async def clear_cart(
         This preserves the cart ID for future use.
     """
     await cart_repo.clear_cart(current_user["id"])
+    invalidate_cart_summary(current_user["id"])
@@ -28,8 +28,8 @@ ORDER FLOW:
 4. POST /orders creates order:
    a. Validate cart items and stock
    b. Lock prices at order time
-   c. Create order document
-   d. Reduce product stock
+   c. Reserve product stock (atomic check-and-decrement)
+   d. Create order document
    e. Clear user's cart
    f. Send confirmation email
 5. Return PaymentConfirmation
@@ -67,10 +67,12 @@ EMAIL NOTIFICATIONS:
 - (Future: Shipping updates, delivery confirmation)
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends, Query
-from typing import Dict, Any, List
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status, Depends, Query, Response
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
-import uuid
+import asyncio
+import math
+import secrets
 
 from ..auth.dependencies import get_current_user
 from ..models.order import (
@@ -82,8 +84,14 @@ from ..models.order import (
     PaymentStatus,
     PaymentMethod,
 )
-from ..firebase import order_repo, cart_repo, product_repo, address_repo, user_repo
-from ..email import email_service
+from ..firebase import (
+    InsufficientStock, order_repo, cart_repo, product_repo, address_repo, user_repo,
+    encode_cursor, decode_cursor,
+)
+from ..cache import (
+    invalidate_admin_views, invalidate_cart_summary, invalidate_order_list, order_list_cache, order_list_key,
+)
+from ..email import email_service, send_with_retry
 import logging
 
 # Logger for error tracking
@@ -119,7 +127,7 @@ def generate_order_number() -> str:
         Unique order number string
     """
     timestamp = datetime.utcnow().strftime("%Y%m%d")
-    unique_id = uuid.uuid4().hex[:8].upper()
+    unique_id = secrets.token_hex(4).upper()
     return f"ORD-{timestamp}-{unique_id}"
 
 
@@ -135,10 +143,18 @@ def generate_transaction_id() -> str:
     Returns:
         Unique transaction ID string
     """
-    return f"TXN-{uuid.uuid4().hex[:12].upper()}"
+    return f"TXN-{secrets.token_hex(6).upper()}"
+
+
+def customer_name(user: Dict[str, Any]) -> str:
+    """Name used to greet the customer in order emails."""
+    return f"{user.get('first_name', '')} {user.get('last_name', '')}".strip() or 'Customer'
 
 
-async def build_order_items(cart_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def build_order_items(
+    cart_items: List[Dict[str, Any]],
+    products: Dict[str, Dict[str, Any]],
+) -> List[Dict[str, Any]]:
     """
     Build order items from cart items with current product data.
 
@@ -149,6 +165,8 @@ async def build_order_items(cart_items: List[Dict[str, Any]]) -> List[Dict[str,
 
     Args:
         cart_items: List of {product_id, quantity}
+        products: product_id -> product for every item, read in one
+            product_repo.get_many() batch instead of one get_by_id() per item
 
     Returns:
         List of order items with price snapshots
@@ -163,7 +181,7 @@ async def build_order_items(cart_items: List[Dict[str, Any]]) -> List[Dict[str,
     order_items = []
 
     for item in cart_items:
-        product = await product_repo.get_by_id(item["product_id"])
+        product = products.get(item["product_id"])
 
         # Validate product exists and is active
         if not product or not product.get("is_active", True):
@@ -194,25 +212,67 @@ async def build_order_items(cart_items: List[Dict[str, Any]]) -> List[Dict[str,
     return order_items
 
 
-async def update_product_stock(order_items: List[Dict[str, Any]]) -> None:
+def stock_deltas(items: List[Dict[str, Any]], sign: int) -> Dict[str, int]:
+    """Total ordered quantity per product, multiplied by sign (+1 / -1)."""
+    deltas: Dict[str, int] = {}
+    for item in items:
+        deltas[item["product_id"]] = deltas.get(item["product_id"], 0) + sign * item["quantity"]
+    return deltas
+
+
+async def reserve_product_stock(order_items: List[Dict[str, Any]]) -> None:
     """
-    Reduce product stock after order placement.
+    Reduce product stock before the order is saved.
 
-    Called after order is successfully created.
-    Stock is reduced by the quantity ordered.
+    build_order_items() checks stock on a plain read, so two customers
+    buying the last unit at the same time would both pass it. Here the
+    check is repeated inside the Firestore transaction that writes the
+    decrement (ProductRepository.adjust_stock with require_stock=True):
+    only one of them gets the unit, the other gets a 400 and no order.
 
     Args:
         order_items: List of order items with quantity
 
+    Raises:
+        400: A product no longer has enough stock (nothing is reduced)
+
     Note:
-        Stock can't go below 0 (max() ensures this).
         If order is cancelled, stock is restored.
     """
-    for item in order_items:
-        product = await product_repo.get_by_id(item["product_id"])
-        if product:
-            new_stock = max(0, product.get("stock_quantity", 0) - item["quantity"])
-            await product_repo.update(item["product_id"], {"stock_quantity": new_stock})
+    try:
+        await product_repo.adjust_stock(stock_deltas(order_items, -1), require_stock=True)
+    except InsufficientStock as e:
+        name = next(
+            item["product_name"] for item in order_items
+            if item["product_id"] == e.product_id
+        )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Insufficient stock for {name}. Only {e.available} available."
+        )
+
+
+# Fields of an OrderResponse and the value used when an order document
+# lacks one. The empty list/dict are shared by every response that uses
+# them, so they must never be mutated.
+ORDER_DEFAULTS: Dict[str, Any] = {
+    "order_number": "",
+    "user_id": "",
+    "items": [],
+    "shipping_address": {},
+    "status": OrderStatus.PENDING,
+    "payment_method": PaymentMethod.COD,
+    "payment_status": PaymentStatus.PENDING,
+    "subtotal": 0,
+    "shipping_cost": 0,
+    "discount": 0,
+    "total": 0,
+    "notes": None,
+    "created_at": None,
+    "updated_at": None,
+    "estimated_delivery": None,
+}
+ORDER_RESPONSE_FIELDS = ("id", *ORDER_DEFAULTS)
 
 
 def format_order_response(order: Dict[str, Any]) -> Dict[str, Any]:
@@ -220,7 +280,8 @@ def format_order_response(order: Dict[str, Any]) -> Dict[str, Any]:
     Format raw order document for API response.
 
     Transforms Firestore document into OrderResponse-compatible dict.
-    Provides defaults for missing fields.
+    Provides defaults for missing fields (ORDER_DEFAULTS) and drops
+    fields the response doesn't include.
 
     Args:
         order: Raw order document from Firestore
@@ -228,24 +289,8 @@ def format_order_response(order: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Formatted order dict matching OrderResponse schema
     """
-    return {
-        "id": order["id"],
-        "order_number": order.get("order_number", ""),
-        "user_id": order.get("user_id", ""),
-        "items": order.get("items", []),
-        "shipping_address": order.get("shipping_address", {}),
-        "status": order.get("status", OrderStatus.PENDING),
-        "payment_method": order.get("payment_method", PaymentMethod.COD),
-        "payment_status": order.get("payment_status", PaymentStatus.PENDING),
-        "subtotal": order.get("subtotal", 0),
-        "shipping_cost": order.get("shipping_cost", 0),
-        "discount": order.get("discount", 0),
-        "total": order.get("total", 0),
-        "notes": order.get("notes"),
-        "created_at": order.get("created_at"),
-        "updated_at": order.get("updated_at"),
-        "estimated_delivery": order.get("estimated_delivery"),
-    }
+    merged = {**ORDER_DEFAULTS, **order}
+    return {field: merged[field] for field in ORDER_RESPONSE_FIELDS}
 
 
 # ==============================================================================
@@ -256,42 +301,88 @@ def format_order_response(order: Dict[str, Any]) -> Dict[str, Any]:
 async def list_orders(
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(10, ge=1, le=50, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     current_user: Dict[str, Any] = Depends(get_current_user)
-) -> Dict[str, Any]:
+) -> Response:
     """
     Get all orders for current user (order history).
 
     Returns paginated list of orders sorted by creation date (newest first).
     Used for the "My Orders" page in user profile.
 
+    Firestore filters, sorts and pages the orders, so only the requested
+    page is downloaded. Following next_cursor costs the same for every
+    page; page numbers still work but skipped orders are billed as reads.
+
     Query Parameters:
         page: Page number (1-indexed)
         per_page: Orders per page (1-50)
+        cursor: Resume after this order (takes precedence over page)
 
     Returns:
         OrderListResponse with orders and pagination info
 
+    Raises:
+        400: Malformed cursor
+
     Authorization:
         Requires authenticated user
 
     Example:
         GET /orders?page=1&per_page=10
+        GET /orders?per_page=10&cursor=<next_cursor>
     """
-    # Fetch all orders for this user
-    orders = await order_repo.get_user_orders(current_user["id"])
-
-    # Calculate pagination
-    total = len(orders)
-    start = (page - 1) * per_page
-    end = start + per_page
-    paginated = orders[start:end]
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
 
-    return {
-        "orders": [format_order_response(o) for o in paginated],
-        "total": total,
-        "page": page,
-        "per_page": per_page,
-    }
+    # Reloading the orders page is served from the cache; order writes
+    # for this user drop their cached pages
+    body = await order_list_cache.get_or_compute(
+        order_list_key(current_user["id"], page, per_page, cursor),
+        lambda: _load_order_page(current_user["id"], page, per_page, cursor),
+    )
+    return Response(body, media_type="application/json")
+
+
+async def _load_order_page(
+    user_id: str,
+    page: int,
+    per_page: int,
+    cursor: Optional[str],
+) -> bytes:
+    """Read one page of list_orders() from Firestore, as JSON bytes."""
+    # The page (plus one extra row telling whether another page exists)
+    # and the total are independent queries, so both go out together
+    orders, total = await asyncio.gather(
+        order_repo.get_user_orders_page(
+            user_id,
+            limit=per_page + 1,
+            offset=(page - 1) * per_page,
+            cursor=cursor,
+        ),
+        order_repo.count_user_orders(user_id),
+    )
+    has_more = len(orders) > per_page
+    orders = orders[:per_page]
+
+    # Orders come from our own writes, so skip re-validating every nested
+    # model and write the page straight to JSON - returning the model would
+    # make FastAPI dump and validate it against response_model again
+    # (response_model is kept for the docs)
+    return OrderListResponse.from_firestore_page(
+        [format_order_response(o) for o in orders],
+        page=page,
+        per_page=per_page,
+        total=total,
+        has_more=has_more,
+        next_cursor=encode_cursor(orders[-1]) if has_more else None,
+    ).to_json()
 
 
 @router.get("/{order_id}", response_model=OrderResponse)
@@ -338,7 +429,8 @@ async def get_order(
 @router.post("", response_model=PaymentConfirmation, status_code=status.HTTP_201_CREATED)
 async def create_order(
     order_data: OrderCreate,
-    current_user: Dict[str, Any] = Depends(get_current_user)
+    background_tasks: BackgroundTasks,
+    current_user: Dict[str, Any] = Depends(get_current_user),
 ) -> Dict[str, Any]:
     """
     Create a new order (checkout flow).
@@ -377,8 +469,24 @@ async def create_order(
         In production, card/UPI payments would redirect to
         a payment gateway and use webhooks for confirmation.
     """
+    # Steps 1-2 read the address and (for cart checkout) the cart; neither
+    # read depends on the other, so both go out together. The user was
+    # already loaded by get_current_user.
+    if order_data.items:
+        # Buy Now names its products in the request, so they are read
+        # alongside the address instead of waiting for another round-trip
+        address, products = await asyncio.gather(
+            address_repo.get_by_id(order_data.address_id),
+            product_repo.get_many([item.product_id for item in order_data.items]),
+        )
+        cart = None
+    else:
+        address, cart = await asyncio.gather(
+            address_repo.get_by_id(order_data.address_id),
+            cart_repo.get_user_cart(current_user["id"]),
+        )
+
     # Step 1: Validate shipping address belongs to user
-    address = await address_repo.get_by_id(order_data.address_id)
     if not address or address.get("user_id") != current_user["id"]:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -391,16 +499,16 @@ async def create_order(
         cart_items = [{"product_id": i.product_id, "quantity": i.quantity} for i in order_data.items]
     else:
         # Cart checkout - use cart contents
-        cart = await cart_repo.get_user_cart(current_user["id"])
         if not cart or not cart.get("items"):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cart is empty"
             )
         cart_items = cart.get("items", [])
+        products = await product_repo.get_many([item["product_id"] for item in cart_items])
 
     # Step 3: Build order items (validates stock, locks prices)
-    order_items = await build_order_items(cart_items)
+    order_items = build_order_items(cart_items, products)
 
     if not order_items:
         raise HTTPException(
@@ -409,7 +517,8 @@ async def create_order(
         )
 
     # Step 4: Calculate totals
-    subtotal = sum(item["subtotal"] for item in order_items)
+    # Same exact float sum as the cart (build_cart_view)
+    subtotal = math.fsum(item["subtotal"] for item in order_items)
     shipping = 0.0 if subtotal >= FREE_SHIPPING_THRESHOLD else SHIPPING_COST
     total = round(subtotal + shipping, 2)
 
@@ -444,6 +553,12 @@ async def create_order(
     order_doc = {
         "order_number": order_number,
         "user_id": current_user["id"],
+        # Customer snapshot for the admin order views (no user read per
+        # order) and the admin email search
+        "user_email": current_user.get("email", ""),
+        "user_first_name": current_user.get("first_name", ""),
+        "user_last_name": current_user.get("last_name", ""),
+        "user_phone": current_user.get("phone"),
         "items": order_items,
         "shipping_address": shipping_address,
         "status": OrderStatus.CONFIRMED,  # Skip PENDING - orders confirmed immediately
@@ -458,30 +573,46 @@ async def create_order(
         "estimated_delivery": estimated_delivery,
     }
 
-    # Step 10: Save order to Firestore
-    order_id = await order_repo.create(order_doc)
-
-    # Step 11: Reduce product stock
-    await update_product_stock(order_items)
-
-    # Step 12: Clear cart (only if order was from cart, not Buy Now)
-    if not order_data.items:
-        await cart_repo.clear_cart(current_user["id"])
-
-    # Step 13: Send confirmation email (non-blocking)
+    # Step 10: Reserve stock, then save the order to Firestore and bump the
+    # user's order counters (order_count / total_spent, read by the admin
+    # user list). If the order can't be saved, the reserved stock goes back.
+    await reserve_product_stock(order_items)
     try:
-        order_doc["id"] = order_id
-        user_name = f"{current_user.get('first_name', '')} {current_user.get('last_name', '')}".strip() or 'Customer'
-        email_service.send_order_confirmation(
-            to_email=current_user.get('email', ''),
-            order=order_doc,
-            user_name=user_name
-        )
+        order_id = await order_repo.create(order_doc)
+    except Exception:
+        await product_repo.adjust_stock(stock_deltas(order_items, +1))
+        raise
+    try:
+        await user_repo.increment_order_stats(current_user, total)
     except Exception as e:
-        # Log but don't fail the order
-        logger.error(f"Failed to send order confirmation email: {e}")
-
-    # Step 14: Return payment confirmation
+        # The order already exists - a 500 here would make the client
+        # retry and place it twice. The admin stats fall back to summing
+        # orders for users without counters; others are off by this order
+        # until backfilled.
+        logger.error(f"Failed to update order stats for user {current_user['id']}: {e}")
+    invalidate_order_list(current_user["id"])
+    # New order, the buyer's order counters and product stock all show
+    # up in the admin lists and dashboard stats
+    invalidate_admin_views("admin:orders", "admin:users", "admin:products")
+
+    # Step 11: Clear cart (only if order was from cart, not Buy Now)
+    if not order_data.items:
+        await cart_repo.clear_cart(current_user["id"])
+        invalidate_cart_summary(current_user["id"])
+
+    # Step 12: Send confirmation email (non-blocking)
+    # Runs after the response is sent, so SMTP latency and retries never
+    # delay checkout; failures are logged, the order stands
+    order_doc["id"] = order_id
+    background_tasks.add_task(
+        send_with_retry,
+        email_service.send_order_confirmation,
+        to_email=current_user.get('email', ''),
+        order=order_doc,
+        user_name=customer_name(current_user),
+    )
+
+    # Step 13: Return payment confirmation
     return {
         "success": True,
         "order_id": order_id,
@@ -496,6 +627,7 @@ async def create_order(
 @router.post("/{order_id}/cancel")
 async def cancel_order(
     order_id: str,
+    background_tasks: BackgroundTasks,
     current_user: Dict[str, Any] = Depends(get_current_user)
 ) -> Dict[str, str]:
     """
@@ -546,28 +678,50 @@ async def cancel_order(
         "status": OrderStatus.CANCELLED,
         "payment_status": PaymentStatus.CANCELLED,
     })
+    invalidate_order_list(current_user["id"])
 
-    # Restore product stock (add back the ordered quantities)
-    for item in order.get("items", []):
-        product = await product_repo.get_by_id(item["product_id"])
-        if product:
-            new_stock = product.get("stock_quantity", 0) + item["quantity"]
-            await product_repo.update(item["product_id"], {"stock_quantity": new_stock})
+    # Restore product stock (add back the ordered quantities) atomically
+    await product_repo.adjust_stock(stock_deltas(order.get("items", []), +1))
+    invalidate_admin_views("admin:orders", "admin:products")
 
     # Send cancellation email (non-blocking)
-    try:
-        user_name = f"{current_user.get('first_name', '')} {current_user.get('last_name', '')}".strip() or 'Customer'
-        email_service.send_order_cancellation(
-            to_email=current_user.get('email', ''),
-            order=order,
-            user_name=user_name
-        )
-    except Exception as e:
-        logger.error(f"Failed to send order cancellation email: {e}")
+    background_tasks.add_task(
+        send_with_retry,
+        email_service.send_order_cancellation,
+        to_email=current_user.get('email', ''),
+        order=order,
+        user_name=customer_name(current_user),
+    )
 
     return {"message": "Order cancelled successfully"}
 
 
+# Steps of the tracking timeline, in delivery order. Only the first two
+# have timestamps; the others would come from the warehouse system and
+# courier integration.
+TIMELINE_STEPS = (
+    (OrderStatus.PENDING, "Order Placed"),
+    (OrderStatus.CONFIRMED, "Order Confirmed"),
+    (OrderStatus.PROCESSING, "Processing"),
+    (OrderStatus.SHIPPED, "Shipped"),
+    (OrderStatus.OUT_FOR_DELIVERY, "Out for Delivery"),
+    (OrderStatus.DELIVERED, "Delivered"),
+)
+
+# Position of each status on the timeline; a step is completed once the
+# order's rank reaches it. Statuses off the timeline (cancelled, returned,
+# refunded) rank like a placed order.
+_STATUS_RANK = {step: rank for rank, (step, _) in enumerate(TIMELINE_STEPS)}
+
+# One timeline entry per step, built once. track_order() copies each entry
+# and overrides what depends on the order, so these dicts are shared by
+# every request and must never be mutated.
+_TIMELINE_TEMPLATE = tuple(
+    {"status": step, "label": label, "completed": False, "timestamp": None}
+    for step, label in TIMELINE_STEPS
+)
+
+
 @router.get("/{order_id}/track")
 async def track_order(
     order_id: str,
@@ -620,44 +774,14 @@ async def track_order(
 
     # Build tracking timeline with completion status
     # Each step is marked complete if current status is at or past that step
+    rank = _STATUS_RANK.get(status, 0)
     timeline = [
-        {
-            "status": OrderStatus.PENDING,
-            "label": "Order Placed",
-            "completed": True,  # Always complete once order exists
-            "timestamp": order.get("created_at"),
-        },
-        {
-            "status": OrderStatus.CONFIRMED,
-            "label": "Order Confirmed",
-            "completed": status in [OrderStatus.CONFIRMED, OrderStatus.PROCESSING, OrderStatus.SHIPPED, OrderStatus.OUT_FOR_DELIVERY, OrderStatus.DELIVERED],
-            "timestamp": order.get("updated_at") if status != OrderStatus.PENDING else None,
-        },
-        {
-            "status": OrderStatus.PROCESSING,
-            "label": "Processing",
-            "completed": status in [OrderStatus.PROCESSING, OrderStatus.SHIPPED, OrderStatus.OUT_FOR_DELIVERY, OrderStatus.DELIVERED],
-            "timestamp": None,  # Would be populated by warehouse system
-        },
-        {
-            "status": OrderStatus.SHIPPED,
-            "label": "Shipped",
-            "completed": status in [OrderStatus.SHIPPED, OrderStatus.OUT_FOR_DELIVERY, OrderStatus.DELIVERED],
-            "timestamp": None,  # Would come from courier integration
-        },
-        {
-            "status": OrderStatus.OUT_FOR_DELIVERY,
-            "label": "Out for Delivery",
-            "completed": status in [OrderStatus.OUT_FOR_DELIVERY, OrderStatus.DELIVERED],
-            "timestamp": None,
-        },
-        {
-            "status": OrderStatus.DELIVERED,
-            "label": "Delivered",
-            "completed": status == OrderStatus.DELIVERED,
-            "timestamp": None,  # Would be delivery confirmation time
-        },
+        {**entry, "completed": step_rank <= rank}
+        for step_rank, entry in enumerate(_TIMELINE_TEMPLATE)
     ]
+    timeline[0]["timestamp"] = order.get("created_at")
+    if status != OrderStatus.PENDING:
+        timeline[1]["timestamp"] = order.get("updated_at")
 
     return {
         "order_id": order_id,
@@ -57,55 +57,48 @@ Instead, is_active is set to False.
 This preserves order history that references the product.
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
 from typing import Dict, Any, List, Optional
+from pydantic import TypeAdapter
 
 from ..auth.dependencies import get_current_user_optional, get_admin_user
+from ..cache import admin_list_cache
 from ..models.product import (
-    ProductCreate,
-    ProductUpdate,
+    calculate_discount,
+    CategoryResponse,
     ProductResponse,
     ProductListResponse,
+    ProductListResponseTD,
 )
+from ..models.product_admin import ProductCreate, ProductUpdate
 from ..firebase import product_repo
 
 # Create router with prefix and tag for OpenAPI docs
 router = APIRouter(prefix="/products", tags=["Products"])
 
+# Serializes a whole list of products in one pydantic-core call.
+# Built once at import - constructing a TypeAdapter compiles a schema.
+_PRODUCTS_ADAPTER = TypeAdapter(List[ProductResponse])
 
-# ==============================================================================
-# HELPER FUNCTIONS
-# ==============================================================================
-
-def calculate_discount(price: float, original_price: Optional[float]) -> Optional[int]:
-    """
-    Calculate discount percentage from original and current price.
+# Serializes a whole product page from plain dicts (no model instances).
+_PRODUCT_LIST_ADAPTER = TypeAdapter(ProductListResponseTD)
 
-    Formula: ((original - current) / original) * 100, rounded to integer
+# Product documents are only ever written through ProductCreate/ProductUpdate,
+# so data read back from Firestore is already valid and read endpoints skip
+# re-validating it: response models are built with model_construct().
 
-    Args:
-        price: Current selling price
-        original_price: Original price before discount
-
-    Returns:
-        Discount percentage (0-100) or None if no discount
-
-    Example:
-        calculate_discount(800, 1000) -> 20  (20% off)
-        calculate_discount(1000, 1000) -> None (no discount)
-    """
-    if original_price and original_price > price:
-        return int(((original_price - price) / original_price) * 100)
-    return None
 
+# ==============================================================================
+# HELPER FUNCTIONS
+# ==============================================================================
 
 def format_product_response(product: Dict[str, Any]) -> Dict[str, Any]:
     """
     Format raw Firestore product data for API response.
 
     Transforms database document into ProductResponse-compatible dict.
-    Calculates derived fields: discount_percentage, in_stock.
-    Falls back to first image if thumbnail not set.
+    Falls back to first image if thumbnail not set. The derived fields
+    (discount_percentage, in_stock) are computed fields on ProductResponse.
 
     Args:
         product: Raw product document from Firestore
@@ -117,23 +110,21 @@ def format_product_response(product: Dict[str, Any]) -> Dict[str, Any]:
         This function is called for every product in listings,
         so it should be fast. Avoid database calls here.
     """
-    price = product.get("price", 0)
-    original_price = product.get("original_price")
-    stock = product.get("stock_quantity", 0)
-
+    # Keys are string literals, which CPython interns at compile time, so
+    # the dict handed to ProductResponse.model_construct() already hits the
+    # identity fast path on key lookups. Keep them literal - keys copied
+    # from the Firestore document would be fresh string objects.
     return {
         "id": product["id"],
         "name": product.get("name", ""),
         "name_lower": product.get("name_lower", ""),
         "description": product.get("description", ""),
-        "price": price,
-        "original_price": original_price,
-        "discount_percentage": calculate_discount(price, original_price),
+        "price": product.get("price", 0),
+        "original_price": product.get("original_price"),
         "category": product.get("category", ""),
         "brand": product.get("brand"),
         "sku": product.get("sku"),
-        "stock_quantity": stock,
-        "in_stock": stock > 0,  # Derived from stock_quantity
+        "stock_quantity": product.get("stock_quantity", 0),
         "images": product.get("images", []),
         # Fallback: use first image if no thumbnail
         "thumbnail": product.get("thumbnail") or (product.get("images", [None])[0] if product.get("images") else None),
@@ -146,6 +137,35 @@ def format_product_response(product: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def product_list_row(product: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Format a product for the TypedDict list path.
+
+    Same as format_product_response() plus the values ProductResponse
+    exposes as computed fields, since a plain dict has no properties.
+    """
+    row = format_product_response(product)
+    row["discount_percentage"] = calculate_discount(row["price"], row["original_price"])
+    row["in_stock"] = row["stock_quantity"] > 0
+    return row
+
+
+def bulk_from_docs(docs: List[Dict[str, Any]]) -> List[ProductResponse]:
+    """
+    Turn raw Firestore product documents into ProductResponse models.
+
+    Uses model_construct() - the documents are trusted, so there is no
+    per-field validation.
+
+    Args:
+        docs: Raw product documents from Firestore
+
+    Returns:
+        ProductResponse instances in the same order
+    """
+    return [ProductResponse.model_construct(**format_product_response(d)) for d in docs]
+
+
 # ==============================================================================
 # PUBLIC ENDPOINTS - No authentication required
 # ==============================================================================
@@ -159,7 +179,7 @@ async def list_products(
     max_price: Optional[float] = Query(None, ge=0, description="Maximum price"),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
-) -> Dict[str, Any]:
+) -> Response:
     """
     List products with optional filters and pagination.
 
@@ -215,19 +235,22 @@ async def list_products(
     end = start + per_page
     paginated = products[start:end]
 
-    return {
-        "products": [format_product_response(p) for p in paginated],
+    # Build the page as plain dicts and serialize them straight to JSON bytes
+    # (no per-product model instances; response_model is kept for the docs)
+    page_data = {
+        "products": [product_list_row(p) for p in paginated],
         "total": total,
         "page": page,
         "per_page": per_page,
         "has_more": end < total,  # True if more pages available
     }
+    return Response(_PRODUCT_LIST_ADAPTER.dump_json(page_data), media_type="application/json")
 
 
 @router.get("/featured", response_model=List[ProductResponse])
 async def get_featured_products(
     limit: int = Query(10, ge=1, le=50, description="Number of products")
-) -> List[Dict[str, Any]]:
+) -> Response:
     """
     Get featured products for homepage display.
 
@@ -244,11 +267,12 @@ async def get_featured_products(
         GET /products/featured?limit=8
     """
     products = await product_repo.get_featured(limit=limit)
-    return [format_product_response(p) for p in products if p.get("is_active", True)]
+    featured = bulk_from_docs([p for p in products if p.get("is_active", True)])
+    return Response(_PRODUCTS_ADAPTER.dump_json(featured), media_type="application/json")
 
 
-@router.get("/categories")
-async def get_categories() -> List[Dict[str, Any]]:
+@router.get("/categories", response_model=List[CategoryResponse])
+async def get_categories() -> List[CategoryResponse]:
     """
     Get list of product categories with product counts.
 
@@ -269,36 +293,41 @@ async def get_categories() -> List[Dict[str, Any]]:
         - Categories are computed dynamically from products
         - Empty categories (0 products) are not returned
         - slug is generated from name (lowercase, spaces to dashes)
+        - Names that map to the same slug ("Home Decor" / "home decor")
+          are merged into one category, keeping the first name seen
     """
     # Get all active products
     products = await product_repo.get_all(limit=500)
     products = [p for p in products if p.get("is_active", True)]
 
-    # Count products per category
-    category_counts = {}
+    # Count products per category slug; the slug is computed once per
+    # distinct category name, not once per product
+    slugs: Dict[str, str] = {}
+    names: Dict[str, str] = {}
+    category_counts: Dict[str, int] = {}
     for product in products:
         cat = product.get("category", "Other")
-        if cat in category_counts:
-            category_counts[cat] += 1
-        else:
-            category_counts[cat] = 1
-
-    # Format response with URL-friendly slugs
-    categories = [
-        {
-            "id": cat.lower().replace(" ", "-"),
-            "name": cat,
-            "slug": cat.lower().replace(" ", "-"),
-            "product_count": count,
-        }
-        for cat, count in sorted(category_counts.items())
+        slug = slugs.get(cat)
+        if slug is None:
+            slug = slugs[cat] = cat.lower().replace(" ", "-")
+        names.setdefault(slug, cat)
+        category_counts[slug] = category_counts.get(slug, 0) + 1
+
+    # One frozen CategoryResponse per slug. Values come from our own product
+    # data, so model_construct() skips re-validation.
+    return [
+        CategoryResponse.model_construct(
+            id=slug,
+            name=name,
+            slug=slug,
+            product_count=category_counts[slug],
+        )
+        for slug, name in sorted(names.items(), key=lambda item: item[1])
     ]
 
-    return categories
-
 
 @router.get("/{product_id}", response_model=ProductResponse)
-async def get_product(product_id: str) -> Dict[str, Any]:
+async def get_product(product_id: str) -> Response:
     """
     Get a single product by ID.
 
@@ -318,7 +347,8 @@ async def get_product(product_id: str) -> Dict[str, Any]:
     Example:
         GET /products/abc123xyz
     """
-    product = await product_repo.get_by_id(product_id)
+    # Hot read path - served from the short-lived product cache
+    product = await product_repo.get_by_id_cached(product_id)
 
     if not product:
         raise HTTPException(
@@ -333,7 +363,8 @@ async def get_product(product_id: str) -> Dict[str, Any]:
             detail="Product not found"
         )
 
-    return format_product_response(product)
+    product_model = bulk_from_docs([product])[0]
+    return Response(product_model.to_json(), media_type="application/json")
 
 
 # ==============================================================================
@@ -370,14 +401,13 @@ async def create_product(
             "stock_quantity": 50
         }
     """
-    # Convert Pydantic model to dict
+    # Convert Pydantic model to dict (includes the computed name_lower
+    # search key - Firestore case-insensitive workaround)
     product_dict = product_data.model_dump()
 
-    # Generate lowercase name for search (Firestore case-insensitive workaround)
-    product_dict["name_lower"] = product_data.name.lower()
-
     # Create in Firestore
     product_id = await product_repo.create(product_dict)
+    admin_list_cache.invalidate("admin:products")
 
     # Return created product
     product = await product_repo.get_by_id(product_id)
@@ -421,15 +451,13 @@ async def update_product(
         )
 
     # Build update dict with only non-None values
-    update_dict = {k: v for k, v in update_data.model_dump().items() if v is not None}
-
-    # Update search index if name changed
-    if "name" in update_dict:
-        update_dict["name_lower"] = update_dict["name"].lower()
+    # (name_lower is a computed field, present only when name changes)
+    update_dict = update_data.model_dump(exclude_none=True)
 
     # Apply update
     if update_dict:
         await product_repo.update(product_id, update_dict)
+        admin_list_cache.invalidate("admin:products")
 
     # Return updated product
     updated = await product_repo.get_by_id(product_id)
@@ -471,3 +499,4 @@ async def delete_product(
 
     # Soft delete - just mark as inactive
     await product_repo.update(product_id, {"is_active": False})
+    admin_list_cache.invalidate("admin:products")
@@ -56,7 +56,7 @@ Password hashes are never returned to the client.
 from fastapi import APIRouter, HTTPException, status, Depends
 from typing import Dict, Any
 
-from ..auth.dependencies import get_current_user
+from ..auth.dependencies import get_current_user, invalidate_cached_user
 from ..auth.utils import hash_password, verify_password
 from ..models.user import UserUpdate, UserResponse, PasswordChange
 from ..firebase import user_repo
@@ -134,17 +134,13 @@ async def update_profile(
         Email changes would require re-verification.
     """
     # Build update dictionary with only provided fields
-    update_dict = {}
-    if update_data.first_name is not None:
-        update_dict["first_name"] = update_data.first_name
-    if update_data.last_name is not None:
-        update_dict["last_name"] = update_data.last_name
-    if update_data.phone is not None:
-        update_dict["phone"] = update_data.phone
+    # (exclude_none drops unset fields inside pydantic-core)
+    update_dict = update_data.model_dump(exclude_none=True)
 
     # Apply updates if any
     if update_dict:
         await user_repo.update(current_user["id"], update_dict)
+        invalidate_cached_user(current_user["id"])
 
     # Fetch and return updated user
     updated_user = await user_repo.get_by_id(current_user["id"])
@@ -202,6 +198,7 @@ async def change_password(
     # Hash new password and update
     new_hash = hash_password(password_data.new_password)
     await user_repo.update(current_user["id"], {"password_hash": new_hash})
+    invalidate_cached_user(current_user["id"])
 
     return {"message": "Password updated successfully"}
 
@@ -233,4 +230,5 @@ async def delete_account(
         is_active = True in Firestore.
     """
     await user_repo.update(current_user["id"], {"is_active": False})
+    invalidate_cached_user(current_user["id"])
     return {"message": "Account has been deactivated"}
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+==============================================================================
+ShopEase Listing Fields Backfill (backfill_listing_fields.py)
+==============================================================================
+
+PURPOSE:
+--------
+Adds the fields the paged admin/order listings query on to documents that
+were written without them.
+
+The listings are filtered and sorted by Firestore (see get_page in
+backend/app/firebase.py), and a Firestore query never returns a document
+that lacks a field it orders or filters on:
+- created_at: every listing is ordered by it, so a user or order without
+  it is missing from every page
+- is_active: the "active" user filter is is_active == True, so a user
+  without it (treated as active everywhere else) is missing from the
+  active list
+
+Documents created through the API always have both fields; documents
+imported or written by hand may not.
+
+USAGE:
+------
+    cd /path/to/ecommerce-app
+    python scripts/backfill_listing_fields.py
+
+PREREQUISITES:
+--------------
+1. Firebase credentials configured in backend/.env file
+2. Backend dependencies installed:
+   pip install -r backend/requirements.txt
+
+WHAT THIS SCRIPT DOES:
+----------------------
+1. Initializes Firebase connection
+2. Reads every user and order document
+3. Sets created_at to the document's Firestore creation time where missing
+4. Sets is_active to True on users where missing (the default the rest
+   of the app already assumes)
+
+NOTE:
+-----
+Only missing fields are written, so running it again is safe.
+"""
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+# Fields a user document must have -> value to use when missing
+USER_DEFAULTS = {"is_active": True}
+
+
+def missing_listing_fields(doc, defaults=None):
+    """
+    Build the update that adds the listing fields a document lacks.
+
+    Args:
+        doc: Firestore document snapshot
+        defaults: Extra field -> value pairs to add when missing
+
+    Returns:
+        Dict of fields to write (empty when nothing is missing)
+    """
+    data = doc.to_dict()
+    update = {}
+    if data.get("created_at") is None:
+        # Best available value: when Firestore first stored the document
+        update["created_at"] = doc.create_time
+    for field, value in (defaults or {}).items():
+        if field not in data:
+            update[field] = value
+    return update
+
+
+def backfill_collection(collection, defaults=None):
+    """Write the missing listing fields to every document in a collection."""
+    from app.firebase import get_db
+
+    print(f"\nChecking {collection.id}...")
+
+    db = get_db()
+    batch = db.batch()
+    pending = 0
+    updated = 0
+
+    for doc in collection.stream():
+        update = missing_listing_fields(doc, defaults)
+        if not update:
+            continue
+        batch.update(doc.reference, update)
+        pending += 1
+        updated += 1
+
+        # Firestore allows at most 500 writes per batch
+        if pending == 500:
+            batch.commit()
+            batch = db.batch()
+            pending = 0
+
+    if pending:
+        batch.commit()
+
+    print(f"  Updated {updated} documents")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("ShopEase Listing Fields Backfill")
+    print("=" * 60)
+
+    try:
+        from app.firebase import init_firebase, order_repo, user_repo
+
+        print("\nInitializing Firebase...")
+        init_firebase()
+
+        backfill_collection(user_repo.collection, USER_DEFAULTS)
+        backfill_collection(order_repo.collection)
+
+        print("\n" + "=" * 60)
+        print("Done!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\nError: {e}")
+        print("\nMake sure you have:")
+        print("  1. Set up Firebase credentials in .env file")
+        print("  2. Installed all requirements")
+        sys.exit(1)
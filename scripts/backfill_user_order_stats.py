@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+==============================================================================
+ShopEase User Order Stats Backfill (backfill_user_order_stats.py)
+==============================================================================
+
+PURPOSE:
+--------
+Fills in the order_count and total_spent counters on every user document.
+
+New orders keep these counters up to date (create_order increments them,
+seeding them from the user's earlier orders the first time), and the admin
+user list reads them instead of loading each user's orders. Users who
+placed orders before the counters existed and haven't ordered since need
+this one-off backfill; until then the admin endpoints fall back to summing
+their orders.
+
+USAGE:
+------
+    cd /path/to/ecommerce-app
+    python scripts/backfill_user_order_stats.py
+
+PREREQUISITES:
+--------------
+1. Firebase credentials configured in backend/.env file
+2. Backend dependencies installed:
+   pip install -r backend/requirements.txt
+
+WHAT THIS SCRIPT DOES:
+----------------------
+1. Initializes Firebase connection
+2. Reads every order once and totals order count / amount per user
+3. Writes order_count and total_spent to every user document
+   (users without orders get 0 / 0.0)
+
+NOTE:
+-----
+Run it while the shop is quiet: an order placed between steps 2 and 3 is
+overwritten by the recomputed value. Running it again is safe.
+"""
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+
+def collect_order_stats():
+    """Total order count and amount per user from the orders collection."""
+    from app.firebase import order_repo
+
+    print("Reading orders...")
+
+    stats = {}
+    for doc in order_repo.collection.stream():
+        order = doc.to_dict()
+        user_id = order.get("user_id")
+        if not user_id:
+            continue
+        count, spent = stats.get(user_id, (0, 0.0))
+        stats[user_id] = (count + 1, spent + float(order.get("total", 0)))
+
+    print(f"  Found orders for {len(stats)} users")
+    return stats
+
+
+def write_user_stats(stats):
+    """Write order_count / total_spent to every user document."""
+    from app.firebase import get_db, user_repo
+
+    print("\nUpdating users...")
+
+    db = get_db()
+    batch = db.batch()
+    pending = 0
+    updated = 0
+
+    for doc in user_repo.collection.stream():
+        count, spent = stats.get(doc.id, (0, 0.0))
+        batch.update(doc.reference, {"order_count": count, "total_spent": spent})
+        pending += 1
+        updated += 1
+
+        # Firestore allows at most 500 writes per batch
+        if pending == 500:
+            batch.commit()
+            batch = db.batch()
+            pending = 0
+
+    if pending:
+        batch.commit()
+
+    print(f"  Updated {updated} users")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("ShopEase User Order Stats Backfill")
+    print("=" * 60)
+
+    try:
+        from app.firebase import init_firebase
+
+        print("\nInitializing Firebase...")
+        init_firebase()
+
+        write_user_stats(collect_order_stats())
+
+        print("\n" + "=" * 60)
+        print("Done!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\nError: {e}")
+        print("\nMake sure you have:")
+        print("  1. Set up Firebase credentials in .env file")
+        print("  2. Installed all requirements")
+        sys.exit(1)
@@ -22,6 +22,41 @@ with patch.dict('sys.modules', {
 }):
     from app.main import app
     from app.auth.utils import hash_password, create_access_token
+    from app.auth.dependencies import _user_cache
+    from app.firebase import _product_cache
+    from app.cache import cart_summary_cache, order_list_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    """Stop cached auth users leaking between tests."""
+    _user_cache.clear()
+    yield
+    _user_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_product_cache():
+    """Stop cached products leaking between tests."""
+    _product_cache.clear()
+    yield
+    _product_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_cart_summary_cache():
+    """Stop cached cart summaries leaking between tests."""
+    cart_summary_cache.clear()
+    yield
+    cart_summary_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_order_list_cache():
+    """Stop cached order history pages leaking between tests."""
+    order_list_cache.clear()
+    yield
+    order_list_cache.clear()
 
 
 @pytest.fixture
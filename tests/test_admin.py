@@ -0,0 +1,113 @@
+"""
+Tests for admin user listing filters and pagination.
+"""
+import asyncio
+import importlib.util
+import os
+from datetime import datetime, timezone
+
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+
+
+def _load_backfill_script():
+    """Import scripts/backfill_listing_fields.py (scripts/ is not a package)."""
+    path = os.path.join(os.path.dirname(__file__), '..', 'scripts', 'backfill_listing_fields.py')
+    spec = importlib.util.spec_from_file_location("backfill_listing_fields", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestUserStatusFilters:
+    """Test suite for the Firestore filters behind the admin user list."""
+
+    @pytest.mark.parametrize("status, expected", [
+        ("active", ("is_active", "==", True)),
+        ("inactive", ("is_active", "==", False)),
+        ("admin", ("is_admin", "==", True)),
+        (None, (None, "==", None)),
+        ("unknown", (None, "==", None)),
+    ])
+    def test_get_all_users_filter(self, status, expected):
+        """Each status maps to one Firestore equality filter (unknown: none)."""
+        from app.firebase import user_repo
+
+        with patch.object(user_repo, "get_page", AsyncMock(return_value=[])) as mock_page:
+            asyncio.run(user_repo.get_all_users(status, limit=10))
+
+        assert mock_page.call_args.args == expected
+
+    @pytest.mark.parametrize("status, expected", [
+        ("active", ("is_active", "==", True)),
+        ("inactive", ("is_active", "==", False)),
+        (None, (None, "==", None)),
+    ])
+    def test_count_users_filter(self, status, expected):
+        """Totals use the same filter as the listed page."""
+        from app.firebase import user_repo
+
+        with patch.object(user_repo, "count", AsyncMock(return_value=0)) as mock_count:
+            asyncio.run(user_repo.count_users(status))
+
+        mock_count.assert_called_once_with(*expected)
+
+
+class TestListingFieldsBackfill:
+    """Test suite for the created_at / is_active backfill."""
+
+    @staticmethod
+    def _doc(data):
+        """Document snapshot with canned data and creation time."""
+        return MagicMock(
+            create_time=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            **{"to_dict.return_value": data},
+        )
+
+    def test_user_missing_fields_filled(self):
+        """A user without created_at / is_active gets both."""
+        backfill = _load_backfill_script()
+
+        update = backfill.missing_listing_fields(self._doc({"email": "a@b.com"}), backfill.USER_DEFAULTS)
+
+        assert update == {
+            "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+            "is_active": True,
+        }
+
+    def test_inactive_user_kept(self):
+        """An explicit is_active=False is never overwritten."""
+        backfill = _load_backfill_script()
+        data = {"is_active": False, "created_at": datetime(2023, 5, 1, tzinfo=timezone.utc)}
+
+        assert backfill.missing_listing_fields(self._doc(data), backfill.USER_DEFAULTS) == {}
+
+    def test_order_missing_created_at_filled(self):
+        """Orders only need created_at."""
+        backfill = _load_backfill_script()
+
+        update = backfill.missing_listing_fields(self._doc({"user_id": "u1"}))
+
+        assert update == {"created_at": datetime(2024, 1, 1, tzinfo=timezone.utc)}
+
+
+class TestPageOrCursor:
+    """Test suite for the pagination parameters kept per admin list request."""
+
+    def test_cursor_drops_page(self):
+        """Firestore listings with a cursor ignore the page number."""
+        from app.routes.admin import page_or_cursor
+
+        assert page_or_cursor(3, "abc", None) == (None, "abc")
+
+    def test_search_drops_cursor(self):
+        """Search results are paged by number only."""
+        from app.routes.admin import page_or_cursor
+
+        assert page_or_cursor(3, "abc", "alice") == (3, None)
+
+    def test_page_without_cursor_kept(self):
+        """Plain page-number requests are unchanged."""
+        from app.routes.admin import page_or_cursor
+
+        assert page_or_cursor(2, None, None) == (2, None)
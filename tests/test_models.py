@@ -0,0 +1,62 @@
+"""
+Tests for Pydantic model validators.
+"""
+import pytest
+from pydantic import ValidationError
+
+from app.models.user import UserCreate, UserUpdate, PasswordChange
+
+
+class TestPasswordValidation:
+    """Test suite for password strength rules."""
+
+    def _user(self, password):
+        return UserCreate(
+            email="test@example.com",
+            password=password,
+            first_name="Test",
+            last_name="User",
+        )
+
+    def test_strong_password_accepted(self):
+        """Test password with upper, lower and digit passes."""
+        assert self._user("SecurePass123").password == "SecurePass123"
+
+    @pytest.mark.parametrize("password, message", [
+        ("securepass123", "uppercase"),
+        ("SECUREPASS123", "lowercase"),
+        ("SecurePassword", "digit"),
+    ])
+    def test_weak_password_rejected(self, password, message):
+        """Test each missing character class is reported."""
+        with pytest.raises(ValidationError, match=message):
+            self._user(password)
+
+    def test_password_change_uses_same_rules(self):
+        """Test new_password is validated like registration passwords."""
+        with pytest.raises(ValidationError, match="digit"):
+            PasswordChange(current_password="OldPass123", new_password="NoDigitsHere")
+
+
+class TestPhoneValidation:
+    """Test suite for phone number normalization."""
+
+    def test_phone_normalized(self):
+        """Test spaces and dashes are stripped."""
+        user = UserCreate(
+            email="test@example.com",
+            password="SecurePass123",
+            first_name="Test",
+            last_name="User",
+            phone="+91 98765-43210",
+        )
+        assert user.phone == "+919876543210"
+
+    def test_update_phone_invalid(self):
+        """Test profile updates reject malformed phone numbers."""
+        with pytest.raises(ValidationError, match="Invalid phone number format"):
+            UserUpdate(phone="12345")
+
+    def test_phone_length_checked_after_cleaning(self):
+        """Test separators don't count towards the 15 character limit."""
+        assert UserUpdate(phone="+91 98765 432 10").phone == "+919876543210"
@@ -1,19 +1,23 @@
 """
 Tests for order endpoints.
 """
+import asyncio
+
 import pytest
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, MagicMock
 
 
 class TestOrderEndpoints:
     """Test suite for order endpoints."""
 
     @patch('app.firebase.user_repo.get_by_id')
-    @patch('app.firebase.order_repo.get_user_orders')
-    def test_list_orders_empty(self, mock_orders, mock_user_get, client, auth_headers, mock_user):
+    @patch('app.firebase.order_repo.count_user_orders')
+    @patch('app.firebase.order_repo.get_user_orders_page')
+    def test_list_orders_empty(self, mock_orders, mock_count, mock_user_get, client, auth_headers, mock_user):
         """Test listing orders when user has no orders."""
         mock_user_get.return_value = AsyncMock(return_value=mock_user)()
         mock_orders.return_value = AsyncMock(return_value=[])()
+        mock_count.return_value = AsyncMock(return_value=0)()
 
         response = client.get("/api/orders", headers=auth_headers)
 
@@ -23,11 +27,13 @@ class TestOrderEndpoints:
         assert data["total"] == 0
 
     @patch('app.firebase.user_repo.get_by_id')
-    @patch('app.firebase.order_repo.get_user_orders')
-    def test_list_orders_with_orders(self, mock_orders, mock_user_get, client, auth_headers, mock_user, mock_order):
+    @patch('app.firebase.order_repo.count_user_orders')
+    @patch('app.firebase.order_repo.get_user_orders_page')
+    def test_list_orders_with_orders(self, mock_orders, mock_count, mock_user_get, client, auth_headers, mock_user, mock_order):
         """Test listing orders when user has orders."""
         mock_user_get.return_value = AsyncMock(return_value=mock_user)()
         mock_orders.return_value = AsyncMock(return_value=[mock_order])()
+        mock_count.return_value = AsyncMock(return_value=1)()
 
         response = client.get("/api/orders", headers=auth_headers)
 
@@ -35,6 +41,17 @@ class TestOrderEndpoints:
         data = response.json()
         assert len(data["orders"]) == 1
         assert data["orders"][0]["order_number"] == mock_order["order_number"]
+        assert data["has_more"] is False
+        assert data["next_cursor"] is None
+
+    @patch('app.firebase.user_repo.get_by_id')
+    def test_list_orders_invalid_cursor(self, mock_user_get, client, auth_headers, mock_user):
+        """Test that a malformed cursor is rejected."""
+        mock_user_get.return_value = AsyncMock(return_value=mock_user)()
+
+        response = client.get("/api/orders?cursor=not-a-cursor", headers=auth_headers)
+
+        assert response.status_code == 400
 
     @patch('app.firebase.user_repo.get_by_id')
     @patch('app.firebase.order_repo.get_by_id')
@@ -63,12 +80,12 @@ class TestOrderEndpoints:
     @patch('app.firebase.user_repo.get_by_id')
     @patch('app.firebase.address_repo.get_by_id')
     @patch('app.firebase.cart_repo.get_user_cart')
-    @patch('app.firebase.product_repo.get_by_id')
+    @patch('app.firebase.product_repo.get_many')
     @patch('app.firebase.order_repo.create')
-    @patch('app.firebase.product_repo.update')
+    @patch('app.firebase.product_repo.adjust_stock')
     @patch('app.firebase.cart_repo.clear_cart')
     def test_create_order_cod(
-        self, mock_clear_cart, mock_product_update, mock_order_create,
+        self, mock_clear_cart, mock_stock_adjust, mock_order_create,
         mock_product_get, mock_cart_get, mock_address_get, mock_user_get,
         client, auth_headers, mock_user, mock_address, mock_cart, mock_product
     ):
@@ -76,9 +93,9 @@ class TestOrderEndpoints:
         mock_user_get.return_value = AsyncMock(return_value=mock_user)()
         mock_address_get.return_value = AsyncMock(return_value=mock_address)()
         mock_cart_get.return_value = AsyncMock(return_value=mock_cart)()
-        mock_product_get.return_value = AsyncMock(return_value=mock_product)()
+        mock_product_get.return_value = AsyncMock(return_value={mock_product["id"]: mock_product})()
         mock_order_create.return_value = AsyncMock(return_value="new-order-123")()
-        mock_product_update.return_value = AsyncMock(return_value=True)()
+        mock_stock_adjust.return_value = AsyncMock(return_value={mock_product["id"]: 48})()
         mock_clear_cart.return_value = AsyncMock(return_value=True)()
 
         response = client.post("/api/orders", json={
@@ -96,12 +113,12 @@ class TestOrderEndpoints:
     @patch('app.firebase.user_repo.get_by_id')
     @patch('app.firebase.address_repo.get_by_id')
     @patch('app.firebase.cart_repo.get_user_cart')
-    @patch('app.firebase.product_repo.get_by_id')
+    @patch('app.firebase.product_repo.get_many')
     @patch('app.firebase.order_repo.create')
-    @patch('app.firebase.product_repo.update')
+    @patch('app.firebase.product_repo.adjust_stock')
     @patch('app.firebase.cart_repo.clear_cart')
     def test_create_order_card(
-        self, mock_clear_cart, mock_product_update, mock_order_create,
+        self, mock_clear_cart, mock_stock_adjust, mock_order_create,
         mock_product_get, mock_cart_get, mock_address_get, mock_user_get,
         client, auth_headers, mock_user, mock_address, mock_cart, mock_product
     ):
@@ -109,9 +126,9 @@ class TestOrderEndpoints:
         mock_user_get.return_value = AsyncMock(return_value=mock_user)()
         mock_address_get.return_value = AsyncMock(return_value=mock_address)()
         mock_cart_get.return_value = AsyncMock(return_value=mock_cart)()
-        mock_product_get.return_value = AsyncMock(return_value=mock_product)()
+        mock_product_get.return_value = AsyncMock(return_value={mock_product["id"]: mock_product})()
         mock_order_create.return_value = AsyncMock(return_value="new-order-123")()
-        mock_product_update.return_value = AsyncMock(return_value=True)()
+        mock_stock_adjust.return_value = AsyncMock(return_value={mock_product["id"]: 48})()
         mock_clear_cart.return_value = AsyncMock(return_value=True)()
 
         response = client.post("/api/orders", json={
@@ -145,16 +162,14 @@ class TestOrderEndpoints:
     @patch('app.firebase.user_repo.get_by_id')
     @patch('app.firebase.order_repo.get_by_id')
     @patch('app.firebase.order_repo.update')
-    @patch('app.firebase.product_repo.get_by_id')
-    @patch('app.firebase.product_repo.update')
-    def test_cancel_order(self, mock_product_update, mock_product_get, mock_order_update, mock_order_get, mock_user_get, client, auth_headers, mock_user, mock_order, mock_product):
+    @patch('app.firebase.product_repo.adjust_stock')
+    def test_cancel_order(self, mock_stock_adjust, mock_order_update, mock_order_get, mock_user_get, client, auth_headers, mock_user, mock_order, mock_product):
         """Test canceling an order."""
         pending_order = {**mock_order, "status": "pending"}
         mock_user_get.return_value = AsyncMock(return_value=mock_user)()
         mock_order_get.return_value = AsyncMock(return_value=pending_order)()
         mock_order_update.return_value = AsyncMock(return_value=True)()
-        mock_product_get.return_value = AsyncMock(return_value=mock_product)()
-        mock_product_update.return_value = AsyncMock(return_value=True)()
+        mock_stock_adjust.return_value = AsyncMock(return_value={mock_product["id"]: 52})()
 
         response = client.post(f"/api/orders/{mock_order['id']}/cancel", headers=auth_headers)
 
@@ -186,3 +201,49 @@ class TestOrderEndpoints:
         data = response.json()
         assert "timeline" in data
         assert data["order_number"] == mock_order["order_number"]
+
+
+class TestUserOrderStats:
+    """Test suite for the per-user order counters kept by create_order."""
+
+    @staticmethod
+    def _fake_db(user_doc, order_totals):
+        """Firestore client whose user document and order query are canned."""
+        db = MagicMock()
+        collection = db.collection.return_value
+        snapshot = MagicMock(exists=True)
+        snapshot.to_dict.return_value = user_doc
+        collection.document.return_value.get.return_value = snapshot
+        collection.where.return_value.select.return_value.stream.return_value = [
+            MagicMock(**{"to_dict.return_value": {"total": total}}) for total in order_totals
+        ]
+        return db
+
+    def test_counters_incremented(self, mock_user):
+        """A user with counters gets a server-side increment, no read."""
+        from app import firebase
+
+        db = self._fake_db({}, [])
+        user = {**mock_user, "order_count": 2, "total_spent": 300.0}
+        with patch.object(firebase, "get_db", return_value=db):
+            asyncio.run(firebase.user_repo.increment_order_stats(user, 150.0))
+
+        user_ref = db.collection.return_value.document.return_value
+        user_ref.update.assert_called_once()
+        user_ref.get.assert_not_called()
+
+    def test_legacy_user_counters_seeded_from_orders(self, mock_user):
+        """A user from before the counters exist counts all previous orders."""
+        from app import firebase
+
+        # Two orders from before the counters existed plus the new one
+        db = self._fake_db({"email": mock_user["email"]}, [100.0, 250.5, 150.0])
+        user = {k: v for k, v in mock_user.items() if k not in ("order_count", "total_spent")}
+        with patch.object(firebase, "get_db", return_value=db), \
+                patch.object(firebase.firestore, "transactional", lambda func: func):
+            asyncio.run(firebase.user_repo.increment_order_stats(user, 150.0))
+
+        user_ref = db.collection.return_value.document.return_value
+        db.transaction.return_value.update.assert_called_once_with(
+            user_ref, {"order_count": 3, "total_spent": 500.5}
+        )